@@ -20,164 +20,210 @@ Provides fitter functions.
 Import into BayesicFitting itself all classes that are directly usable.
 I.e. leave out the base classes and helper classes.
 
-TBC: How much time does this take. Everything is translated ??
+The classes are imported lazily: the module of a class is loaded on its first use.
+So `import BayesicFitting` is cheap, and workers that only fit do not load
+matplotlib or astropy.
 
 """
 
-from .source.AmoebaFitter import AmoebaFitter
-from .source.AnnealingAmoeba import AnnealingAmoeba
-from .source.ArctanModel import ArctanModel
-from .source.BSplinesModel import BSplinesModel
-from .source.BaseFitter import BaseFitter
-from .source.BaseModel import BaseModel
-#from .source.BernouilliErrorDistribution import BernouilliErrorDistribution 
-from .source.BirthEngine import BirthEngine
-from .source.BracketModel import BracketModel
-#from .source.CategoricalFitter import CategoricalFitter
-#from .source.CategoricalLikelihood import CategoricalLikelihood
-#from .source.CategoricalProblem import CategoricalProblem
-from .source.CauchyErrorDistribution import CauchyErrorDistribution
-from .source.CauchyPrior import CauchyPrior
-from .source.CircularUniformPrior import CircularUniformPrior
-from .source.ChebyshevPolynomialModel import ChebyshevPolynomialModel
-from .source.ChordEngine import ChordEngine
-from .source.ClassicProblem import ClassicProblem
-from .source.CombiModel import CombiModel
-from .source.ConstantModel import ConstantModel
-from .source.ConvergenceError import ConvergenceError
-from .source.CrossEngine import CrossEngine
-from .source.CurveFitter import CurveFitter
-#from .source.CyclicResults import CyclicResults
-from .source.DeathEngine import DeathEngine
-from .source.DecisionTreeModel import DecisionTreeModel
-from .source.Dynamic import Dynamic
-from .source.Engine import Engine
-from .source.ErrorDistribution import ErrorDistribution
-from .source.ErrorsInXandYProblem import ErrorsInXandYProblem
-from .source.EtalonDriftModel import EtalonDriftModel
-from .source.EtalonModel import EtalonModel
-from .source.ExpModel import ExpModel
-from .source.Explorer import Explorer
-from .source.ExponentialErrorDistribution import ExponentialErrorDistribution
-from .source.ExponentialPrior import ExponentialPrior
-from .source.Fitter import Fitter
-from .source.FixedModel import FixedModel
-#from .source.FreeShape2dModel import FreeShape2dModel
-from .source.FreeShapeModel import FreeShapeModel
-from .source.GalileanEngine import GalileanEngine
-from .source.GaussErrorDistribution import GaussErrorDistribution
-from .source.GaussModel import GaussModel
-from .source.GaussPrior import GaussPrior
-from .source.GibbsEngine import GibbsEngine
-from .source.HarmonicModel import HarmonicModel
-from .source.HarmonicDynamicModel import HarmonicDynamicModel
-from .source.HyperParameter import HyperParameter
-from .source.ImageAssistant import ImageAssistant
-from .source.IterationPlotter import IterationPlotter
-from .source.IterativeFitter import IterativeFitter
-from .source.JeffreysPrior import JeffreysPrior
-from .source.Kepplers2ndLaw import Kepplers2ndLaw
-from .source.Kernel2dModel import Kernel2dModel
-from .source.KernelModel import KernelModel
-from .source.LaplaceErrorDistribution import LaplaceErrorDistribution
-from .source.LaplacePrior import LaplacePrior
-from .source.LevenbergMarquardtFitter import LevenbergMarquardtFitter
-from .source.LinearModel import LinearModel
-from .source.LogFactorial import logFactorial
-from .source.LogisticModel import LogisticModel
-from .source.LorentzModel import LorentzModel
-from .source.MaxLikelihoodFitter import MaxLikelihoodFitter
-from .source.MixedErrorDistribution import MixedErrorDistribution
-from .source.Model import Model
-#from .source.ModelLikelihood import ModelLikelihood
-from .source.Modifiable import Modifiable
-from .source.MonteCarlo import MonteCarlo
-from .source.MultipleOutputProblem import MultipleOutputProblem
-from .source.NestedSampler import NestedSampler
-#from .source.NeuralNetModel import NeuralNetModel
-from .source.NoiseScale import NoiseScale
-from .source.NonLinearModel import NonLinearModel
-#from .source.OrderEngine import OrderEngine
-from .source.OrthonormalBasis import OrthonormalBasis
-from .source.PadeModel import PadeModel
-from .source.PoissonErrorDistribution import PoissonErrorDistribution
-from .source.PolySineAmpModel import PolySineAmpModel
-from .source.PolySurfaceModel import PolySurfaceModel
-from .source.PolynomialDynamicModel import PolynomialDynamicModel
-from .source.PolynomialModel import PolynomialModel
-from .source.PowerLawModel import PowerLawModel
-from .source.PowerModel import PowerModel
-from .source.Prior import Prior
-from .source.Problem import Problem
-from .source.ProductModel import ProductModel
-from .source.PseudoVoigtModel import PseudoVoigtModel
-from .source.QRFitter import QRFitter
-from .source.RadialVelocityModel import RadialVelocityModel
-from .source.RandomEngine import RandomEngine
-from .source.RepeatingModel import RepeatingModel
-from .source.RobustShell import RobustShell
-from .source.Sample import Sample
-from .source.SampleList import SampleList
-from .source.SampleMovie import SampleMovie
-from .source.ScaledErrorDistribution import ScaledErrorDistribution
-## import all fitters inside ScipyFitter
-from .source.ScipyFitter import *
-from .source.SincModel import SincModel
-from .source.SineAmpModel import SineAmpModel
-from .source.SineDriftModel import SineDriftModel
-from .source.SineModel import SineModel
-from .source.SineSplineDriftModel import SineSplineDriftModel
-from .source.SineSplineModel import SineSplineModel
-from .source.SplinesModel import SplinesModel
-from .source.StartEngine import StartEngine
-from .source.StepEngine import StepEngine
-from .source.StellarOrbitModel import StellarOrbitModel
-from .source.StructureEngine import StructureEngine
-from .source.SurfaceSplinesModel import SurfaceSplinesModel
-from .source.UniformErrorDistribution import UniformErrorDistribution
-from .source.UniformPrior import UniformPrior
-from .source.VoigtModel import VoigtModel
-from .source.Walker import Walker
-from .source.WalkerList import WalkerList
+import importlib
+
+##  public name : module in .source where it is defined (None for the module itself)
+_modules = {
+    "AmoebaFitter" : "AmoebaFitter",
+    "AnnealingAmoeba" : "AnnealingAmoeba",
+    "ArctanModel" : "ArctanModel",
+    "BSplinesModel" : "BSplinesModel",
+    "BaseFitter" : "BaseFitter",
+    "BaseModel" : "BaseModel",
+#    "BernouilliErrorDistribution" : "BernouilliErrorDistribution",
+    "BirthEngine" : "BirthEngine",
+    "BracketModel" : "BracketModel",
+#    "CategoricalFitter" : "CategoricalFitter",
+#    "CategoricalLikelihood" : "CategoricalLikelihood",
+#    "CategoricalProblem" : "CategoricalProblem",
+    "CauchyErrorDistribution" : "CauchyErrorDistribution",
+    "CauchyPrior" : "CauchyPrior",
+    "CircularUniformPrior" : "CircularUniformPrior",
+    "ChebyshevPolynomialModel" : "ChebyshevPolynomialModel",
+    "ChordEngine" : "ChordEngine",
+    "ClassicProblem" : "ClassicProblem",
+    "CombiModel" : "CombiModel",
+    "ConstantModel" : "ConstantModel",
+    "ConvergenceError" : "ConvergenceError",
+    "CrossEngine" : "CrossEngine",
+    "CurveFitter" : "CurveFitter",
+#    "CyclicResults" : "CyclicResults",
+    "DeathEngine" : "DeathEngine",
+    "DecisionTreeModel" : "DecisionTreeModel",
+    "Dynamic" : "Dynamic",
+    "Engine" : "Engine",
+    "ErrorDistribution" : "ErrorDistribution",
+    "ErrorsInXandYProblem" : "ErrorsInXandYProblem",
+    "EtalonDriftModel" : "EtalonDriftModel",
+    "EtalonModel" : "EtalonModel",
+    "ExpModel" : "ExpModel",
+    "Explorer" : "Explorer",
+    "ExponentialErrorDistribution" : "ExponentialErrorDistribution",
+    "ExponentialPrior" : "ExponentialPrior",
+    "Fitter" : "Fitter",
+    "FixedModel" : "FixedModel",
+#    "FreeShape2dModel" : "FreeShape2dModel",
+    "FreeShapeModel" : "FreeShapeModel",
+    "GalileanEngine" : "GalileanEngine",
+    "GaussErrorDistribution" : "GaussErrorDistribution",
+    "GaussModel" : "GaussModel",
+    "GaussPrior" : "GaussPrior",
+    "GibbsEngine" : "GibbsEngine",
+    "HarmonicModel" : "HarmonicModel",
+    "HarmonicDynamicModel" : "HarmonicDynamicModel",
+    "HyperParameter" : "HyperParameter",
+    "ImageAssistant" : "ImageAssistant",
+    "IterationPlotter" : "IterationPlotter",
+    "IterativeFitter" : "IterativeFitter",
+    "JeffreysPrior" : "JeffreysPrior",
+    "Kepplers2ndLaw" : "Kepplers2ndLaw",
+    "Kernel2dModel" : "Kernel2dModel",
+    "KernelModel" : "KernelModel",
+    "LaplaceErrorDistribution" : "LaplaceErrorDistribution",
+    "LaplacePrior" : "LaplacePrior",
+    "LevenbergMarquardtFitter" : "LevenbergMarquardtFitter",
+    "LinearModel" : "LinearModel",
+    "logFactorial" : "LogFactorial",
+    "LogisticModel" : "LogisticModel",
+    "LorentzModel" : "LorentzModel",
+    "MaxLikelihoodFitter" : "MaxLikelihoodFitter",
+    "MixedErrorDistribution" : "MixedErrorDistribution",
+    "Model" : "Model",
+#    "ModelLikelihood" : "ModelLikelihood",
+    "Modifiable" : "Modifiable",
+    "MonteCarlo" : "MonteCarlo",
+    "MultipleOutputProblem" : "MultipleOutputProblem",
+    "NestedSampler" : "NestedSampler",
+#    "NeuralNetModel" : "NeuralNetModel",
+    "NoiseScale" : "NoiseScale",
+    "NonLinearModel" : "NonLinearModel",
+#    "OrderEngine" : "OrderEngine",
+    "OrthonormalBasis" : "OrthonormalBasis",
+    "PadeModel" : "PadeModel",
+    "PixelGrid" : "ImageAssistant",
+    "PoissonErrorDistribution" : "PoissonErrorDistribution",
+    "PolySineAmpModel" : "PolySineAmpModel",
+    "PolySurfaceModel" : "PolySurfaceModel",
+    "PolynomialDynamicModel" : "PolynomialDynamicModel",
+    "PolynomialModel" : "PolynomialModel",
+    "PowerLawModel" : "PowerLawModel",
+    "PowerModel" : "PowerModel",
+    "Prior" : "Prior",
+    "Problem" : "Problem",
+    "Profiler" : "Profiler",
+    "ProductModel" : "ProductModel",
+    "PseudoVoigtModel" : "PseudoVoigtModel",
+    "QRFitter" : "QRFitter",
+    "RadialVelocityModel" : "RadialVelocityModel",
+    "RandomEngine" : "RandomEngine",
+    "RepeatingModel" : "RepeatingModel",
+    "RobustShell" : "RobustShell",
+    "Sample" : "Sample",
+    "SampleFile" : "SampleFile",
+    "SampleList" : "SampleList",
+    "SampleMovie" : "SampleMovie",
+    "ScaledErrorDistribution" : "ScaledErrorDistribution",
+    ## all fitters inside ScipyFitter
+    "BfgsFitter" : "ScipyFitter",
+    "CobylaFitter" : "ScipyFitter",
+    "ConjugateGradientFitter" : "ScipyFitter",
+    "DoglegFitter" : "ScipyFitter",
+    "LbfgsbFitter" : "ScipyFitter",
+    "NelderMeadFitter" : "ScipyFitter",
+    "NewtonCgFitter" : "ScipyFitter",
+    "PowellFitter" : "ScipyFitter",
+    "ScipyFitter" : "ScipyFitter",
+    "SlsqpFitter" : "ScipyFitter",
+    "TncFitter" : "ScipyFitter",
+    "TrustNcgFitter" : "ScipyFitter",
+    "SincModel" : "SincModel",
+    "SineAmpModel" : "SineAmpModel",
+    "SineDriftModel" : "SineDriftModel",
+    "SineModel" : "SineModel",
+    "SineSplineDriftModel" : "SineSplineDriftModel",
+    "SineSplineModel" : "SineSplineModel",
+    "SplinesModel" : "SplinesModel",
+    "StartEngine" : "StartEngine",
+    "StepEngine" : "StepEngine",
+    "StellarOrbitModel" : "StellarOrbitModel",
+    "StopStart" : "StopStart",
+    "StructureEngine" : "StructureEngine",
+    "SurfaceSplinesModel" : "SurfaceSplinesModel",
+    "UniformErrorDistribution" : "UniformErrorDistribution",
+    "UniformPrior" : "UniformPrior",
+    "VoigtModel" : "VoigtModel",
+    "Walker" : "Walker",
+    "WalkerList" : "WalkerList",
 
 ## OrderProblems
-#from .source.DistanceCostFunction import DistanceCostFunction
-#from .source.NestedSolver import NestedSolver
-#from .source.LoopEngine import LoopEngine
-#from .source.MoveEngine import MoveEngine
-#from .source.OrderEngine import OrderEngine
-#from .source.OrderProblem import OrderProblem
-#from .source.ReverseEngine import ReverseEngine
-#from .source.SalesmanProblem import SalesmanProblem
-#from .source.ShuffleEngine import ShuffleEngine
-#from .source.StartNearEngine import StartNearEngine
-#from .source.StartOrderEngine import StartOrderEngine
-#from .source.SwitchEngine import SwitchEngine
+#    "DistanceCostFunction" : "DistanceCostFunction",
+#    "NestedSolver" : "NestedSolver",
+#    "LoopEngine" : "LoopEngine",
+#    "MoveEngine" : "MoveEngine",
+#    "OrderEngine" : "OrderEngine",
+#    "OrderProblem" : "OrderProblem",
+#    "ReverseEngine" : "ReverseEngine",
+#    "SalesmanProblem" : "SalesmanProblem",
+#    "ShuffleEngine" : "ShuffleEngine",
+#    "StartNearEngine" : "StartNearEngine",
+#    "StartOrderEngine" : "StartOrderEngine",
+#    "SwitchEngine" : "SwitchEngine",
+
+    "formatter" : "Formatter",
+    "fma" : "Formatter",
+    "formatter_init" : "Formatter",
+    "plotFit" : "Plotter",
+    "printclass" : "Tools",
+    "Tools" : None,
+#    "bspline" : None,
+#    "splinelab" : None,
+
+#    "bspline" : "bsplines.bspline",
+#    "splinelab" : "bsplines.splinelab",
+
+    "Biweight" : "kernels.Biweight",
+    "CosSquare" : "kernels.CosSquare",
+    "Cosine" : "kernels.Cosine",
+    "Gauss" : "kernels.Gauss",
+    "Huber" : "kernels.Huber",
+    "Kernel" : "kernels.Kernel",
+    "Lorentz" : "kernels.Lorentz",
+    "Parabola" : "kernels.Parabola",
+    "Sinc" : "kernels.Sinc",
+    "Triangle" : "kernels.Triangle",
+    "Tophat" : "kernels.Tophat",
+    "Tricube" : "kernels.Tricube",
+    "Triweight" : "kernels.Triweight",
+    "Uniform" : "kernels.Uniform",
+}
+
+__all__ = list( _modules )
 
-from .source.Formatter import formatter
-from .source.Formatter import fma
-from .source.Formatter import formatter_init
-from .source.Plotter import plotFit
-from .source.Tools import printclass
-from .source import Tools
-#from .source import bspline
-#from .source import splinelab
+def __getattr__( name ) :
+    """
+    Import the named class (or function or module) on first use.
 
-#from .source.bsplines.bspline import bspline
-#from .source.bsplines.splinelab import splinelab
+    Parameters
+    ----------
+    name : str
+        name of the class
+    """
+    if name not in _modules :
+        raise AttributeError( "module %s has no attribute %s" % ( __name__, name ) )
 
-from .source.kernels.Biweight import Biweight
-from .source.kernels.CosSquare import CosSquare
-from .source.kernels.Cosine import Cosine
-from .source.kernels.Gauss import Gauss
-from .source.kernels.Huber import Huber
-from .source.kernels.Kernel import Kernel
-from .source.kernels.Lorentz import Lorentz
-from .source.kernels.Parabola import Parabola
-from .source.kernels.Sinc import Sinc
-from .source.kernels.Triangle import Triangle
-from .source.kernels.Tophat import Tophat
-from .source.kernels.Tricube import Tricube
-from .source.kernels.Triweight import Triweight
-from .source.kernels.Uniform import Uniform
+    module = _modules[name]
+    if module is None :
+        value = importlib.import_module( ".source." + name, __name__ )
+    else :
+        value = getattr( importlib.import_module( ".source." + module, __name__ ), name )
+    globals()[name] = value
+    return value
 
+def __dir__( ) :
+    return sorted( set( globals() ) | set( __all__ ) )
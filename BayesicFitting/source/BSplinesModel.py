@@ -44,6 +44,10 @@ class BSplinesModel( LinearModel ):
 
     It is a linear model.
 
+    At any x only order+1 b-splines are nonzero, so the partials form a banded
+    matrix. See `bandedPartial()`. The :ref:`Fitter` uses it to fit large
+    datasets in linear time.
+
     order   behaviour between knots     continuity at knots
       0     piecewise constant          not continuous at all
       1     piecewise linear            lines are continuous
@@ -218,15 +222,81 @@ class BSplinesModel( LinearModel ):
         ValueError when xdata < knots[0] or xdata > knots[1]
 
         """
-        if numpy.any( xdata < self.knots[0] ) or numpy.any( xdata > self.knots[-1] ) :
-            print( "Min max data : ", numpy.min( xdata ), numpy.max( xdata ),
-                   "  knots : ", self.knots[0], self.knots[-1] )
-            raise ValueError( "Input data need to fall strictly in the domain spanned by knots" )
+        self.checkDomain( xdata )
 
         partial = Tools.toArray( self._bspline.collmat( xdata ), ndim=2 )
 
         return partial
 
+    def baseResult( self, xdata, params ):
+        """
+        Returns the result of the model function.
+
+        Only the order+1 nonzero partials at each xdata are used.
+        See `bandedPartial()`.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values at which to calculate the result
+        params : array_like
+            values for the parameters.
+
+        """
+        first, band = self.bandedPartial( xdata )
+        cols = first[:,numpy.newaxis] + numpy.arange( self.order + 1 )
+
+        return numpy.sum( band * numpy.asarray( params )[cols], axis=1 )
+
+    def bandedPartial( self, xdata ):
+        """
+        Returns the partials at the input value, in banded form.
+
+        At each xdata only order+1 consecutive b-splines are nonzero.
+        The dense partial can be constructed as:
+            partial[k,first[k]+i] = band[k,i]   for i in range( order + 1 )
+
+        Parameters
+        ----------
+        xdata : array_like
+            value at which to calculate the partials
+
+        Returns
+        -------
+        first : ndarray of int of shape ( len( xdata ), )
+            index of the first nonzero partial at each xdata
+        band : ndarray of shape ( len( xdata ), order + 1 )
+            values of the nonzero partials
+
+        Raises
+        ------
+        ValueError when xdata < knots[0] or xdata > knots[1]
+
+        """
+        xdata = numpy.asarray( xdata, dtype=float ).ravel()
+        self.checkDomain( xdata )
+
+        return self._bspline.collband( xdata )
+
+    def checkDomain( self, xdata ):
+        """
+        Check that the xdata fall inside the domain spanned by the knots.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values to be checked
+
+        Raises
+        ------
+        ValueError when xdata < knots[0] or xdata > knots[1]
+
+        """
+        if numpy.any( xdata < self.knots[0] ) or numpy.any( xdata > self.knots[-1] ) :
+            print( "Min max data : ", numpy.min( xdata ), numpy.max( xdata ),
+                   "  knots : ", self.knots[0], self.knots[-1] )
+            raise ValueError( "Input data need to fall strictly in the domain spanned by knots" )
+
 
     def baseDerivative( self, xdata, params ) :
         """
@@ -242,9 +312,10 @@ class BSplinesModel( LinearModel ):
         """
         xd = numpy.where( xdata == self.knots[-1], ( 1.0 - self.eps ) * self.knots[-1], xdata )
 
-        partial = Tools.toArray( self._bspline.collmat( xd, deriv_order=1 ), ndim=2 )
+        first, band = self._bspline.collband( numpy.ravel( xd ), deriv_order=1 )
+        cols = first[:,numpy.newaxis] + numpy.arange( self.order + 1 )
 
-        return numpy.inner( params, partial )
+        return numpy.sum( band * numpy.asarray( params )[cols], axis=1 )
 
     def baseName( self ):
         """ Returns a string representation of the model. """
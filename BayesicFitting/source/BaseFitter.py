@@ -1,10 +1,10 @@
 import numpy as numpy
 import math
 import warnings
-import matplotlib.pyplot as plt
-from astropy.table import Table
 
 from .ImageAssistant import ImageAssistant
+from .Model import Model
+from .LinearModel import LinearModel
 from .MonteCarlo import MonteCarlo
 from .ConvergenceError import ConvergenceError
 from . import Tools
@@ -97,6 +97,12 @@ class BaseFitter( object ):
     hessian : matrix (read only)
         the hessian matrix
         returns self.getHessian()
+    designKey : tuple (read only)
+        signature of the model chain for which the cached design matrix is valid.
+        See `designSignature()`.
+    bandedKey : tuple (read only)
+        signature of the model for which the cached banded design is valid.
+        See `getBandedDesign()`.
 
     Attributes (available after a call to fit())
     ----------
@@ -146,7 +152,7 @@ class BaseFitter( object ):
 
         Parameters
         ----------
-        xdata : array_like
+        xdata : array_like or PixelGrid
             independent input variable(s)
         model : Model
             the model function to be fitted
@@ -177,12 +183,17 @@ class BaseFitter( object ):
         if map :
             self.imageAssistant = ImageAssistant()
             self.xdata = self.imageAssistant.getIndices( xdata )
+        elif Tools.isGrid( xdata ) :
+            self.imageAssistant = None
+            self.xdata = xdata
         else :
             self.imageAssistant = None
             self.xdata = numpy.array( xdata )
 
-        if isinstance( xdata, Table ) :
+        if Tools.isTable( xdata ) :
             ndim = len( xdata.columns )
+        elif Tools.isGrid( xdata ) :
+            ndim = xdata.shape[1]
         else :
             if numpy.any( numpy.isnan( xdata ) ) :
                 raise ValueError( "NaNs in xdata array" )
@@ -196,6 +207,7 @@ class BaseFitter( object ):
         self.keep = keep
         self.fitIndex = self.keepFixed( keep )
         self.fixedScale = fixedScale
+        self.clearDesignCache()
 
         if self.ndim != model.ndim:
             raise ValueError( "Model (%d) and xdata (%d) must be of the same dimensionality."
@@ -254,6 +266,124 @@ class BaseFitter( object ):
         self.npfit = len( self.fitIndex )
         return ( self.fitIndex, ydata, weights )
 
+    def fitManyProlog( self, ydata, weights=None, keep=None ) :
+        """
+        Prolog for fitting many datasets at once. See `Fitter.fitMany()`.
+
+        1. Checks data/weighs for shape and Nans
+        2. Makes fitIndex and the parameters with the kept values inserted.
+        3. Subtracts the influence of fixed parameters from the data.
+
+        Neither the model nor the fitter is changed.
+
+        Parameters
+        ----------
+        ydata : array_like
+            the data matrix to be fitted; one dataset per column.
+        weights : array_like
+            weights pertaining to the data. Either shared by all datasets, or
+            one set per column.
+        keep : dict of {int:float}
+            dictionary of indices (int) to be kept at a fixed value (float)
+
+        Returns
+        -------
+        fitIndex : ndarray of int
+            Indices of the parameters that need fitting
+        params : ndarray of shape (npchain,)
+            the model parameters with the kept values inserted
+        ydata : ndarray of shape (nxdata, nsets)
+            the data
+        weights : None or ndarray of shape (nxdata,) or (nxdata, nsets)
+            the weights
+        ycorr : ndarray of shape (nxdata, nsets)
+            the data corrected for fixed parameters
+
+        Raises
+        ------
+        ValueError when ydata or weights have the wrong shape or contain a NaN
+
+        """
+        ydata = numpy.asarray( ydata, dtype=float )
+        if weights is not None :
+            weights = numpy.asarray( weights, dtype=float )
+
+        if self.imageAssistant is not None :
+            # the last axis counts the maps
+            ia = self.imageAssistant
+            if weights is not None :
+                weights = ( ia.getydata( weights ) if weights.shape != ydata.shape else
+                        numpy.stack( [ia.getydata( weights[...,k] )
+                                      for k in range( weights.shape[-1] )], axis=1 ) )
+            ydata = numpy.stack( [ia.getydata( ydata[...,k] )
+                                  for k in range( ydata.shape[-1] )], axis=1 )
+
+        if ydata.ndim != 2 or ydata.shape[0] != self.nxdata :
+            raise ValueError( "Fitter: ydata should be a matrix of shape ( %d, nsets )" %
+                                self.nxdata )
+        if weights is not None and not weights.shape in [ydata.shape, ydata.shape[:1]] :
+            raise ValueError( "Fitter: weights should be of shape ( %d, ) or ( %d, %d )" %
+                                ( self.nxdata, self.nxdata, ydata.shape[1] ) )
+
+        self.checkNan( ydata, weights=weights )
+
+        params = numpy.copy( self.model.parameters )
+        if keep is not None :
+            fitIndex = numpy.setxor1d( numpy.arange( self.model.npchain ), list( keep.keys() ) )
+            params[list( keep.keys() )] = list( keep.values() )
+        elif self.fitIndex is None :
+            fitIndex = numpy.arange( self.model.npchain, dtype=int )
+        else :
+            fitIndex = self.fitIndex
+
+        ycorr = ydata
+        if len( fitIndex ) < self.model.npchain :
+            fxpar = numpy.copy( params )
+            fxpar[fitIndex] = 0.0
+            ycorr = ydata - self.model.result( self.xdata, fxpar )[:,numpy.newaxis]
+
+        return ( fitIndex, params, ydata, weights, ycorr )
+
+    def fitManyPostscript( self, ydata, params, fitpar, weights, fitIndex, invdiag ) :
+        """
+        Return parameters, chisq and standard deviations of many datasets.
+
+        Parameters
+        ----------
+        ydata : ndarray of shape (nxdata, nsets)
+            the data
+        params : ndarray of shape (npchain,)
+            the model parameters with the kept values inserted
+        fitpar : ndarray of shape (npfit, nsets)
+            the fitted parameters
+        weights : None or ndarray of shape (nxdata,) or (nxdata, nsets)
+            the weights
+        fitIndex : ndarray of int
+            Indices of the parameters that are fitted
+        invdiag : ndarray of shape (npfit,) or (npfit, nsets)
+            diagonal of the inverse hessian(s)
+
+        """
+        nsets = ydata.shape[1]
+        params = numpy.repeat( params[:,numpy.newaxis], nsets, axis=1 )
+        params[fitIndex,:] = fitpar
+
+        res2 = numpy.square( ydata - self.model.resultBatch( self.xdata, params.T ).T )
+        if weights is not None :
+            res2 *= weights if weights.ndim == 2 else weights[:,numpy.newaxis]
+        chisq = numpy.sum( res2, axis=0 )
+
+        var = chisq / ( self.nxdata - len( fitIndex ) )
+        if hasattr( self, "minimumScale" ) :
+            var += self.minimumScale * self.minimumScale
+        if invdiag.ndim == 1 :
+            invdiag = invdiag[:,numpy.newaxis]
+
+        stdevs = numpy.zeros_like( params )
+        stdevs[fitIndex,:] = numpy.sqrt( invdiag * var )
+
+        return ( params, chisq, stdevs )
+
     def fitpostscript( self, ydata, plot=False ) :
         """
         Produce a plot of the results.
@@ -287,9 +417,9 @@ class BaseFitter( object ):
             return None
         else :
 #            print( "Keep  ", keep )
-            self.npfit = len( keep )
             fitIndex = numpy.arange( self.model.npchain )      # start from scratch
             fitIndex = numpy.setxor1d( fitIndex, list( keep.keys() ) )
+            self.npfit = len( fitIndex )
             self.model.parameters[list(keep.keys())] = list( keep.values() )
             return fitIndex
 
@@ -495,8 +625,29 @@ class BaseFitter( object ):
 
         return numpy.inner( design.transpose(), ydata )
 
+    def getBandedVector( self, ydata ):
+        """
+        Return the &beta;-vector of a model with a banded design.
+
+        See `getBandedDesign()`.
+
+        Parameters
+        ----------
+        ydata : array_like
+            the data vector to be fitted. When such is appliccable, it should be
+            multiplied by weights.
+
+        """
+        first, band = self.getBandedDesign()
+        npar = self.model.npchain
+        vector = numpy.zeros( npar, dtype=float )
+        for i in range( band.shape[1] ) :
+            vector += numpy.bincount( first + i, weights=band[:,i] * ydata, minlength=npar )
+
+        return vector
+
     #  *****HESSIAN**************************************************************
-    def getHessian( self, params=None, weights=None, index=None ):
+    def getHessian( self, params=None, weights=None, index=None, design=None ):
         """
         Calculates the hessian matrix for a given set of model parameters.
 
@@ -510,6 +661,8 @@ class BaseFitter( object ):
             weights to be used
         index : list of int
             index of parameters to be fixed
+        design : None or array_like
+            design matrix at params, as from `getDesign()`, when already available
 
         """
         if params is None : params = self.model.parameters
@@ -518,7 +671,18 @@ class BaseFitter( object ):
         if self.model.isNullModel() :
             return
 
-        design = self.getDesign( xdata=self.xdata, params=params, index=index )
+        if self.getBandedDesign( index=index ) is not None :
+            return self.getBandedHessian( weights=weights, dense=True )
+
+        if design is None :
+            design = self.getDesign( xdata=self.xdata, params=params, index=index )
+
+        # for linear models without weights the hessian is cached too.
+        cachable = weights is None and self.designKey is not None
+        key = ( None if index is None else
+                ( numpy.ndim( index ), numpy.asarray( index, dtype=int ).tobytes() ) )
+        if cachable and key in self.hessianCache :
+            return self.hessianCache[key].copy()
 
         if hasattr( self, "normweight" ) :
             if weights is None :
@@ -532,6 +696,55 @@ class BaseFitter( object ):
         else :
             hessian = numpy.inner( design, design )
 
+        if cachable :
+            self.hessianCache[key] = hessian.copy()
+
+        return hessian
+
+    def getBandedHessian( self, weights=None, dense=False ):
+        """
+        Return the hessian matrix of a model with a banded design.
+
+        The hessian is assembled from the banded design, in a time linear in the
+        number of data and of parameters. See `getBandedDesign()`.
+        In banded form the lower diagonals are stored as rows:
+            banded[d,k] = hessian[k+d,k]
+        as needed for scipy.linalg.solveh_banded.
+
+        Parameters
+        ----------
+        weights : array_like
+            weights to be used
+        dense : bool (False)
+            return the hessian as a full (symmetric) matrix
+
+        """
+        first, band = self.getBandedDesign()
+        width = band.shape[1]
+        npar = self.model.npchain
+
+        key = ( "banded", dense )
+        if weights is None and key in self.hessianCache :
+            return self.hessianCache[key].copy()
+
+        wband = band if weights is None else band * weights[:,numpy.newaxis]
+        hessian = numpy.zeros( ( width, npar ), dtype=float )
+        for d in range( width ) :
+            for i in range( width - d ) :
+                hessian[d] += numpy.bincount( first + i, weights=wband[:,i] * band[:,i+d],
+                                              minlength=npar )
+
+        if dense :
+            banded = hessian
+            hessian = numpy.zeros( ( npar, npar ), dtype=float )
+            for d in range( width ) :
+                k = numpy.arange( npar - d )
+                hessian[k+d,k] = banded[d,:npar-d]
+                hessian[k,k+d] = banded[d,:npar-d]
+
+        if weights is None :
+            self.hessianCache[key] = hessian.copy()
+
         return hessian
 
 #      * TBD Condition number see Wikipedia: Condition Number and Matrix Norm
@@ -620,6 +833,8 @@ class BaseFitter( object ):
             self.normdata = numpy.append( self.normdata, normdata )
             self.normweight = numpy.append( self.normweight, weight )
 
+        self.clearDesignCache()
+
 
     #  *****DESIGN**************************************************************
     def getDesign( self, params=None, xdata=None, index=None ):
@@ -640,7 +855,10 @@ class BaseFitter( object ):
         if params is None : params = self.model.parameters
         if xdata is None :  xdata = self.xdata
 
-        design = self.model.partial( xdata, params )
+        if xdata is self.xdata :
+            design = self.getCachedDesign( params )
+        else :
+            design = self.model.partial( xdata, params )
         if hasattr( self, "normdfdp" ) :
             design = numpy.append( design, self.normdfdp, axis=0 )
 
@@ -649,8 +867,115 @@ class BaseFitter( object ):
 
         return design
 
+    def getBandedDesign( self, index=None ):
+        """
+        Return the design matrix in banded form, or None when not available.
+
+        A banded design is available when the model is a single model with a
+        method `bandedPartial()`, like the BSplinesModel, when all its parameters
+        are fitted and when there are no normalizing data. See `normalize()`.
+
+        Row k of the design is nonzero only in columns first[k] + i, for i in
+        range( width ), where it has values band[k,i].
+        Like the design matrix, it is kept as long as the model does not change.
+
+        Parameters
+        ----------
+        index : list of int
+            index of parameters to be fitted
+
+        Returns
+        -------
+        first : ndarray of int of shape ( nxdata, )
+            first nonzero column of each row
+        band : ndarray of shape ( nxdata, width )
+            nonzero values of each row
+
+        """
+        mdl = self.model
+        if ( mdl._next is not None or getattr( mdl, "bandedPartial", None ) is None or
+                hasattr( self, "normdfdp" ) or
+                ( index is not None and len( index ) < mdl.npchain ) ) :
+            return None
+
+        signature = self.designSignature()
+        if signature is None :
+            return None
+
+        if signature != self.bandedKey :
+            self.clearDesignCache()
+            self.bandedCache = mdl.bandedPartial( self.xdata )
+            self.bandedKey = signature
+
+        return self.bandedCache
+
+    #  *****DESIGN CACHE********************************************************
+    def designSignature( self ) :
+        """
+        Return a signature of the model chain, as far as it defines the design matrix.
+
+        For linear models the design matrix does not depend on the parameters.
+        It only depends on the xdata, which are fixed for a fitter, and on the
+        structure of the model: the models in the chain, fixed parameters and
+        the numeric settings of each model, like knots, order, degree, exponent
+        or period (see `LinearModel.settingsSignature()`). When any of these
+        change, so does the signature.
+
+        Returns None when the design matrix depends on the parameters, i.e. when
+        the model is not a sum of linear models, or when it is dynamic.
+
+        """
+        if self.model.isDynamic() :
+            return None
+
+        signature = []
+        mdl = self.model
+        while mdl is not None :
+            if not isinstance( mdl, LinearModel ) or mdl._operation > Model.SUB :
+                return None
+            signature += [( id( mdl ), ) + mdl.settingsSignature()]
+            mdl = mdl._next
+
+        return tuple( signature )
+
+    def getCachedDesign( self, params ) :
+        """
+        Return the design matrix at the xdata of the fitter.
+
+        For linear models the design matrix is calculated once and kept as long
+        as the signature of the model does not change. See `designSignature()`.
+
+        Parameters
+        ----------
+        params : array_like
+            parameters of the model
+
+        """
+        signature = self.designSignature()
+        if signature is None :
+            self.clearDesignCache()
+            return self.model.partial( self.xdata, params )
+
+        if signature != self.designKey :
+            self.clearDesignCache()
+            self.designCache = self.model.partial( self.xdata, params )
+            self.designCache.flags.writeable = False
+            self.designKey = signature
+
+        return self.designCache
+
+    def clearDesignCache( self ) :
+        """
+        Remove the cached design matrices and hessians.
+        """
+        self.designKey = None
+        self.designCache = None
+        self.bandedKey = None
+        self.bandedCache = None
+        self.hessianCache = {}
+
     #  *****CHI-SQUARED*********************************************************
-    def chiSquared( self, ydata, params=None, weights=None ):
+    def chiSquared( self, ydata, params=None, weights=None, mockdata=None ):
         """
         Calculates Chi-Squared for data and weights.
 
@@ -664,13 +989,17 @@ class BaseFitter( object ):
             parameters for the model
         weights : array_like
             weights to be used
+        mockdata : array_like
+            model result at params, if already available
 
         Raises
         ------
         ValueError when chisq <= 0.
 
         """
-        res2 = numpy.square( ydata - self.model.result( self.xdata, params ) )
+        if mockdata is None :
+            mockdata = self.model.result( self.xdata, params )
+        res2 = numpy.square( ydata - mockdata )
         if weights is not None:
             res2 *= weights
             self.sumwgt = numpy.sum( weights )
@@ -912,6 +1241,7 @@ class BaseFitter( object ):
 
     def plotResultXXX( self, xdata, ydata, model ) :
 
+        import matplotlib.pyplot as plt
         plt.figure( "Fitter Result" )
         plt.plot( xdata, ydata, 'k,' )
 
@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import re
 import warnings
 from . import Tools
@@ -138,6 +137,8 @@ class BaseModel( object ):
         """
         if name == "priors" :
             setatt( self, name, value, type=Prior, isnone=True, islist=True )
+            if self._head is not None :                 ## forget the prior groups
+                setatt( self._head, "_priorGroups", None )
             return
         if name == "parNames" :
             setatt( self, name, value, type=str, islist=True )
@@ -189,6 +190,47 @@ class BaseModel( object ):
         self.checkParameter( param )
         return self.baseResult( xdata, param )
 
+    def resultBatch( self, xdata, paramMatrix ):
+        """
+        Returns the results for K parameter sets, as a (K,N) array.
+
+        None is returned when the model does not implement baseResultBatch.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values at which to calculate the result
+        paramMatrix : array_like of shape (K,npbase)
+            K sets of values for the parameters. Corrected in place.
+
+        """
+        for k in self.posIndex :
+            paramMatrix[:,k] = numpy.abs( paramMatrix[:,k] )
+        for k in self.nonZero :
+            zero = paramMatrix[:,k] == 0
+            if numpy.any( zero ) :
+                self.checkZeroParameter( paramMatrix[numpy.argmax( zero )] )
+                paramMatrix[zero,k] = self.tiny
+
+        return self.baseResultBatch( xdata, paramMatrix )
+
+    def baseResultBatch( self, xdata, paramMatrix ):
+        """
+        Returns the result of the model function for K parameter sets.
+
+        In this (base)class it returns None, meaning it is not implemented.
+        Models that can broadcast over a leading parameter axis override it.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values at which to calculate the result
+        paramMatrix : array_like of shape (K,npbase)
+            K sets of values for the parameters.
+
+        """
+        return None
+
     #  *****PARTIAL*************************************************************
     def partial( self, xdata, param, parlist=None ):
         """
@@ -411,6 +453,7 @@ class BaseModel( object ):
         k : int
             parameter number.
         """
+        from astropy import units
         return units.Unit( 1.0 )
 
     def hasLimits( self, fitindex=None ) :
@@ -90,11 +90,9 @@ class BirthEngine( Engine ):
         """
         self.reportCall()
 
-        cwalker = walker.copy()                  ## work on local copy.
-
-        problem = cwalker.problem
-        allp = cwalker.allpars
-        ftry = cwalker.fitIndex
+        problem = walker.problem.copy()          ## grow the model in a copy
+        allp = walker.allpars
+        ftry = walker.fitIndex
 
         if self.verbose > 4 :
             print( "BEN0  ", walker.id, walker.parent, len( allp ), len( ftry ) )
@@ -111,7 +109,7 @@ class BirthEngine( Engine ):
         np = model.npbase
 
         if self.verbose > 4 :
-            print( "BEN1  ", cwalker.id, nc, np, len( allp ), len( ftry ) )
+            print( "BEN1  ", walker.id, nc, np, len( allp ), len( ftry ) )
 
         if not ( nc < model.growPrior.unit2Domain( self.rng.rand() ) and
                  model.grow( offset=off, rng=self.rng ) ):
@@ -134,11 +132,11 @@ class BirthEngine( Engine ):
 
         while t < self.maxtrials :
 
-            Ltry = self.errdis.logLikelihood( problem, ptry )
+            Ltry = self.logLikelihood( problem, ptry )
 
             if Ltry >= lowLhood:
                 self.reportSuccess()
-                self.setWalker( cwalker, problem, ptry, Ltry, fitIndex=ftry )
+                self.setWalker( walker, problem, ptry, Ltry, fitIndex=ftry )
                 wlkr = self.walkers[walker.id]
                 wlkr.check( nhyp=self.errdis.nphypar )
                 return dnp
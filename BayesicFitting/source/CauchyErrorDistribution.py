@@ -172,6 +172,27 @@ class CauchyErrorDistribution( ScaledErrorDistribution ):
         res2 = res * res
         return math.log( scale ) - self.LOGPI - numpy.log( res2 + s2 )
 
+    def logLdataBatch( self, problem, allparsMatrix, mockdata ) :
+        """
+        Return the log( likelihood ) for each residual, for K sets of parameters.
+
+        Parameters
+        ----------
+        problem : Problem
+            to be solved
+        allparsMatrix : array_like of shape (K,npars+nphypar)
+            K sets of parameters of the problem
+        mockdata : array_like of shape (K,N)
+            as calculated by the model for each parameter set
+
+        """
+        res = problem.residuals( None, mockdata=mockdata )
+
+        scale = allparsMatrix[:,-1:]
+        s2 = scale * scale
+        res2 = res * res
+        return numpy.log( scale ) - self.LOGPI - numpy.log( res2 + s2 )
+
     def partialLogL_alt( self, problem, allpars, fitIndex ) :
         """
         Return the partial derivative of log( likelihood ) to the parameters
@@ -58,6 +58,7 @@ class CauchyPrior( Prior ):
         high limit ( inactive for now)
 
     """
+    VECTORIZED = True               # unit2Domain and domain2Unit accept arrays
 
     #  *********CONSTRUCTOR***************************************************
     def __init__( self, center=0.0, scale=1, prior=None ):
@@ -124,7 +124,6 @@ class ChordEngine( Engine ):
         """
         self.reportCall()
 
-        walker = walker.copy()
         problem = walker.problem
         fitIndex = walker.fitIndex
         np = len( fitIndex )
@@ -144,7 +143,7 @@ class ChordEngine( Engine ):
         umax = numpy.minimum( umin + uran, 1 )
 
 
-        param = walker.allpars
+        param, ptry = self.getScratch( walker.allpars )
         usav = self.domain2Unit( problem, param[fitIndex], kpar=fitIndex )
 
         nstep = int( self.nstep * ( 1 + self.rng.rand() ) )
@@ -164,7 +163,6 @@ class ChordEngine( Engine ):
 
 
         reset = True
-        ptry = param.copy()
         step = 0
         for ks in range( nstep ) :
 
@@ -203,7 +201,7 @@ class ChordEngine( Engine ):
 
                 ptry[fitIndex] = self.unit2Domain( problem, utry, kpar=fitIndex  )
 
-                Ltry = self.errdis.logLikelihood( problem, ptry )
+                Ltry = self.logLikelihood( problem, ptry )
 
                 if self.verbose > 4 :
                     print( kk, fmt(t0), fmt(t1), fmt(dt), fmt(t1-t0), fmt(Ltry) )
@@ -219,7 +217,7 @@ class ChordEngine( Engine ):
                     self.checkBest( problem, ptry, Ltry, fitIndex )
 
                     ## keep the trial parameters
-                    param = ptry.copy()
+                    param[:] = ptry
                     usav = self.domain2Unit( problem, param[fitIndex], kpar=fitIndex )
 
                     ## find a new random direction, orthonormal to the previous ones
@@ -269,7 +267,7 @@ class ChordEngine( Engine ):
             utry = usav + vel * t
             ptry[fitIndex] = self.unit2Domain( problem, utry, kpar=fitIndex  )
 #            print( t, tmax, utry, ptry )
-            Ltry = self.errdis.logLikelihood( problem, ptry )
+            Ltry = self.logLikelihood( problem, ptry )
             if Ltry <= lowLhood :
                 return t
             else :
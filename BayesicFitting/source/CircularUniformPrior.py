@@ -52,6 +52,7 @@ class CircularUniformPrior( UniformPrior ):
         valid range ( highLimit - lowLimit )
 
     """
+    VECTORIZED = True               # unit2Domain and domain2Unit accept arrays
 
     #  *********CONSTRUCTORS***************************************************
     def __init__( self, limits=None, prior=None ):
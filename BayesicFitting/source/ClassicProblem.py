@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import re
 import warnings
 from . import Tools
@@ -89,6 +88,36 @@ class ClassicProblem( Problem ):
         """
         return self.model.result( self.xdata, param )
 
+    def resultBatch( self, paramMatrix ):
+        """
+        Returns the results for K parameter sets, as a (K,N) array.
+
+        Parameters
+        ----------
+        paramMatrix : array_like of shape (K,npars)
+            K sets of values for the parameters.
+
+        """
+        return self.model.resultBatch( self.xdata, paramMatrix )
+
+    def updateResult( self, result, param, parval ):
+        """
+        Returns the result, updated from a previous result, after a change in
+        a few parameters. See `Model.updateResult()`.
+
+        Parameters
+        ----------
+        result : array_like
+            result for the old parameters.
+        param : array_like
+            (new) values for the parameters.
+        parval : dict of {int : float}
+            int index of a changed parameter
+            float (old) value of the parameter
+
+        """
+        return self.model.updateResult( self.xdata, result, param, parval )
+
 
     def partial( self, param ) :
         return self.model.partial( self.xdata, param )
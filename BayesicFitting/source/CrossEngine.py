@@ -126,7 +126,7 @@ class CrossEngine( Engine ):
             f = self.rng.rand( nf )
             param[fitIndex] = f * param[fitIndex] + ( 1 - f ) * crospar[fitIndex]
 
-            Ltry = self.errdis.logLikelihood( problem, param )
+            Ltry = self.logLikelihood( problem, param )
             if Ltry >= lowLhood:
                 self.reportSuccess( )
                 self.setSample( walker, problem, param, Ltry )
@@ -93,12 +93,11 @@ class DeathEngine( Engine ):
         """
         self.reportCall()
 
-        cwalker = walker.copy()          ## work on local copy
-        problem = cwalker.problem
+        problem = walker.problem.copy()  ## shrink the model in a copy
         model = problem.model
-        allp = cwalker.allpars
+        allp = walker.allpars.copy()     ## shuffle may reorder in place
         ptry = allp
-        ftry = cwalker.fitIndex
+        ftry = walker.fitIndex
 
 #        print( "DEAT0  ", fmt( ptry ), fmt( walker.problem.model.parameters ), fmt( ftry ) )
 
@@ -111,7 +110,7 @@ class DeathEngine( Engine ):
         np = model.npbase
 
         if self.verbose > 4 :
-            print( "DEN1  ", cwalker.id, nc, np, len( ptry ), len( ftry ) )
+            print( "DEN1  ", walker.id, nc, np, len( ptry ), len( ftry ) )
 
         # shuffle the parameters (if needed) before throwing the last one out.
         ptry = model.shuffle( ptry, off, np, self.rng )
@@ -128,11 +127,11 @@ class DeathEngine( Engine ):
         if self.errdis.nphypar > 0 :
             ptry = numpy.append( ptry, allp[-self.errdis.nphypar:] )
 
-        Ltry = self.errdis.logLikelihood( problem, ptry )
+        Ltry = self.logLikelihood( problem, ptry )
 
         if Ltry >= lowLhood:
             self.reportSuccess()
-            self.setWalker( cwalker, problem, ptry, Ltry, fitIndex=ftry )
+            self.setWalker( walker, problem, ptry, Ltry, fitIndex=ftry )
             wlkr = self.walkers[walker.id]
             wlkr.check( nhyp=self.errdis.nphypar )
             return abs( dnp )
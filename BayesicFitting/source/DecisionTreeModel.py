@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 
 from . import Tools
@@ -61,6 +60,11 @@ class DecisionTreeModel( Modifiable, Dynamic, LinearModel ):
 
     The parameters are all initialized at 0.0
 
+    The partitioning of the xdata over the leafs depends on the tree structure
+    and on the xdata only. It is kept as a leaf index for the last xdata,
+    until the structure changes by grow, shrink or vary, or until xdata with
+    other values are offered.
+
     Examples
     --------
     >>> dtm = DecisionTreeModel( )
@@ -138,6 +142,7 @@ class DecisionTreeModel( Modifiable, Dynamic, LinearModel ):
 
         Modifiable.__init__( self, modifiable=modifiable )
         Dynamic.__init__( self, dynamic=dynamic )
+        self.clearLeafIndex()
 
         if depth == 0 or code is not None :
             nparams = 1
@@ -286,49 +291,72 @@ class DecisionTreeModel( Modifiable, Dynamic, LinearModel ):
 
         return ( pl1, pl2 )
 
-    def baseResult( self, xdata, params ):
+    def clearLeafIndex( self ) :
         """
-        Returns the result of the model function.
+        Forget the leaf index of the last xdata.
+        """
+        setatt( self, "_leafX", None )
+        setatt( self, "_leafIndex", None )
+
+    def getLeafIndex( self, xdata ) :
+        """
+        Return for each xdata the index of the leaf (parameter) it belongs to.
+
+        The index is kept until the values of the xdata or the tree structure change.
 
         Parameters
         ----------
         xdata : array_like
             values at which to calculate the result
-        params : array_like
-            values for the parameters.
-
         """
-        ndata = Tools.length( xdata )
-        plist = numpy.arange( ndata, dtype=int )
-
-#        print( params )
-        res = numpy.zeros( ndata, dtype=type( params[0] ) )
+        if self._leafIndex is not None and numpy.array_equal( self._leafX, xdata ) :
+            return self._leafIndex
 
-        kpar = 0
-        if self.isLeaf() :
-            return params[0]
-
-        res, kpar = self.recursiveResult( xdata, params, kpar, plist, res )
+        ndata = Tools.length( xdata )
+        index = numpy.zeros( ndata, dtype=int )
+        if not self.isLeaf() :
+            plist = numpy.arange( ndata, dtype=int )
+            self.recursiveLeaf( xdata, 0, plist, index )
 
-        return res
+        index.flags.writeable = False
+        setatt( self, "_leafX", numpy.array( xdata ) )
+        setatt( self, "_leafIndex", index )
+        return index
 
-    def recursiveResult( self, xdata, params, kpar, plist, res ) :
+    def recursiveLeaf( self, xdata, kpar, plist, index ) :
 
         pl1, pl2 = self.partitionList( xdata, plist )
 
         if self.left.isLeaf() :
-            res[pl1] = params[kpar]
+            index[pl1] = kpar
             kpar += 1
         else :
-            res, kpar = self.left.recursiveResult( xdata, params, kpar, pl1, res )
+            kpar = self.left.recursiveLeaf( xdata, kpar, pl1, index )
 
         if self.rite.isLeaf() :
-            res[pl2] = params[kpar]
+            index[pl2] = kpar
             kpar += 1
         else :
-            res, kpar = self.rite.recursiveResult( xdata, params, kpar, pl2, res )
+            kpar = self.rite.recursiveLeaf( xdata, kpar, pl2, index )
+
+        return kpar
+
+    def baseResult( self, xdata, params ):
+        """
+        Returns the result of the model function.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values at which to calculate the result
+        params : array_like
+            values for the parameters.
 
-        return res, kpar
+        """
+        if self.isLeaf() :
+            return params[0]
+
+        return numpy.asarray( params )[self.getLeafIndex( xdata )]
 
     def basePartial( self, xdata, params, parlist=None ):
         """
@@ -345,35 +373,13 @@ class DecisionTreeModel( Modifiable, Dynamic, LinearModel ):
 
         """
         ndata = Tools.length( xdata )
-        plist = numpy.arange( ndata, dtype=int ) if parlist is None else parlist
-
-        kpar = 0
         if self.isLeaf() :
             return numpy.ones( (ndata,1), dtype=float )
 
         part = numpy.zeros( (ndata, self.npbase), dtype=float )
+        part[numpy.arange( ndata ), self.getLeafIndex( xdata )] = 1.0
 
-        part, kpar = self.recursivePartial( xdata, kpar, plist, part )
-
-        return part
-
-    def recursivePartial( self, xdata, kpar, plist, part ) :
-
-        pl1, pl2 = self.partitionList( xdata, plist )
-
-        if self.left.isLeaf() :
-            part[pl1,kpar] = 1.0
-            kpar += 1
-        else :
-            part, kpar = self.left.recursivePartial( xdata, kpar, pl1, part )
-
-        if self.rite.isLeaf() :
-            part[pl2,kpar] = 1.0
-            kpar += 1
-        else :
-            part, kpar = self.rite.recursivePartial( xdata, kpar, pl2, part )
-
-        return part, kpar
+        return part if parlist is None else part[:,parlist]
 
     def sortXdata( self, xdata ):
         """
@@ -385,25 +391,7 @@ class DecisionTreeModel( Modifiable, Dynamic, LinearModel ):
             values at which to calculate the partials
 
         """
-        ndata = Tools.length( xdata )
-        plist = numpy.arange( ndata, dtype=int )
-
-        if self.isLeaf() :
-            return plist
-
-        return numpy.asarray( self.recursiveOrder( xdata, plist ), dtype=int )
-
-    def recursiveOrder( self, xdata, plist ) :
-
-        pl1, pl2 = self.partitionList( xdata, plist )
-
-        if not self.left.isLeaf() :
-            pl1 = self.left.recursiveOrder( xdata, pl1 )
-
-        if not self.rite.isLeaf() :
-            pl2 = self.rite.recursiveOrder( xdata, pl2 )
-
-        return numpy.append( pl1, pl2 )
+        return numpy.argsort( self.getLeafIndex( xdata ), kind="stable" )
 
 
     def baseDerivative( self, xdata, params ) :
@@ -758,6 +746,7 @@ class DecisionTreeModel( Modifiable, Dynamic, LinearModel ):
         self.alterParameterNames( dnp )
 
         setatt( self, "ncomp", cbran )
+        self.clearLeafIndex()
 
         return True
 
@@ -814,6 +803,7 @@ class DecisionTreeModel( Modifiable, Dynamic, LinearModel ):
         self.alterParameterNames( dnp )
 
         setatt( self, "ncomp", cbran )
+        self.clearLeafIndex()
 
         return True
 
@@ -875,6 +865,7 @@ class DecisionTreeModel( Modifiable, Dynamic, LinearModel ):
             parent.setSplitOrMask( itype, split )
 
         setatt( parent, "dimension", kdim )
+        self.clearLeafIndex()
 
         return True
 
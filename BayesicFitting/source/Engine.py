@@ -1,5 +1,7 @@
 import numpy as numpy
 from . import Tools
+from .Tools import setAttribute as setatt
+from .Problem import Problem
 
 __author__ = "Do Kester"
 __year__ = 2018
@@ -36,6 +38,12 @@ class Engine( object ):
     An Engine moves around a sample in a random way such that its likelood
     remain above the low-likelihood-limit.
 
+    The engines do not copy the walker. They keep the trial parameters in
+    scratch arrays of their own (see getScratch), and commit them, in place,
+    to the walker with the same id in walkers, only when a move is accepted
+    (see setWalker). Engines that change the structure of a dynamic model do
+    so in a copy of the problem.
+
     Attributes
     ----------
     walkers : WalkerList
@@ -61,6 +69,8 @@ class Engine( object ):
         present max size of the parameter cloud (in unitspace: [0,1])
     unitMin : array_like (read only)
         present minimum values of the parameter cloud (in unitspace: [0,1])
+    profiler : None or Profiler
+        to time the calls to the error distribution (None : no timing)
 
     Author       Do Kester.
 
@@ -100,6 +110,7 @@ class Engine( object ):
         self.walkers = walkers
         self.errdis = errdis
         self.report = [0]*5
+        self._scratch = None
 
         if copy is None :
             self.maxtrials = 5
@@ -107,6 +118,7 @@ class Engine( object ):
             self.unitRange = None
             self.unitMin = None
             self.verbose = verbose
+            self.profiler = None
 
 
 #            if constrain is None or callable( constrain ) :
@@ -120,20 +132,46 @@ class Engine( object ):
             self.unitRange = copy.unitRange
             self.unitMin   = copy.unitMin
             self.verbose   = copy.verbose
+            self.profiler  = copy.profiler
 
     def copy( self ):
         """ Return a copy of this engine.  """
         return Engine( self.walkers, self.errdis, copy=self )
 
     #  *********SET & GET***************************************************
+    def getScratch( self, allpars, nbuf=2 ) :
+        """
+        Return nbuf scratch arrays, all filled with a copy of allpars.
+
+        The arrays belong to the engine and are reused in the next call.
+
+        Parameters
+        ----------
+        allpars : array_like
+            list of all parameters
+        nbuf : int (2)
+            number of arrays
+        """
+        npar = len( allpars )
+        if ( self._scratch is None or self._scratch.shape[1] != npar or
+                len( self._scratch ) < nbuf ) :
+            self._scratch = numpy.zeros( ( nbuf, npar ), dtype=float )
+        scratch = self._scratch[:nbuf]
+        scratch[:] = allpars
+        return scratch
+
     def setWalker( self, walker, problem, allpars, logL, fitIndex=None ) :
         """
-        Update the walker with problem, allpars, LogL and logW.
+        Commit problem, allpars, logL and fitIndex, in place, to the walker
+        with the same id in self.walkers.
+
+        The walker keeps a copy of allpars, so that the engine can reuse it.
 
         Parameters
         ----------
-        walker : Sample
-            sample to be updated
+        walker : Walker
+            walker to be updated; or a copy of it, e.g. the one the Explorer
+            hands to the engines
         problem : Problem
             the problem in the walker
         allpars : array_like
@@ -144,12 +182,16 @@ class Engine( object ):
             (new) fitIndex
 
         """
+        walker = self.walkers[walker.id]
+        view = walker.__dict__.get( "_view" )
         walker.logL = logL
-        walker.allpars = allpars
+        if view is not None and view[0].hasView( "allpars" ) :
+            walker.allpars = allpars                ## copied into the WalkerList
+        else :
+            walker.allpars = numpy.array( allpars, dtype=float )
         walker.problem = problem
         if fitIndex is not None :
             walker.fitIndex = fitIndex
-        self.walkers[walker.id] = walker
 
 
     def checkBest( self, problem, allpars, logL, fitIndex=None ) :
@@ -169,9 +211,67 @@ class Engine( object ):
             (new) fitIndex
         """
         if logL > self.walkers[-1].logL :
-            self.setWalker( self.walkers[-1], problem, allpars.copy(), logL, fitIndex )
+            self.setWalker( self.walkers[-1], problem, allpars, logL, fitIndex )
             self.reportBest()
 
+######## likelihood ###############################################
+
+    def logLikelihood( self, problem, allpars ) :
+        """
+        Return the log likelihood of the problem at allpars, timed when profiling.
+
+        Parameters
+        ----------
+        problem : Problem
+            the problem involved
+        allpars : array_like
+            list of all parameters
+        """
+        if self.profiler is None :
+            return self.errdis.logLikelihood( problem, allpars )
+        return self.profiler.call( "likelihood", "logLikelihood",
+                                   self.errdis.logLikelihood, problem, allpars )
+
+    def partialLogL( self, problem, allpars, fitIndex ) :
+        """
+        Return the partial derivatives of the log likelihood to the parameters
+        in fitIndex, timed when profiling.
+
+        Parameters
+        ----------
+        problem : Problem
+            the problem involved
+        allpars : array_like
+            list of all parameters
+        fitIndex : array_like
+            indices of the parameters to be fitted
+        """
+        if self.profiler is None :
+            return self.errdis.partialLogL( problem, allpars, fitIndex )
+        return self.profiler.call( "likelihood", "partialLogL",
+                                   self.errdis.partialLogL, problem, allpars, fitIndex )
+
+    def updateLogLmock( self, problem, allpars, mockdata, parval=None ) :
+        """
+        Return the log likelihood and the mockdata, updated for the parameters
+        in parval. Timed when profiling.
+
+        Parameters
+        ----------
+        problem : Problem
+            the problem involved
+        allpars : array_like
+            list of all parameters
+        mockdata : array_like
+            mock data at the old parameters
+        parval : None or dict of {int : float}
+            indices and old values of the changed parameters
+        """
+        if self.profiler is None :
+            return self.errdis.updateLogLmock( problem, allpars, mockdata, parval=parval )
+        return self.profiler.call( "likelihood", "updateLogLmock", self.errdis.updateLogLmock,
+                                   problem, allpars, mockdata, parval=parval )
+
 ######## domain <> unit ###########################################
 
     def domain2Unit( self, problem, dval, kpar=None ) :
@@ -198,6 +298,17 @@ class Engine( object ):
 
         uval = numpy.ndarray( len( kpar ), dtype=float )
 
+        pg = self.getPriorGroups( problem, kpar )
+        if pg is not None :
+            dval = numpy.asarray( dval )
+            for prior, pos in pg[0] :
+                uval[pos] = prior.domain2Unit( dval[pos] )
+            for i in pg[1] :
+                uval[i] = problem.domain2Unit( dval[i], kpar[i] )
+            for i in pg[2] :
+                uval[i] = self.errdis.domain2Unit( dval[i], kpar[i] )
+            return uval
+
         for i,kp in enumerate( kpar ) :
             if kp >= 0 :
                 uval[i] = problem.domain2Unit( dval[i], kp )
@@ -228,6 +339,18 @@ class Engine( object ):
                      self.errdis.unit2Domain( uval, kpar ) )
 
         dval = numpy.ndarray( len( kpar ), dtype=float )
+
+        pg = self.getPriorGroups( problem, kpar )
+        if pg is not None :
+            uval = numpy.asarray( uval )
+            for prior, pos in pg[0] :
+                dval[pos] = prior.unit2Domain( uval[pos] )
+            for i in pg[1] :
+                dval[i] = problem.unit2Domain( uval[i], kpar[i] )
+            for i in pg[2] :
+                dval[i] = self.errdis.unit2Domain( uval[i], kpar[i] )
+            return dval
+
         for i,kp in enumerate( kpar ) :
             if kp >= 0 :
                 dval[i] = problem.unit2Domain( uval[i], kp )
@@ -235,6 +358,57 @@ class Engine( object ):
                 dval[i] = self.errdis.unit2Domain( uval[i], kp )
         return dval
 
+    def getPriorGroups( self, problem, kpar ) :
+        """
+        Return the parameters in kpar grouped by their prior, as a list of
+        (prior, positions), such that each prior transforms all its positions
+        in one call. Only priors that are VECTORIZED are grouped; the positions
+        of the others, and those of the hyperparameters, are returned as well.
+
+        The grouping is kept in the model, until its priors or the chain change.
+        It returns None when the problem has its own domain2Unit/unit2Domain
+        or when the model is dynamic; then the parameters go one by one.
+
+        Parameters
+        ----------
+        problem : Problem
+            the problem involved
+        kpar : array_like
+            selected parameter indices, where kp is index in [parameters, hyperparams]
+        """
+        model = problem.model
+        if ( model is None or model.isDynamic() or
+             type( problem ).domain2Unit is not Problem.domain2Unit or
+             type( problem ).unit2Domain is not Problem.unit2Domain ) :
+            return None
+
+        cache = model._priorGroups
+        if cache is None :
+            cache = {}
+            setatt( model, "_priorGroups", cache )
+        key = tuple( kpar )
+        pg = cache.get( key )
+        if pg is not None :
+            return pg
+
+        groups = {}
+        single = []
+        for i,kp in enumerate( kpar ) :
+            if kp < 0 : continue
+            prior = model.getPrior( kp )
+            if prior.VECTORIZED :
+                groups.setdefault( id( prior ), ( prior, [] ) )[1].append( i )
+            else :
+                single.append( i )
+        groups = [( prior, numpy.asarray( pos ) ) for prior, pos in groups.values()]
+        hyper = numpy.flatnonzero( numpy.asarray( kpar ) < 0 )
+
+        if len( cache ) >= 16 :                   ## too many different kpar
+            cache.clear()
+        pg = ( groups, numpy.asarray( single, dtype=int ), hyper )
+        cache[key] = pg
+        return pg
+
     def makeIndex( self, np, val ) :
         kpar = [k for k in range( np )]
         nh = len( val ) - np
@@ -297,13 +471,21 @@ class Engine( object ):
 #        mean = numpy.zeros( npmax, dtype=float )
         nval = numpy.zeros( npmax, dtype=int )
 
-        for walker in self.walkers :
-            fi = walker.fitIndex
-#            print( "Eng   ", fi, minv, walker.allpars )
-            minv[fi] = numpy.fmin( minv[fi], walker.allpars[fi] )
-            maxv[fi] = numpy.fmax( maxv[fi], walker.allpars[fi] )
-#            mean[fi] += walker.allpars[fi]
-            nval[fi] += 1
+        matrix = getattr( self.walkers, "allpars", None )
+        if matrix is not None :
+            ## all walkers are rows in the same matrix, with the same fitIndex
+            fi = self.walkers[kmx].fitIndex
+            minv[fi] = numpy.fmin.reduce( matrix[:,fi], axis=0 )
+            maxv[fi] = numpy.fmax.reduce( matrix[:,fi], axis=0 )
+            nval[fi] = len( self.walkers )
+        else :
+            for walker in self.walkers :
+                fi = walker.fitIndex
+#                print( "Eng   ", fi, minv, walker.allpars )
+                minv[fi] = numpy.fmin( minv[fi], walker.allpars[fi] )
+                maxv[fi] = numpy.fmax( maxv[fi], walker.allpars[fi] )
+#                mean[fi] += walker.allpars[fi]
+                nval[fi] += 1
 
         problem = self.walkers[kmx].problem
         fi = self.walkers[kmx].fitIndex
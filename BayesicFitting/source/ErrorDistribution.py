@@ -333,6 +333,56 @@ class ErrorDistribution( object ):
         return numpy.sum( self.logLdata( problem, allpars ) )
 
 
+    def logLikelihoodBatch( self, problem, allparsMatrix ):
+        """
+        Return the log( likelihood ) for K sets of (hyper)parameters at once.
+
+        The model results are calculated as a (K,N) array and the log likelihoods
+        of the data are summed along axis 1.
+        When the problem does not support batch evaluation, it loops over
+        logLikelihood().
+
+        Parameters
+        ----------
+        problem : Problem
+            to be solved
+        allparsMatrix : array_like of shape (K,npars+nphypar)
+            K sets of parameters of the problem
+
+        Returns
+        -------
+        array of K logLikelihoods
+        """
+        allparsMatrix = numpy.atleast_2d( allparsMatrix )
+        mockdata = problem.resultBatch( allparsMatrix[:,:problem.npars] )
+        if mockdata is None :
+            return numpy.asarray( [self.logLikelihood( problem, allpars )
+                                   for allpars in allparsMatrix] )
+
+        self.ncalls += len( allparsMatrix )
+        lld = self.logLdataBatch( problem, allparsMatrix, mockdata )
+        return numpy.sum( lld, axis=1 )
+
+    def logLdataBatch( self, problem, allparsMatrix, mockdata ) :
+        """
+        Return the log( likelihood ) for each residual, for K sets of parameters.
+
+        In this (base)class it loops over logLdata(). Distributions that can
+        broadcast over the parameter sets override this method.
+
+        Parameters
+        ----------
+        problem : Problem
+            to be solved
+        allparsMatrix : array_like of shape (K,npars+nphypar)
+            K sets of parameters of the problem
+        mockdata : array_like of shape (K,N)
+            as calculated by the model for each parameter set
+
+        """
+        return numpy.asarray( [self.logLdata( problem, allpars, mockdata=mock )
+                               for allpars, mock in zip( allparsMatrix, mockdata )] )
+
     def partialLogL( self, problem, allpars, fitIndex ) :
         """
         Return the partial derivative of log( likelihood ) to the parameters.
@@ -421,6 +471,7 @@ class ErrorDistribution( object ):
         This method provides the opportunity to optimize the logL calculation.
         Providing this one, automatically provides the previous one.
         For now it just refers to logLikelihood() itself.
+        See `updateLogLmock()` for an update from the mockdata of the old parameters.
 
         Parameters
         ----------
@@ -434,6 +485,45 @@ class ErrorDistribution( object ):
         """
         return self.logLikelihood( problem, allpars )
 
+    def updateLogLmock( self, problem, allpars, mockdata, parval=None ):
+        """"
+        Return a update of the log( likelihood ) and of the mockdata, given a
+        change in a few parameters.
+
+        The problem is asked to update the mockdata of the old parameters for
+        the changed parameters (see `Problem.updateResult()`). For additive
+        models and linear models this is much cheaper than a full calculation.
+        Otherwise the mockdata are calculated anew.
+
+        The logL may differ in the last bits from a full calculation.
+
+        Parameters
+        ----------
+        problem : Problem
+            to be solved
+        allpars : array_like
+            (new) parameters of the problem
+        mockdata : array_like
+            model result for the old parameters
+        parval : dict of {int : float}
+            int index of a parameter
+            float (old) value of the parameter
+
+        Returns
+        -------
+        tuple of ( float, array_like ) : the logL and the (new) mockdata
+        """
+        np = problem.npars
+        mock = None
+        if parval is not None :
+            mock = problem.updateResult( mockdata, allpars[:np],
+                                {k : v for k, v in parval.items() if k < np} )
+        if mock is None :
+            mock = problem.result( allpars[:np] )
+
+        self.ncalls += 1
+        return ( numpy.sum( self.logLdata( problem, allpars, mockdata=mock ) ), mock )
+
     def setResult( self ):
         pass
 
@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import re
 import warnings
 from . import Tools
@@ -128,17 +127,13 @@ class ErrorsInXandYProblem( Problem ):
         the lower left submatrix [nx,np] contains zeros
         the lower right submatrix [nx,nx] contains the identity matrix
 
+        The matrix is kept in its blocks, so that it grows linearly with nx.
+        See XandYPartial.
+
         """
         ( xd, pars ) = self.splitParam( param )
-        np = self.model.npars
-        nx = len( xd )
-        part = numpy.zeros( ( 2*nx, np+nx ), dtype=float )
-        part[:nx,:np] = self.model.partial( xd, pars )
-        dfdx = self.model.derivative( xd, pars )
-        for k in range( nx ) :
-            part[k,k+np] = dfdx[k]
-            part[k+nx,k+np] = 1.0
-        return part
+        return XandYPartial( self.model.partial( xd, pars ),
+                             self.model.derivative( xd, pars ) )
 
     def derivative( self, param ) :
         ( xd, pars ) = self.splitParam( param )
@@ -273,4 +268,134 @@ class ErrorsInXandYProblem( Problem ):
         return "ErrorsInXandYProblem of %s" % self.model
 
 
+class XandYPartial( object ):
+    """
+    The partials of an ErrorsInXandYProblem, kept in their blocks.
+
+    ..math::
+        P = | dM/dp   diag( dM/dx ) |
+            |   0       identity    |
+
+    Indexing a single column, P[:,k], returns it as a dense vector, like an
+    ndarray would. Indexing several columns, P[:,index], returns a XandYPartial
+    of those columns. The products needed by the error distributions,
+    res @ P and the weighted P.T * P, are calculated blockwise.
 
+    Attributes
+    ----------
+    dmdp : array_like of shape (nx,np)
+        partials of the model to its parameters
+    dmdx : array_like of shape (nx,)
+        derivative of the model to the x values
+    columns : array_like of int
+        the columns of the full matrix present in this one
+
+    """
+    ## let numpy defer res @ self to __rmatmul__
+    __array_ufunc__ = None
+
+    def __init__( self, dmdp, dmdx, columns=None ) :
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        dmdp : array_like of shape (nx,np)
+            partials of the model to its parameters
+        dmdx : array_like of shape (nx,)
+            derivative of the model to the x values
+        columns : None or array_like of int
+            the columns of the full matrix present in this one. None for all.
+        """
+        self.dmdp = dmdp
+        self.dmdx = dmdx
+        nx, np = dmdp.shape
+        self.columns = ( numpy.arange( np + nx ) if columns is None else
+                         numpy.asarray( columns, dtype=int ) )
+
+    @property
+    def shape( self ) :
+        return ( 2 * len( self.dmdx ), len( self.columns ) )
+
+    @property
+    def ndim( self ) :
+        return 2
+
+    def __len__( self ) :
+        return 2 * len( self.dmdx )
+
+    def __getitem__( self, key ) :
+        if not ( isinstance( key, tuple ) and len( key ) == 2 and key[0] == slice( None ) ) :
+            return self.toarray()[key]
+
+        cols = self.columns[key[1]]
+        if numpy.ndim( cols ) > 0 :
+            return XandYPartial( self.dmdp, self.dmdx, columns=cols )
+
+        nx, np = self.dmdp.shape
+        if cols < np :
+            return numpy.append( self.dmdp[:,cols], numpy.zeros( nx, dtype=float ) )
+        col = numpy.zeros( 2 * nx, dtype=float )
+        col[cols-np] = self.dmdx[cols-np]
+        col[nx+cols-np] = 1.0
+        return col
+
+    def split( self ) :
+        """
+        Return the positions of the model parameter columns and the nuisance
+        columns, and the rows of the nuisance columns.
+        """
+        np = self.dmdp.shape[1]
+        qpar = numpy.where( self.columns < np )[0]
+        qnui = numpy.where( self.columns >= np )[0]
+        return ( qpar, qnui, self.columns[qnui] - np )
+
+    def __rmatmul__( self, res ) :
+        """
+        Return res @ self, for res of length 2*nx.
+        """
+        res = numpy.asarray( res )
+        nx = len( self.dmdx )
+        qpar, qnui, rows = self.split()
+        prod = numpy.zeros( len( self.columns ), dtype=float )
+        prod[qpar] = res[:nx] @ self.dmdp[:,self.columns[qpar]]
+        prod[qnui] = res[rows] * self.dmdx[rows] + res[nx+rows]
+        return prod
+
+    def gram( self, weights=None ) :
+        """
+        Return the (weighted) matrix product self.T * weights * self.
+
+        Parameters
+        ----------
+        weights : None or array_like of length nx
+            weights on the data points; applied to both halves of the rows.
+        """
+        wgt = numpy.ones( len( self.dmdx ), dtype=float ) if weights is None else weights
+        qpar, qnui, rows = self.split()
+        dmdp = self.dmdp[:,self.columns[qpar]]
+        nc = len( self.columns )
+
+        gram = numpy.zeros( ( nc, nc ), dtype=float )
+        gram[numpy.ix_( qpar, qpar )] = numpy.inner( dmdp.transpose(), dmdp.transpose() * wgt )
+        cross = dmdp[rows,:].transpose() * ( wgt[rows] * self.dmdx[rows] )
+        gram[numpy.ix_( qpar, qnui )] = cross
+        gram[numpy.ix_( qnui, qpar )] = cross.transpose()
+        gram[qnui,qnui] = wgt[rows] * ( numpy.square( self.dmdx[rows] ) + 1.0 )
+        return gram
+
+    def toarray( self ) :
+        """
+        Return the partials as a dense matrix.
+        """
+        nx, np = self.dmdp.shape
+        part = numpy.zeros( ( 2*nx, np+nx ), dtype=float )
+        part[:nx,:np] = self.dmdp
+        kx = numpy.arange( nx )
+        part[kx,kx+np] = self.dmdx
+        part[kx+nx,kx+np] = 1.0
+        return part[:,self.columns]
+
+    def __array__( self, dtype=None, copy=None ) :
+        part = self.toarray()
+        return part if dtype is None else part.astype( dtype )
@@ -100,6 +100,21 @@ class ExpModel( NonLinearModel ):
         """
         return numpy.multiply( numpy.exp( numpy.multiply( params[1], xdata ) ), params[0] )
 
+    def baseResultBatch( self, xdata, paramMatrix ):
+        """
+        Returns the result of the model function for K parameter sets.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values at which to calculate the result
+        paramMatrix : array_like of shape (K,2)
+            K sets of values for the parameters.
+
+        """
+        params = paramMatrix[:,:,numpy.newaxis]
+        return numpy.exp( params[:,1] * xdata ) * params[:,0]
+
     def basePartial( self, xdata, params, parlist=None ):
         """
         Returns the partials at the input value.
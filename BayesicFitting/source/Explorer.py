@@ -1,7 +1,12 @@
 import numpy as numpy
+import copy as copymodule
 from threading import Thread
+from concurrent.futures import ProcessPoolExecutor
 
 from .Engine import Engine
+from .Model import Model
+from .Walker import Walker
+from .Profiler import Profiler
 from .Formatter import formatter as fmt
 
 __author__ = "Do Kester"
@@ -40,7 +45,12 @@ class Explorer( object ):
     Explorer is a helper class of NestedSampler, which contains and runs the
     diffusion engines.
 
-    It uses Threads to parallelise the diffusion engines.
+    It uses Threads or a pool of Processes to parallelise the diffusion engines.
+
+    The Threads run in the same interpreter, so they are bound by the GIL.
+    The Processes each hold a copy of the problem, the error distribution and
+    the engines. Only the walker parameters, logL and fitIndex are shipped
+    back and forth.
 
     Attributes
     ----------
@@ -60,6 +70,12 @@ class Explorer( object ):
         level of blabbering
     lowLhood : float
         present low likelihood level
+    threads : bool (False)
+        use threads to explore the walkers
+    processes : int (0)
+        number of worker processes to explore the walkers (0 : no processes)
+    profiler : None or Profiler
+        to time the engines (None : no timing)
 #    generation : int
 #        counting explorer calls
 
@@ -68,13 +84,17 @@ class Explorer( object ):
     """
     TWOP32 = 2 ** 32
 
-    def __init__( self, ns, threads=False ):
+    def __init__( self, ns, threads=False, processes=0 ):
         """
         Construct Explorer from a NestedSampler object.
         Parameters
         ----------
         ns : NestedSampler
             the calling NestedSampler
+        threads : bool (False)
+            use threads to explore the walkers
+        processes : int (0)
+            number of worker processes to explore the walkers
 
         """
         self.walkers = ns.walkers
@@ -85,7 +105,10 @@ class Explorer( object ):
         self.maxtrials = ns.maxtrials
         self.verbose = ns.verbose
         self.threads = threads
+        self.processes = processes
+        self.pool = None
         self.iteration = ns.iteration
+        self.profiler = ns.profiler
 
     def explore( self, worst, lowLhood ):
         """
@@ -99,6 +122,10 @@ class Explorer( object ):
             level of the low likelihood
 
         """
+        if self.processes > 0 :
+            self.exploreProcesses( worst, lowLhood )
+            return
+
         if not self.threads :
             for kw in worst :
                 walker = self.walkers[kw]
@@ -133,7 +160,100 @@ class Explorer( object ):
                 print( e )
             raise Exception( "Thread Error" )
 
+    def exploreProcesses( self, worst, lowLhood ):
+        """
+        Explore the likelihood function, using a pool of worker processes.
+
+        Parameters
+        ----------
+        worst : [int]
+            list of walkers to be explored/updated
+        lowLhood : float
+            level of the low likelihood
+
+        """
+        if self.pool is None :
+            self.startPool()
+
+        dynamic = self.walkers[0].problem.model.isDynamic()
+        engine = self.engines[0]
+        best = self.walkers[-1]
+
+        futures = []
+        for kw in worst :
+            seed = self.rng.randint( self.TWOP32 )
+            walker = self.walkers[kw]
+            model = walker.problem.model if dynamic else None
+            task = ( walker.id, walker.parent, walker.start, walker.allpars,
+                     walker.fitIndex, walker.logL, model, best.logL, lowLhood,
+                     seed, self.iteration, engine.unitRange, engine.unitMin )
+            futures += [self.pool.submit( _exploreInProcess, task )]
+
+        nrep = Engine.NCALLS
+        for kw, future in zip( worst, futures ) :
+            ( allpars, fitIndex, logL, model, bestpars, bestIndex, bestlogL,
+              bestmodel, reports, ncalls, nparts, timings ) = future.result()
+
+            walker = self.walkers[kw]
+            walker.allpars = allpars
+            walker.fitIndex = fitIndex
+            walker.logL = logL
+            if model is not None :
+                walker.problem.model = model
+
+            best = self.walkers[-1]
+            if bestpars is not None and bestlogL > best.logL :
+                best.allpars = bestpars
+                best.fitIndex = bestIndex
+                best.logL = bestlogL
+                if bestmodel is not None :
+                    best.problem.model = bestmodel
+
+            for engine, report in zip( self.engines, reports ) :
+                for i in range( nrep ) :
+                    engine.report[i] += report[i]
+                engine.report[nrep] += sum( report[:nrep] )
+
+            self.errdis.ncalls += ncalls
+            self.errdis.nparts += nparts
+            if timings is not None :
+                self.profiler.merge( timings )
+
+    def startPool( self ):
+        """
+        Start the pool of worker processes.
+
+        Each process receives its own copy of the problem, the error distribution
+        and the engines. The walkers are not shipped. When profiling, each process
+        has its own profiler.
+        """
+        proxy = copymodule.copy( self )
+        proxy.walkers = None
+        proxy.pool = None
+        proxy.rng = None
+        if self.profiler is not None :
+            proxy.profiler = Profiler( window=self.profiler.window )
+        proxy.engines = [eng.copy() for eng in self.engines]
+        for eng in proxy.engines :
+            eng.walkers = None
+            eng.profiler = proxy.profiler
+
+        problem = self.walkers[0].problem.copy()
+        nwalkers = len( self.walkers )
+        self.pool = ProcessPoolExecutor( max_workers=self.processes,
+                        initializer=_initProcess, initargs=( proxy, problem, nwalkers ) )
+
+    def close( self ):
+        """
+        Shut down the pool of worker processes, if any.
+        """
+        if self.pool is not None :
+            self.pool.shutdown()
+            self.pool = None
+
     def exploreWalker( self, walker, lowLhood, engines, rng ):
+        ## All engines start from this copy; they commit to the walker in the list.
+        walker = walker.copy()
         oldlogL = walker.logL
 
         maxmoves = len( walker.fitIndex ) / self.rate
@@ -147,7 +267,11 @@ class Explorer( object ):
             i = 0
             for engine in rng.permutation( engines ) :
 
-                moves += engine.execute( walker, lowLhood )
+                if self.profiler is None :
+                    moves += engine.execute( walker, lowLhood )
+                else :
+                    moves += self.profiler.call( "engines", str( engine ),
+                                        engine.execute, walker, lowLhood )
 
                 if self.verbose >= 4:
                     print( "%4d %-15.15s %4d %10.3f %10.3f ==> %3d  %10.3f"%
@@ -175,6 +299,99 @@ class Explorer( object ):
                                 ( walker.logL, wlogL ) )
 
 
+## Local state of a worker process: a copy of the Explorer and of the Problem
+processExplorer = None
+processProblem = None
+
+def _initProcess( explorer, problem, nwalkers ):
+    """
+    Initialize a worker process with its own copies of explorer and problem.
+
+    Parameters
+    ----------
+    explorer : Explorer
+        copy of the Explorer, without walkers and pool
+    problem : Problem
+        copy of the problem
+    nwalkers : int
+        number of walkers in the ensemble (including the all time best)
+    """
+    global processExplorer, processProblem
+    explorer.walkers = [None] * nwalkers
+    for eng in explorer.engines :
+        eng.walkers = explorer.walkers
+    Model.profiler = explorer.profiler
+    processExplorer = explorer
+    processProblem = problem
+
+def _exploreInProcess( task ):
+    """
+    Explore one walker inside a worker process.
+
+    Parameters
+    ----------
+    task : tuple
+        ( id, parent, start, allpars, fitIndex, logL, model, bestlogL, lowLhood,
+          seed, iteration, unitRange, unitMin ) as shipped by Explorer.exploreProcesses
+
+    Returns
+    -------
+    tuple of ( allpars, fitIndex, logL, model, bestpars, bestIndex, bestlogL,
+               bestmodel, reports, ncalls, nparts, timings )
+    """
+    ( id, parent, start, allpars, fitIndex, logL, model, bestlogL, lowLhood,
+      seed, iteration, unitRange, unitMin ) = task
+
+    explorer = processExplorer
+    explorer.iteration = iteration
+    errdis = explorer.errdis
+    ncalls = errdis.ncalls
+    nparts = errdis.nparts
+    if explorer.profiler is not None :
+        explorer.profiler.reset()
+
+    problem = processProblem.copy()
+    if model is not None :
+        problem.model = model
+    walker = Walker( id, problem, allpars, fitIndex, parent=parent, start=start )
+    walker.logL = logL
+
+    best = Walker( len( explorer.walkers ) - 1, problem, allpars, fitIndex )
+    best.logL = bestlogL
+
+    walkers = explorer.walkers
+    walkers[id] = walker
+    walkers[-1] = best
+
+    rng = numpy.random.RandomState( seed )
+    for eng in explorer.engines :
+        eng.report = [0] * len( eng.report )
+        eng.rng = rng
+        eng.unitRange = unitRange
+        eng.unitMin = unitMin
+
+    explorer.exploreWalker( walker, lowLhood, explorer.engines, rng )
+
+    walker = walkers[id]
+    best = walkers[-1]
+    if best.logL > bestlogL :
+        bestpars = best.allpars
+        bestIndex = best.fitIndex
+        bestmodel = best.problem.model if model is not None else None
+    else :
+        bestpars = bestIndex = bestmodel = None
+
+    walkers[id] = None
+    walkers[-1] = None
+
+    return ( walker.allpars, walker.fitIndex, walker.logL,
+             walker.problem.model if model is not None else None,
+             bestpars, bestIndex, best.logL, bestmodel,
+             [eng.report for eng in explorer.engines],
+             errdis.ncalls - ncalls, errdis.nparts - nparts,
+             explorer.profiler.timings if explorer.profiler is not None else None )
+
+
 class ExplorerThread( Thread ):
     """
     One thread for the Explorer. It updates one walker.
@@ -182,6 +182,32 @@ class ExponentialErrorDistribution( ScaledErrorDistribution ):
             lld *= problem.weights
         return lld
 
+    def logLdataBatch( self, problem, allparsMatrix, mockdata ) :
+        """
+        Return the log( likelihood ) for each residual, for K sets of parameters.
+
+        Parameters
+        ----------
+        problem : Problem
+            to be solved
+        allparsMatrix : array_like of shape (K,npars+nphypar)
+            K sets of parameters of the problem
+        mockdata : array_like of shape (K,N)
+            as calculated by the model for each parameter set
+
+        """
+        scale = allparsMatrix[:,-2:-1]
+        power = allparsMatrix[:,-1:]
+
+        res = problem.residuals( None, mockdata=mockdata )
+
+        lld = - numpy.power( numpy.abs( res / scale ), power )
+        norm = numpy.log( power / ( 2 * scale ) ) - special.gammaln( 1.0 / power )
+        lld += norm
+        if problem.weights is not None :
+            lld *= problem.weights
+        return lld
+
     def getChipow( self, problem, allpars=None ) :
         """
         Return chisq.
@@ -1,5 +1,6 @@
 import math as math
 import random as random
+import numpy as numpy
 
 from .Prior import Prior
 
@@ -66,6 +67,7 @@ class ExponentialPrior( Prior ):
 
     Author: Do Kester.
     """
+    VECTORIZED = True               # unit2Domain and domain2Unit accept arrays
 
     #  *********CONSTRUCTORS***************************************************
     def __init__( self, scale=1.0, prior=None ):
@@ -93,6 +95,17 @@ class ExponentialPrior( Prior ):
     def copy( self ):
         return ExponentialPrior( scale=self.scale, prior=self )
 
+    def __getstate__( self ):
+        """ Return the state without the random module, which cannot be pickled.  """
+        state = self.__dict__.copy()
+        state.pop( "_rng", None )
+        return state
+
+    def __setstate__( self, state ):
+        self.__dict__.update( state )
+        if "_shift" in state :
+            self.__dict__["_rng"] = random
+
     def __setattr__( self, name, value ):
         """
         Set attributes: zeroFraction
@@ -121,10 +134,20 @@ class ExponentialPrior( Prior ):
 
         Parameters
         ----------
-        uval : float
-            value within [0,1]
+        uval : float or array_like
+            value(s) within [0,1]. For an array, one random value in
+            [0,zeroFraction] is drawn when any of them maps to zero.
 
         """
+        if numpy.ndim( uval ) > 0 :
+            uv = 1 - numpy.asarray( uval, dtype=float )
+            zero = uv > self._shift
+            if numpy.any( zero ) :                  ## one draw per call
+                self._uval = self._rng.random() * self.zeroFraction     # arbitrary
+            with numpy.errstate( divide='ignore' ) :
+                dval = -numpy.log( uv / self._shift ) * self.scale
+            return numpy.where( zero, 0.0, dval )
+
         uv = 1 - uval
         if uv == 0 : return math.inf
         if ( uv > self._shift ) :
@@ -140,10 +163,15 @@ class ExponentialPrior( Prior ):
 
         Parameters
         ----------
-        dval : float
-            value within the domain of a parameter
+        dval : float or array_like
+            value(s) within the domain of a parameter
 
         """
+        if numpy.ndim( dval ) > 0 :
+            dval = numpy.asarray( dval )
+            return numpy.where( dval == 0, self._uval,
+                                1 - numpy.exp( -dval / self.scale ) * self._shift )
+
         return ( self._uval if ( dval == 0 )
                  else 1 - math.exp( -dval / self.scale ) * self._shift )
 
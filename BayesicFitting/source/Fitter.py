@@ -1,4 +1,6 @@
 import numpy as numpy
+import warnings
+from scipy import linalg
 from .BaseFitter import BaseFitter
 
 from .Formatter import formatter as fmt
@@ -93,6 +95,7 @@ class Fitter( BaseFitter ):
 
         """
         super( Fitter, self ).__init__( xdata, model, map=map, keep=keep, fixedScale=fixedScale )
+        self.factorized = ( None, None )
 
     def fit( self, ydata, weights=None, keep=None, plot=False ):
         """
@@ -131,22 +134,25 @@ class Fitter( BaseFitter ):
             self.chiSquared( ydata, weights )
             return numpy.asarray( 0 )
 
-        hessian = self.getHessian( weights=weights, index=fitIndex )
-        ydatacopy = ydata.copy( )
-        # subtract influence of fixed parameters on the data
-        if fitIndex is not None :
-            fxpar = numpy.copy( self.model.parameters )
-            fxpar[fitIndex] = 0.0
-            ydatacopy = numpy.subtract( ydatacopy, self.model.result( self.xdata, fxpar) )
-
-        if weights is not None :
-            ydatacopy *= weights
-        if hasattr( self, "normdfdp" ) :
-            ydatacopy = numpy.append( ydatacopy, self.normdata * self.normweight )
-
-        vector = self.getVector( ydatacopy, index=fitIndex )
+        if self.getBandedDesign( index=fitIndex ) is not None :
+            params = self.solveBanded( ydata, weights=weights )
+        else :
+            hessian = self.getHessian( weights=weights, index=fitIndex )
+            ydatacopy = ydata.copy( )
+            # subtract influence of fixed parameters on the data
+            if fitIndex is not None :
+                fxpar = numpy.copy( self.model.parameters )
+                fxpar[fitIndex] = 0.0
+                ydatacopy = numpy.subtract( ydatacopy, self.model.result( self.xdata, fxpar) )
+
+            if weights is not None :
+                ydatacopy *= weights
+            if hasattr( self, "normdfdp" ) :
+                ydatacopy = numpy.append( ydatacopy, self.normdata * self.normweight )
+
+            vector = self.getVector( ydatacopy, index=fitIndex )
 #        print( fmt( hessian ) )
-        params = numpy.linalg.solve( hessian, vector )
+            params = self.solve( hessian, vector )
 
         params = self.insertParameters( params, index=fitIndex )
         self.model.parameters = params
@@ -156,6 +162,128 @@ class Fitter( BaseFitter ):
 
         return params
 
+    def fitMany( self, ydata, weights=None, keep=None ):
+        """
+        Return model parameters fitted to many datasets at once.
+
+        All datasets, the columns of ydata, share the xdata of the fitter.
+        When the weights are shared too, the hessian is factorized only once
+        and all datasets are solved in one go. Weights per dataset need a
+        hessian per dataset; they are solved as a stack of matrix equations.
+
+        The model itself is not changed.
+
+        Parameters
+        ----------
+        ydata : array_like of shape (nxdata, nsets)
+            the data matrix to be fitted; one dataset per column.
+        weights : array_like of shape (nxdata,) or (nxdata, nsets)
+            weights pertaining to the data ( = 1.0 / sigma^2 )
+        keep : dict of {int:float}
+            dictionary of indices (int) to be kept at a fixed value (float)
+            The values will override those at initialization.
+            They are only used in this call of fit.
+
+        Returns
+        -------
+        params : ndarray of shape (npchain, nsets)
+            the fitted parameters, one set per column
+        chisq : ndarray of shape (nsets,)
+            chisquared per dataset
+        stdevs : ndarray of shape (npchain, nsets)
+            standard deviations of the parameters, one set per column
+
+        Raises
+        ------
+            ValueError when ydata or weights contain a NaN or have the wrong shape
+
+        """
+        fitIndex, params, ydata, weights, ycorr = self.fitManyProlog( ydata, weights=weights, keep=keep )
+
+        design = self.getDesign( index=fitIndex )
+        nsets = ydata.shape[1]
+
+        if weights is not None :
+            ycorr = ycorr * ( weights if weights.ndim == 2 else weights[:,numpy.newaxis] )
+        if hasattr( self, "normdfdp" ) :
+            normdata = numpy.repeat( ( self.normdata * self.normweight )[:,numpy.newaxis],
+                                     nsets, axis=1 )
+            ycorr = numpy.append( ycorr, normdata, axis=0 )
+
+        vector = numpy.dot( design.transpose(), ycorr )
+
+        if weights is None or weights.ndim == 1 :
+            hessian = self.getHessian( weights=weights, index=fitIndex )
+            fitpar = self.solve( hessian, vector )
+            invdiag = self.solve( hessian, numpy.eye( len( fitIndex ) ) ).diagonal()
+        else :
+            if hasattr( self, "normweight" ) :
+                normweight = numpy.repeat( self.normweight[:,numpy.newaxis], nsets, axis=1 )
+                weights = numpy.append( weights, normweight, axis=0 )
+            hessian = numpy.einsum( "ki,kj,ks->sij", design, design, weights )
+            fitpar = numpy.linalg.solve( hessian, vector.transpose()[:,:,numpy.newaxis] )
+            fitpar = fitpar[:,:,0].transpose()
+            invdiag = numpy.linalg.inv( hessian ).diagonal( axis1=1, axis2=2 ).transpose()
+            weights = weights[:self.nxdata]
+
+        return self.fitManyPostscript( ydata, params, fitpar, weights, fitIndex, invdiag )
+
+    def solve( self, hessian, vector ) :
+        """
+        Return the solution of the matrix equation H * p = beta.
+
+        The LU factorization of the hessian is kept. When the hessian is the
+        same as in the previous call, e.g. when it is cached for linear models,
+        the factorization is reused. See `BaseFitter.getCachedDesign()`.
+
+        Parameters
+        ----------
+        hessian : matrix
+            the hessian matrix
+        vector : array_like
+            the beta vector
+
+        Raises
+        ------
+            LinAlgError when the hessian is singular
+
+        """
+        if not numpy.array_equal( hessian, self.factorized[0] ) :
+            with warnings.catch_warnings() :
+                warnings.simplefilter( "ignore", linalg.LinAlgWarning )
+                lu, piv = linalg.lu_factor( hessian, check_finite=False )
+            if numpy.any( numpy.diag( lu ) == 0 ) :
+                raise numpy.linalg.LinAlgError( "Singular matrix" )
+            self.factorized = ( hessian.copy(), ( lu, piv ) )
+
+        return linalg.lu_solve( self.factorized[1], vector, check_finite=False )
+
+    def solveBanded( self, ydata, weights=None ) :
+        """
+        Return the parameters of a model with a banded design, e.g. BSplinesModel.
+
+        The normal equations are assembled in banded form and solved with a
+        banded Cholesky decomposition. Time and memory scale linearly with the
+        number of data and of parameters. See `BaseFitter.getBandedDesign()`.
+
+        Parameters
+        ----------
+        ydata : array_like
+            the data vector to be fitted
+        weights : array_like
+            weights pertaining to the data
+
+        Raises
+        ------
+            LinAlgError when the hessian is not positive definite, e.g. when
+            there are no data between some knots.
+
+        """
+        hessian = self.getBandedHessian( weights=weights )
+        vector = self.getBandedVector( ydata if weights is None else ydata * weights )
+
+        return linalg.solveh_banded( hessian, vector, lower=True, check_finite=False )
+
     def __str__( self ):
         """ Return the name of the fitter. """
         return "Fitter"
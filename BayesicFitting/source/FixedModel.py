@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import re
 import warnings
 from . import Tools
@@ -231,6 +230,25 @@ class FixedModel( BaseModel ):
         expparam = self.expand( xdata, param )
         return super( FixedModel, self ).result( xdata, expparam )
 
+    def resultBatch( self, xdata, paramMatrix ):
+        """
+        Returns the results for K parameter sets, as a (K,N) array.
+
+        None is returned for models with fixed parameters; they are
+        evaluated one parameter set at a time.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values at which to calculate the result
+        paramMatrix : array_like of shape (K,npbase)
+            K sets of values for the parameters.
+
+        """
+        if self.fixed is not None :
+            return None
+        return super( FixedModel, self ).resultBatch( xdata, paramMatrix )
+
     def expand( self, xdata, param ) :
         """
         Returns a complete list of parameters, where the fixed parameters
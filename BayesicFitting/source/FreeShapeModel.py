@@ -1,6 +1,5 @@
 import numpy as numpy
 import numpy.linalg
-from astropy import units
 import math
 
 from . import Tools
@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 import warnings
 from . import Tools
@@ -109,11 +108,10 @@ class GalileanEngine( Engine ):
         """
         self.reportCall()
 
-        walker = walker.copy()
         problem = walker.problem
         Lhood = walker.logL
-        allpars = walker.allpars
         fitIndex = walker.fitIndex
+        allpars, ptry, pedge = self.getScratch( walker.allpars, nbuf=3 )
 
         npout = 0
         inside = 0
@@ -127,7 +125,6 @@ class GalileanEngine( Engine ):
 #        maxtrial = self.maxtrials * nstep
         maxtrial = self.maxtrials
 
-        ptry = allpars.copy()
         if self.verbose > 4 :
             print( "alpar ", fma( ptry ), fmt( Lhood ), fmt( lowLhood) )
             fip = allpars[fitIndex]
@@ -150,10 +147,10 @@ class GalileanEngine( Engine ):
                 f = ( 1.0 if Lhood == Ltry else
                       ( Lhood - lowLhood ) / ( Lhood - Ltry ) )     # lin interpolation to edge
 
-                pedge = ptry.copy()
+                pedge[:] = ptry
                 pedge[fitIndex] = um.stepPars( f )                # ptry on edge
 
-                dLdp = self.errdis.partialLogL( problem, pedge, fitIndex )
+                dLdp = self.partialLogL( problem, pedge, fitIndex )
                 self.plotter.move( allpars, pedge, col=1, sym=4 )
 
                 um.mirrorOnLowL( dLdp )
@@ -173,12 +170,12 @@ class GalileanEngine( Engine ):
             #     ptry = self.constrain( model, ptry, xdata )
             #############################################
 
-            Ltry = self.errdis.logLikelihood( problem, ptry )
+            Ltry = self.logLikelihood( problem, ptry )
 
             if Ltry >= lowLhood:
                 self.plotter.move( allpars, ptry, col=0, sym=0 )
 
-                allpars = ptry.copy( )
+                allpars[:] = ptry
                 Lhood = Ltry
                 self.reportSuccess( )
                 npout = len( allpars )
@@ -158,6 +158,72 @@ class GaussErrorDistribution( ScaledErrorDistribution ):
         return res2
 
 
+    def logLdataBatch( self, problem, allparsMatrix, mockdata ) :
+        """
+        Return the log( likelihood ) for each residual, for K sets of parameters.
+
+        Parameters
+        ----------
+        problem : Problem
+            to be solved
+        allparsMatrix : array_like of shape (K,npars+nphypar)
+            K sets of parameters of the problem
+        mockdata : array_like of shape (K,N)
+            as calculated by the model for each parameter set
+
+        """
+        scale = allparsMatrix[:,-1:]
+
+        res2 = -0.5 * problem.weightedResSq( None, mockdata=mockdata )
+
+        res2 /= ( scale * scale )
+        if problem.weights is None :
+            res2 -= ( 0.5 * self.LOG2PI + numpy.log( scale ) )
+        else :
+            res2 -= ( 0.5 * self.LOG2PI + numpy.log( scale ) ) * problem.weights
+        return res2
+
+    def partialLogL( self, problem, allpars, fitIndex ) :
+        """
+        Return the partial derivative of log( likelihood ) to the parameters in fitIndex.
+
+        The partials to the parameters follow from one product of the
+        residuals with the partials of the problem.
+
+        Parameters
+        ----------
+        problem : Problem
+            to be solved.
+        allpars : array_like
+            (hyper)parameters of the problem
+        fitIndex : array_like
+            indices of parameters to be fitted; negative or beyond the
+            problem parameters for the scale.
+
+        """
+        self.nparts += 1                    ## counts calls to partialLogL
+
+        np = problem.npars
+        param = allpars[:np]
+        scale = allpars[np]
+        s2 = scale * scale
+
+        mock = problem.result( param )
+        ( res2, res ) = problem.weightedResSq( param, mockdata=mock, extra=True )
+
+        fitIndex = numpy.asarray( fitIndex, dtype=int )
+        isp = numpy.logical_and( fitIndex >= 0, fitIndex < np )
+
+        dL = numpy.zeros( len( fitIndex ), dtype=float )
+        if numpy.any( isp ) :
+            dM = problem.partial( param )
+            dL[isp] = ( res @ dM[:,fitIndex[isp]] ) / s2
+        if not numpy.all( isp ) :
+            wgt = 1.0 if problem.weights is None else problem.weights
+            dL[~isp] = numpy.sum( res2 / s2 - wgt ) / scale
+
+        return dL
+
     def partialLogL_alt( self, problem, allpars, fitIndex ) :
         """
         Return the partial derivative of log( likelihood ) to the parameters in fitIndex.
@@ -257,17 +323,19 @@ class GaussErrorDistribution( ScaledErrorDistribution ):
         scale = allpars[np]
         s2 = scale * scale
 
-        fi = fitIndex if fitIndex[-1] != np else fitIndex[-1:]
+        fi = fitIndex if fitIndex[-1] != np else fitIndex[:-1]
 
         nf = len( fi )
         design = problem.partial( param )[:,fi]
-        design = design.transpose()
-        deswgt = design
-        if problem.hasWeights() :
-            deswgt *= problem.weights
+        weights = problem.weights if problem.hasWeights() else None
 
         hessian = numpy.zeros( ( nh, nh ), dtype=float )
-        hessian[:nf,:nf] = numpy.inner( design, deswgt ) / s2
+        if isinstance( design, numpy.ndarray ) :
+            design = design.transpose()
+            deswgt = design if weights is None else design * weights
+            hessian[:nf,:nf] = numpy.inner( design, deswgt ) / s2
+        else :                              ## structured partials
+            hessian[:nf,:nf] = design.gram( weights=weights ) / s2
 
         if fitIndex[-1] == np :
             hessian[nf,nf] = 2 * ( problem.ndata - nf ) / s2
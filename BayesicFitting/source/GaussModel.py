@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .Tools import setAttribute as setatt
@@ -122,6 +121,23 @@ class GaussModel( NonLinearModel ):
         res = params[0] * numpy.exp( -0.5 * x * x )
         return res
 
+    def baseResultBatch( self, xdata, paramMatrix ):
+        """
+        Returns the result of the model function for K parameter sets.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values at which to calculate the result
+        paramMatrix : array_like of shape (K,3)
+            K sets of values for the parameters.
+
+        """
+        params = paramMatrix[:,:,numpy.newaxis]
+        s = 1.0 / params[:,2]
+        x = ( xdata - params[:,1] ) * s
+        return params[:,0] * numpy.exp( -0.5 * x * x )
+
     def basePartial( self, xdata, params, parlist=None ):
         """
         Returns the partials at the input value.
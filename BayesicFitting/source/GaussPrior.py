@@ -53,6 +53,7 @@ class GaussPrior( Prior ):
         high limit ( inactive for now)
 
     """
+    VECTORIZED = True               # unit2Domain and domain2Unit accept arrays
 
     SPI = 1.0 / math.sqrt( math.pi )
     LSPI = math.log( SPI )
@@ -86,18 +86,20 @@ class GibbsEngine( Engine ):
         """
         self.reportCall()
 
-        walker = walker.copy()              ## work on local copy
-
         problem = walker.problem
         fitIndex = walker.fitIndex
 
         perm = self.rng.permutation( fitIndex )
         ur = self.unitRange * ( 1 + 2.0 / len( self.walkers ) )
 
+        ## model result of the walker, to be updated for each one-parameter move
+        mock = problem.result( walker.allpars[:problem.npars] )
+
+        ## param stays equal to the walker: accepted moves are committed, others undone
+        param = self.getScratch( walker.allpars, nbuf=1 )[0]
         Lbest = self.walkers[-1].logL
         t = 0
         for c in perm :
-            param = walker.allpars.copy()
             save = param[c]
             usav = self.domain2Unit( problem, save, kpar=c )
             while True :
@@ -112,11 +114,13 @@ class GibbsEngine( Engine ):
                 kk += 1
                 param[c] = self.unit2Domain( problem, ptry, kpar=c )
 
-                Ltry = self.errdis.updateLogL( problem, param, parval={c : save} )
+                Ltry, mtry = self.updateLogLmock( problem, param, mock,
+                                                  parval={c : save} )
 
                 if Ltry >= lowLhood:
                     self.reportSuccess( )
                     self.setWalker( walker, problem, param, Ltry, fitIndex=fitIndex )
+                    mock = mtry
                     t += 1
                     break
                 elif kk < self.maxtrials :
@@ -130,10 +134,15 @@ class GibbsEngine( Engine ):
                     break
 
             if Ltry > Lbest :
-                Lbest = Ltry
-                self.setWalker( self.walkers[-1], problem, param.copy(), Lbest, fitIndex=fitIndex )
+                Lbest = self.logLikelihood( problem, param )
+                self.setWalker( self.walkers[-1], problem, param, Lbest, fitIndex=fitIndex )
                 self.reportBest()
 
+        if t > 0 :
+            ## commit the walker with an exact logL instead of the incrementally updated one
+            self.setWalker( walker, problem, param, self.logLikelihood( problem, param ),
+                            fitIndex=fitIndex )
+
         return t                        # nr of succesfull steps
 
 
@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .Tools import setAttribute as setatt
@@ -44,6 +43,12 @@ class HarmonicModel( LinearModel ):
     The number of parameters is 2 * order.
     The parameters are initialized at 1.0. It is a linear model.
 
+    The cosines and sines of the harmonics are built from those of the
+    fundamental by angle addition. To limit the accumulation of rounding
+    errors, they are recalculated exactly every `reseed` harmonics.
+    They are kept for as long as the same xdata are offered, so that partial,
+    result and derivative calculate them only once.
+
     See
     <a href="../../../../../../ia/numeric/toolbox/fit/demo/harmonicfit.py">example</a>
 
@@ -62,6 +67,9 @@ class HarmonicModel( LinearModel ):
         the order of the harmonic
     period : float
         the length of the period of the fundamental
+    reseed : int
+        recalculate the harmonics exactly every reseed harmonics.
+        1 : all exact; 0 : only the fundamental
 
     Attributes from Model
     ---------------------
@@ -78,7 +86,7 @@ class HarmonicModel( LinearModel ):
     """
     PARNAMES = ["cosamp_", "sinamp_"]
 
-    def __init__( self, order, period=1.0, copy=None, **kwargs ):
+    def __init__( self, order, period=1.0, reseed=20, copy=None, **kwargs ):
         """
         Harmonic oscillator model.
 
@@ -90,6 +98,8 @@ class HarmonicModel( LinearModel ):
             the number of overtones
         period : float
             length of the period of the fundamental. default 1.0
+        reseed : int
+            recalculate the harmonics exactly every reseed harmonics. default 20
         copy : HarmonicModel
             model to be copied
         fixed : dictionary of {int:float}
@@ -102,17 +112,19 @@ class HarmonicModel( LinearModel ):
 
         self.order = order
         self.period = period
+        self.reseed = reseed
+        setatt( self, "_basis", None )
 
     def copy( self ):
         """ Copy method.  """
-        return HarmonicModel( self.order, period=self.period, copy=self )
+        return HarmonicModel( self.order, period=self.period, reseed=self.reseed, copy=self )
 
     def __setattr__( self, name, value ):
         """
-        Set attributes: order, period
+        Set attributes: order, period, reseed
 
         """
-        if name == 'order' :
+        if name == 'order' or name == 'reseed' :
             setatt( self, name, value, type=int )
         elif name == 'period' :
             setatt( self, name, value, type=float )
@@ -137,17 +149,14 @@ class HarmonicModel( LinearModel ):
         ni = Tools.length( xdata )
         partial = numpy.zeros( ( ni, np), dtype=float )
 
-        x = 2 * math.pi * xdata / self.period
-
-        parts = { 0 : ( lambda j : numpy.cos( j * x ) ),
-                  1 : ( lambda j : numpy.sin( j * x ) ) }
+        cosb, sinb = self.basis( xdata )
+        parts = [cosb, sinb]
 
         if parlist is None :
             parlist = range( self.npmax )
 
         for k,kp in enumerate( parlist ) :
-            j = 1 + kp // 2
-            partial[:,k] = parts[kp % 2]( j )
+            partial[:,k] = parts[kp % 2][kp // 2]
 
         return partial
 
@@ -163,14 +172,49 @@ class HarmonicModel( LinearModel ):
             parameters of the model.
 
         """
-        df = numpy.zeros_like( xdata )
-        tp = 2 * math.pi / self.period
-        x = tp * xdata
-        j = 0
-        for k in range( 0, self.npmax, 2 ) :
-            j += 1
-            df += tp * j * ( params[k+1] * numpy.cos( j * x ) - params[k] * numpy.sin( j * x ) )
-        return df
+        cosb, sinb = self.basis( xdata )
+        params = numpy.asarray( params, dtype=float )
+        tpj = 2 * math.pi / self.period * numpy.arange( 1, self.order + 1 )
+        df = numpy.dot( tpj * params[1::2], cosb ) - numpy.dot( tpj * params[0::2], sinb )
+        return df.reshape( numpy.shape( xdata ) )
+
+    def basis( self, xdata ):
+        """
+        Return the cosines and the sines of all harmonics at the xdata.
+
+        They are kept, read-only, as long as xdata with the same values are offered.
+
+        Parameters
+        ----------
+        xdata : array_like
+            value at which to calculate the basis
+
+        Returns
+        -------
+        cosb, sinb : ndarray of shape ( order, len( xdata ) )
+            cos( j * x ) and sin( j * x ) for j in 1..order
+        """
+        key = ( self.period, self.order, self.reseed )
+        if ( self._basis is not None and self._basis[1] == key and
+                numpy.array_equal( self._basis[0], xdata ) ) :
+            return self._basis[2:]
+
+        x = 2 * math.pi * numpy.ravel( xdata ) / self.period
+        cosb = numpy.empty( ( self.order, len( x ) ), dtype=float )
+        sinb = numpy.empty( ( self.order, len( x ) ), dtype=float )
+        for k in range( self.order ) :
+            if k == 0 or ( self.reseed > 0 and k % self.reseed == 0 ) :
+                cosb[k] = numpy.cos( ( k + 1 ) * x )
+                sinb[k] = numpy.sin( ( k + 1 ) * x )
+            else :
+                ## cos( a + b ) and sin( a + b ), b being the fundamental
+                cosb[k] = cosb[k-1] * cosb[0] - sinb[k-1] * sinb[0]
+                sinb[k] = sinb[k-1] * cosb[0] + cosb[k-1] * sinb[0]
+
+        cosb.flags.writeable = False
+        sinb.flags.writeable = False
+        setatt( self, "_basis", ( numpy.array( xdata ), key, cosb, sinb ) )
+        return ( cosb, sinb )
 
     def baseName( self ):
         """ Returns a string representation of the model.  """
@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 
@@ -34,12 +33,15 @@ __status__ = "Development"
 
 class ImageAssistant( object ):
     """
-    ImageAssistant contains 2 methods to assist with more dimensional
+    ImageAssistant contains 3 methods to assist with more dimensional
     fitting.
 
     1. getIndices Generates indices for data arrays of any dimension.
        To be used as input in the Fitter classes.
-    2. resizeData Resizes the data arrays into a 1-dimensional array.
+    2. getGrid Generates the positions as a PixelGrid, which produces the
+       position columns only when they are needed.
+       To be used as input in the Fitter classes.
+    3. resizeData Resizes the data arrays into a 1-dimensional array.
        To be used as data in the Fitter.
 
 
@@ -107,26 +109,21 @@ class ImageAssistant( object ):
         numpy.array of ints : the indices of the pixels
 
         """
-        self.shape = ya.shape
+        return self.makeIndices( ya, dtype=int )
 
-        size = ya.size
-        rank = ya.ndim
-
-        if rank == 1:
-            return numpy.arange( size, dtype=int )
-        else:
-            kdata = numpy.zeros( ( size, rank ), dtype=int )
+    def makeIndices( self, ya, dtype=int ) :
+        """
+        Return the indices of the pixels in ya, as an array of type dtype.
+        """
+        self.shape = ya.shape
 
-            dd = 1
-            kr = rank - 1
-            for k in range( rank ) :
-                for i in range( size ) :
-                    kk = kr if self.order == 'C' else k
-                    kdata[i,kk] = ( i // dd ) % self.shape[kr]
-                dd *= self.shape[kr]
-                kr -= 1
+        if ya.ndim == 1:
+            return numpy.arange( ya.size, dtype=dtype )
 
-            return kdata
+        kdata = numpy.indices( self.shape, dtype=dtype ).reshape( ya.ndim, ya.size )
+        if self.order == 'F' :
+            kdata = kdata[::-1]
+        return kdata.transpose()
 
     def getPositions( self, ymap, order='C', center=True, deproject=None ) :
         """
@@ -150,7 +147,7 @@ class ImageAssistant( object ):
         -------
         numpy.array of floats : the positions of the pixels
         """
-        xdata = numpy.asarray( self.getIndices( ymap, order=order ), dtype=float )
+        xdata = self.makeIndices( ymap, dtype=float )
         if center :
             xdata += 0.5
         if deproject is not None :
@@ -158,6 +155,30 @@ class ImageAssistant( object ):
         return xdata
 
 
+    def getGrid( self, ymap, center=True ) :
+        """
+        Return the positions of the pixels in the map as a PixelGrid.
+
+        The grid behaves as the array returned by getPositions, but it keeps
+        only the positions along each axis. Columns are made when asked for.
+
+        Parameters
+        ----------
+        ymap : map
+            array of y ( data ) values for which an indexed array
+        center : bool
+            if True, return the positions of the center of the pixels.
+            otherwise the (left,lower) corner
+
+        Returns
+        -------
+        PixelGrid : the positions of the pixels
+        """
+        self.shape = ymap.shape
+        offset = 0.5 if center else 0.0
+        return PixelGrid( [numpy.arange( n, dtype=float ) + offset for n in self.shape],
+                          order=self.order )
+
     def getydata( self, ya ):
         """
         Return a copy of ya as a 1 dim array.
@@ -187,4 +208,106 @@ class ImageAssistant( object ):
         return numpy.reshape( res, shape, order=self.order )
 
 
+class PixelGrid( object ):
+    """
+    The positions of the pixels in a regular map, as generated by
+    ImageAssistant.getGrid().
+
+    A PixelGrid behaves as a 2-dimensional array of shape (size, rank), but
+    it only keeps the positions along each axis. A column, grid[:,k], is
+    made when it is asked for. Models can use the separability of the grid
+    to calculate a function on the axis values only and expand it afterwards.
+
+    Example
+    -------
+    >>> ymap = numpy.arange( 6, dtype=float ).reshape( 2, 3 )
+    >>> grid = ImageAssistant().getGrid( ymap )
+    >>> print( grid.shape )
+        (6,2)
+    >>> print( grid[:,1] )
+        [0.5 1.5 2.5 0.5 1.5 2.5]
+
+    Attributes
+    ----------
+    axes : list of array_like
+        positions along each of the axes, in the order of the map.
+    order : 'C' or 'F'
+        'C' the columns are in the order of the axes
+        'F' the columns are in reversed order
+
+    """
+    def __init__( self, axes, order='C' ) :
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        axes : list of array_like
+            positions along each of the axes, in the order of the map.
+        order : 'C' or 'F'
+            order of the columns
+        """
+        self.axes = [numpy.asarray( ax ) for ax in axes]
+        self.order = order
+        self.size = int( numpy.prod( [len( ax ) for ax in self.axes] ) )
+
+    @property
+    def shape( self ) :
+        return ( self.size, len( self.axes ) )
+
+    @property
+    def ndim( self ) :
+        return 2
+
+    def __len__( self ) :
+        return self.size
+
+    def axis( self, kcol ) :
+        """
+        Return the number of the map axis in column kcol.
+        """
+        return kcol if self.order == 'C' else len( self.axes ) - 1 - kcol
+
+    def expand( self, values, kcol ) :
+        """
+        Expand values, calculated at the axis positions of column kcol,
+        to all pixels of the grid.
+
+        Parameters
+        ----------
+        values : array_like
+            values along the axis; the first dimension is the axis
+        kcol : int
+            the column
+        """
+        ka = self.axis( kcol )
+        lens = [len( ax ) for ax in self.axes]
+        inner = int( numpy.prod( lens[ka+1:] ) )
+        outer = int( numpy.prod( lens[:ka] ) )
+        values = numpy.repeat( values, inner, axis=0 )
+        if outer == 1 :
+            return values
+        reps = ( outer, ) + ( 1, ) * ( values.ndim - 1 )
+        return numpy.tile( values, reps )
+
+    def column( self, kcol ) :
+        """
+        Return the positions of column kcol.
+        """
+        return self.expand( self.axes[self.axis( kcol )], kcol )
+
+    def __getitem__( self, key ) :
+        if ( isinstance( key, tuple ) and len( key ) == 2 and key[0] == slice( None ) and
+             numpy.ndim( key[1] ) == 0 ) :
+            return self.column( key[1] )
+        return self.toarray()[key]
+
+    def toarray( self ) :
+        """
+        Return the positions as a (size, rank) array.
+        """
+        return numpy.stack( [self.column( k ) for k in range( len( self.axes ) )], axis=1 )
 
+    def __array__( self, dtype=None, copy=None ) :
+        pos = self.toarray()
+        return pos if dtype is None else pos.astype( dtype )
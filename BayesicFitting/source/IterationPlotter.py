@@ -1,9 +1,7 @@
 import time
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
-import matplotlib.pyplot as pyplot
 
 __author__ = "Do Kester"
 __year__ = 2017
@@ -53,6 +51,7 @@ class IterationPlotter( object ):
         title : string
             the title of the plot
         """
+        import matplotlib.pyplot as pyplot
 
         self.p = pyplot.gca()
         self.p.plot( x, y, 'k.' )
@@ -72,6 +71,7 @@ class IterationPlotter( object ):
         iter : int
             iteration number
         """
+        import matplotlib.pyplot as pyplot
         self.p.plot( x, r, 'r-' )
         pyplot.show( block=False )
         time.sleep( 1 )
@@ -1,4 +1,5 @@
 import math as math
+import numpy as numpy
 
 from .Prior import Prior
 
@@ -55,6 +56,7 @@ class JeffreysPrior( Prior ):
     The default of lowLimit and _lowDomain is zero.
 
     """
+    VECTORIZED = True               # unit2Domain and domain2Unit accept arrays
 
     #  *********CONSTRUCTORS***************************************************
     def __init__( self, limits=None, prior=None ):
@@ -108,12 +110,15 @@ class JeffreysPrior( Prior ):
 
         Parameters
         ----------
-        dval : float
-            value within the domain of a parameter
+        dval : float or array_like
+            value(s) within the domain of a parameter
 
         """
-        u = ( math.log( dval ) - self._logLo ) / self._norm
-        if math.isnan( u ) :
+        if numpy.ndim( dval ) == 0 :
+            u = ( math.log( dval ) - self._logLo ) / self._norm
+        else :
+            u = ( numpy.log( dval ) - self._logLo ) / self._norm
+        if numpy.any( numpy.isnan( u ) ) :
             raise AttributeError( "Limits are needed for JeffreysPrior" )
         return u
 
@@ -125,12 +130,15 @@ class JeffreysPrior( Prior ):
 
         Parameters
         ----------
-        uval : float
-            value within [0,1]
+        uval : float or array_like
+            value(s) within [0,1]
 
         """
-        d = math.exp( uval * self._norm + self._logLo )
-        if math.isnan( d ) :
+        if numpy.ndim( uval ) == 0 :
+            d = math.exp( uval * self._norm + self._logLo )
+        else :
+            d = numpy.exp( numpy.asarray( uval ) * self._norm + self._logLo )
+        if numpy.any( numpy.isnan( d ) ) :
             raise AttributeError( "Limits are needed for JeffreysPrior" )
         return d
 
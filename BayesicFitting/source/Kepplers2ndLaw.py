@@ -48,9 +48,26 @@ class Kepplers2ndLaw( object ):
 
     The parameters are initialized at [0.0, 1.0, 1.0, 0.0].
 
+    The eccentric anomalies of the last call are kept, together with their
+    sine and cosine and the mean anomalies they solve. For the same mean
+    anomalies and eccentricity, they are returned without iteration. For other
+    values of the same length they serve as starting values for the iteration.
+
+    Attributes
+    ----------
+    anomalyCache : None or tuple
+        ( M, eccentricity, E, sinE, cosE ) of the last call
+
     """
     TWOPI = 2 * math.pi
     MAXITER = 100
+    WARMSTEP = 0.1
+
+    def __init__( self ) :
+        """
+        Constructor.
+        """
+        setatt( self, "anomalyCache", None )
 
     def meanAnomaly( self, xdata, params ) :
         """
@@ -200,6 +217,15 @@ class Kepplers2ndLaw( object ):
 
         E = M + e * sin( E )
 
+        The iteration continues only for the elements that have not yet converged.
+
+        When no Estart is given, the anomalies of the previous call are used.
+        For the same mean anomalies and eccentricity they are returned as is
+        (iter = 0); otherwise they are the starting values (see warmStart).
+        The mean anomalies are compared by value, so that xdata which are
+        changed in place are solved again. The returned E, and the sinE and
+        cosE attributes, are read only.
+
         Parameters
         ----------
         xdata : array_like
@@ -212,40 +238,81 @@ class Kepplers2ndLaw( object ):
         M = self.meanAnomaly( xdata, params )
         eccen = params[0]
 
+        cache = self.anomalyCache
+        if Estart is None and cache is not None and numpy.shape( cache[0] ) == numpy.shape( M ) :
+            if cache[1] == eccen and numpy.array_equal( cache[0], M ) :
+                setatt( self, "iter", 0 )
+                setatt( self, "sinE", cache[3] )
+                setatt( self, "cosE", cache[4] )
+                return cache[2]
+            Estart = self.warmStart( M, eccen, cache )
 
-        E = M[:] if Estart is None else Estart
+        E = numpy.array( M if Estart is None else Estart, dtype=float )
+        sinE = numpy.empty_like( E )
+        cosE = numpy.empty_like( E )
 
+        active = numpy.arange( E.size )
         iter = 0
         ## calculate the eccentric anomaly E
         while iter < self.MAXITER :
-            Ep = E
-            sinE = numpy.sin( Ep )
-            cosE = numpy.cos( Ep )
-            es = eccen * sinE
-            fx = M + es - Ep
-            fp = eccen * cosE - 1
-
-            E = Ep - 2 * fx * fp / ( 2 * fp * fp + fx * es )
+            Ep = E[active]
+            sa = numpy.sin( Ep )
+            ca = numpy.cos( Ep )
+            es = eccen * sa
+            fx = M[active] + es - Ep
+            fp = eccen * ca - 1
+
+            dE = - 2 * fx * fp / ( 2 * fp * fp + fx * es )
+            E[active] = Ep + dE
+            ## sine and cosine of the new E; dE is too small for higher orders once converged
+            sinE[active] = sa + ca * dE
+            cosE[active] = ca - sa * dE
             iter += 1
-            if all( numpy.abs( E - Ep ) < 1e-8 ) : break
+
+            active = active[numpy.abs( dE ) >= 1e-8]
+            if active.size == 0 : break
         else :
 #            # uncomment for more diagnostics
-#            q = numpy.where( numpy.abs( E - Ep ) > 1e-8 )
 #            print( "\n" )
 #            print( "params  ", fmt( params, max=None ) )
-#            print( "Ep      ", fmt( Ep[q] ) )
-#            print( "E       ", fmt( E[q] ) )
-#            print( "sinE    ", fmt( sinE[q] ) )
-#            print( "cosE    ", fmt( cosE[q] ) )
+#            print( "E       ", fmt( E[active] ) )
+#            print( "sinE    ", fmt( sinE[active] ) )
+#            print( "cosE    ", fmt( cosE[active] ) )
 
             print( "EA2: No convergence at iter %d for eccentricity %8.4f" % ( iter, eccen ) )
 
+        ## the arrays are kept in the cache and returned again: read only
+        for arr in [E, sinE, cosE] :
+            arr.flags.writeable = False
+
         setatt( self, "iter", iter )
         setatt( self, "sinE", sinE )
         setatt( self, "cosE", cosE )
+        setatt( self, "anomalyCache", ( M, eccen, E, sinE, cosE ) )
 
         return E
 
+    def warmStart( self, M, eccen, cache ) :
+        """
+        Return starting values for E from the anomalies of a previous call.
+
+        One Newton step from the previous E, with its sine and cosine, to the
+        solution for the present M and eccentricity. Where the step is larger
+        than WARMSTEP, the previous solution is too far off; there M is used.
+
+        Parameters
+        ----------
+        M : array_like
+            mean anomaly
+        eccen : float
+            eccentricity
+        cache : tuple
+            ( M, eccentricity, E, sinE, cosE ) of a previous call
+        """
+        E, sinE, cosE = cache[2:]
+        step = ( M + eccen * sinE - E ) / ( 1 - eccen * cosE )
+        return numpy.where( numpy.abs( step ) < self.WARMSTEP, E + step, M )
+
     def dEdM( self, xdata, params, cosE ) :
         """
         Return derivatives of E (eccentric anomaly) to mean anomaly
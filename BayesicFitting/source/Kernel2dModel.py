@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .Tools import setAttribute as setatt
@@ -74,6 +73,9 @@ class Kernel2dModel( NonLinearModel ):
 
     Beware: These models are unaware of anything outside their range.
 
+    For bound kernels the result and the partials are only calculated for the
+    xdata within the bounding box of the kernel; the others are 0.
+
     Author:      Do Kester
 
     Example
@@ -125,6 +127,7 @@ class Kernel2dModel( NonLinearModel ):
             self.shape2d = copy.shape2d
         else :
             self.setKernelShape( kernel, shape )
+        setatt( self, "_sorted", None )
 
     def copy( self ):
         """ Copy method.  """
@@ -199,7 +202,14 @@ class Kernel2dModel( NonLinearModel ):
             values for the parameters
 
         """
-        return self.shape2d.result( xdata, params )
+        window = self.getWindow( xdata, params )
+        if window is None :
+            return self.shape2d.result( xdata, params )
+
+        index, xwin = window
+        res = numpy.zeros( Tools.length( xdata ), dtype=float )
+        res[index] = self.shape2d.result( xwin, params )
+        return res
 
     def baseDerivative( self, xdata, params ):
         """
@@ -229,8 +239,86 @@ class Kernel2dModel( NonLinearModel ):
             list of indices of active parameters
 
         """
-        return self.shape2d.partial( xdata, params, parlist=parlist )
+        window = self.getWindow( xdata, params )
+        if window is None :
+            return self.shape2d.partial( xdata, params, parlist=parlist )
+
+        index, xwin = window
+        np = self.npbase if parlist is None else len( parlist )
+        partial = numpy.zeros( ( Tools.length( xdata ), np ), dtype=float )
+        partial[index] = self.shape2d.partial( xwin, params, parlist=parlist )
+        return partial
+
+    def getWindow( self, xdata, params ):
+        """
+        Return the xdata within the bounding box of a bound kernel.
 
+        Returns None when the kernel is not bound.
+        The xdata are either a PixelGrid, where the box is found per axis, or
+        an array, which is sorted on its first column, once for as long as the
+        same xdata are offered.
+
+        Parameters
+        ----------
+        xdata : array_like or PixelGrid
+            value at which to calculate the result
+        params : array_like
+            values for the parameters
+
+        Returns
+        -------
+        tuple of ( index, xwin )
+            index : index to the xdata within the box
+            xwin : the xdata within the box
+        """
+        if not self.kernel.isBound() or math.isinf( self.kernel.range ) :
+            return None
+
+        ## resultsq of some kernels is nonzero up to sqrt( range )
+        kr = max( self.kernel.range, math.sqrt( self.kernel.range ) ) * ( 1 + 1e-10 )
+        hw = [kr * w for w in self.shape2d.halfWidths( params )]
+        low = [params[1] - hw[0], params[2] - hw[1]]
+        high = [params[1] + hw[0], params[2] + hw[1]]
+
+        if Tools.isGrid( xdata ) :
+            return self.gridWindow( xdata, low, high )
+        if not isinstance( xdata, numpy.ndarray ) or xdata.ndim != 2 :
+            return None
+
+        setatt( self, "_sorted", Tools.sortData( xdata, cache=self._sorted ) )
+        index = Tools.windowIndex( self._sorted, low[0], high[0] )
+        if isinstance( index, slice ) :
+            index = numpy.arange( index.start, index.stop )
+        yin = xdata[index,1]
+        index = index[numpy.logical_and( yin >= low[1], yin <= high[1] )]
+        return ( index, xdata[index] )
+
+    def gridWindow( self, grid, low, high ):
+        """
+        Return the pixels of the grid within the box [low,high].
+
+        Parameters
+        ----------
+        grid : PixelGrid
+            positions of the pixels
+        low, high : list of float
+            corners of the box, per column
+        """
+        ranges = [None, None]
+        for kcol in range( 2 ) :
+            ax = grid.axes[grid.axis( kcol )]
+            if numpy.any( ax[1:] < ax[:-1] ) :
+                return None
+            lo = numpy.searchsorted( ax, low[kcol], side="left" )
+            hi = numpy.searchsorted( ax, high[kcol], side="right" )
+            ranges[grid.axis( kcol )] = numpy.arange( lo, hi )
+
+        i0, i1 = numpy.meshgrid( ranges[0], ranges[1], indexing="ij" )
+        index = ( i0 * len( grid.axes[1] ) + i1 ).ravel()
+        pix = [i0.ravel(), i1.ravel()]
+        xwin = numpy.stack( [grid.axes[grid.axis( k )][pix[grid.axis( k )]]
+                             for k in range( 2 )], axis=1 )
+        return ( index, xwin )
 
     def baseParameterUnit( self, k ):
         """
@@ -241,6 +329,7 @@ class Kernel2dModel( NonLinearModel ):
             the kth parameter.
 
         """
+        from astropy import units
         if k == 0:
             return self.yUnit
         if k == 5:
@@ -272,6 +361,10 @@ class Circle( BaseShape2d ):
     def __init__( self, npbase, kernel ) :
         super( Circle, self ).__init__( npbase, kernel )
 
+    def halfWidths( self, params ):
+        """ Return the half widths in x and y of the box around the unit circle.  """
+        return [abs( params[3] ), abs( params[3] )]
+
     def result( self, xdata, params ):
         return self.reslt( xdata, params, 3 )
 
@@ -312,6 +405,9 @@ class Ellipse( BaseShape2d ):
     def __init__( self, npbase, kernel ) :
         super( Ellipse, self ).__init__( npbase, kernel )
 
+    def halfWidths( self, params ):
+        return [abs( params[3] ), abs( params[4] )]
+
     def result( self, xdata, params ):
         return self.reslt( xdata, params, 4 )
 
@@ -354,6 +450,12 @@ class Rotated( BaseShape2d ):
     def __init__( self, npbase, kernel ) :
         super( Rotated, self ).__init__( npbase, kernel )
 
+    def halfWidths( self, params ):
+        c = math.cos( params[5] )
+        s = math.sin( params[5] )
+        return [math.hypot( params[3] * c, params[4] * s ),
+                math.hypot( params[3] * s, params[4] * c )]
+
     def result( self, xdata, params ):
         x = ( xdata[:,0] - params[1] )
         y = ( xdata[:,1] - params[2] )
@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .Tools import setAttribute as setatt
@@ -55,6 +54,10 @@ class KernelModel( NonLinearModel ):
 
     Beware: The "bound" models are unaware of anything outside their range.
 
+    For bound kernels only the xdata within the range of the kernel are
+    calculated; the others are 0. To find them quickly the xdata are sorted,
+    once for as long as the same xdata are offered.
+
     Author:      Do Kester
 
     Examples
@@ -107,6 +110,7 @@ class KernelModel( NonLinearModel ):
                     names=names, **kwargs )
 
         self.kernel = kernel
+        setatt( self, "_sorted", None )
         if copy is None :
             self.posIndex = [2]
             self.nonZero = [2]
@@ -134,8 +138,15 @@ class KernelModel( NonLinearModel ):
             values for the parameters.
 
         """
-        x = ( xdata - params[1] ) / params[2]
-        return params[0] * self.kernel.result( x )
+        win = self.getWindow( xdata, params )
+        if win is None :
+            x = ( xdata - params[1] ) / params[2]
+            return params[0] * self.kernel.result( x )
+
+        res = numpy.zeros( len( xdata ), dtype=float )
+        x = ( xdata[win] - params[1] ) / params[2]
+        res[win] = params[0] * self.kernel.result( x )
+        return res
 
     def basePartial( self, xdata, params, parlist=None ):
         """
@@ -151,19 +162,25 @@ class KernelModel( NonLinearModel ):
             list of indices active parameters (or None for all)
 
         """
-        partial = numpy.ndarray( ( Tools.length( xdata ), self.npbase ) )
-        x = ( xdata - params[1] ) / params[2]
+        if parlist is None :
+            parlist = range( self.npmax )
+
+        win = self.getWindow( xdata, params )
+        if win is None :
+            partial = numpy.ndarray( ( Tools.length( xdata ), self.npbase ) )
+            win = slice( None )
+        else :
+            partial = numpy.zeros( ( len( xdata ), self.npbase ), dtype=float )
+
+        x = ( xdata[win] - params[1] ) / params[2]
         dfdx = self.kernel.partial( x )
 
         parts = { 0 : ( lambda: self.kernel.result( x ) ),
                   1 : ( lambda: -params[0] * dfdx / params[2] ),
                   2 : ( lambda: -params[0] * dfdx * x / params[2] ) }
 
-        if parlist is None :
-            parlist = range( self.npmax )
-
         for k,kp in enumerate( parlist ) :
-            partial[:,k] = parts[kp]()
+            partial[win,k] = parts[kp]()
 
         return partial
 
@@ -180,8 +197,38 @@ class KernelModel( NonLinearModel ):
             values for the parameters.
 
         """
-        x = ( xdata - params[1] ) / params[2]
-        return params[0] * self.kernel.partial( x ) / params[2]
+        win = self.getWindow( xdata, params )
+        if win is None :
+            x = ( xdata - params[1] ) / params[2]
+            return params[0] * self.kernel.partial( x ) / params[2]
+
+        df = numpy.zeros( len( xdata ), dtype=float )
+        x = ( xdata[win] - params[1] ) / params[2]
+        df[win] = params[0] * self.kernel.partial( x ) / params[2]
+        return df
+
+    def getWindow( self, xdata, params ):
+        """
+        Return an index to the xdata within the range of a bound kernel.
+
+        Returns None when the kernel is not bound or when xdata is not a 1-d array.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values at which to calculate the result
+        params : array_like
+            values for the parameters.
+
+        """
+        if ( not isinstance( xdata, numpy.ndarray ) or xdata.ndim != 1 or
+                not self.kernel.isBound() or math.isinf( self.kernel.range ) ) :
+            return None
+
+        ## a tiny margin keeps the points at the edge of the range
+        hw = abs( params[2] ) * self.kernel.range * ( 1 + 1e-10 )
+        setatt( self, "_sorted", Tools.sortData( xdata, cache=self._sorted ) )
+        return Tools.windowIndex( self._sorted, params[1] - hw, params[1] + hw )
 
     def baseName( self ):
         """ Returns a string representation of the model.  """
@@ -191,6 +191,28 @@ class LaplaceErrorDistribution( ScaledErrorDistribution ):
             res = res * problem.weights
         return res
 
+    def logLdataBatch( self, problem, allparsMatrix, mockdata ) :
+        """
+        Return the log( likelihood ) for each residual, for K sets of parameters.
+
+        Parameters
+        ----------
+        problem : Problem
+            to be solved
+        allparsMatrix : array_like of shape (K,npars+nphypar)
+            K sets of parameters of the problem
+        mockdata : array_like of shape (K,N)
+            as calculated by the model for each parameter set
+
+        """
+        res = problem.residuals( None, mockdata=mockdata )
+
+        scale = allparsMatrix[:,-1:]
+        res = - numpy.abs( res ) / scale - ( self.LOG2 + numpy.log( scale ) )
+        if problem.weights is not None :
+            res = res * problem.weights
+        return res
+
     def partialLogL_alt( self, problem, allpars, fitIndex ) :
         """
         Return the partial derivative of log( likelihood ) to the parameters.
@@ -1,4 +1,5 @@
 import math
+import numpy as numpy
 
 from .Prior import Prior
 
@@ -61,6 +62,7 @@ class LaplacePrior( Prior ):
         high limit ( inactive for now)
 
     """
+    VECTORIZED = True               # unit2Domain and domain2Unit accept arrays
 
     #  *********CONSTRUCTOR***************************************************
     def __init__( self, center=0.0, scale=1.0, prior=None ):
@@ -94,10 +96,15 @@ class LaplacePrior( Prior ):
 
         Parameters
         ----------
-        dval : float
-            value within the domain of a parameter
+        dval : float or array_like
+            value(s) within the domain of a parameter
 
         """
+        if numpy.ndim( dval ) > 0 :
+            d = numpy.asarray( dval ) - self.center
+            e = 0.5 * numpy.exp( -numpy.abs( d ) / self.scale )
+            return numpy.where( d < 0, e, 1.0 - e )
+
         d = dval - self.center
         return ( 0.5 * math.exp(  d / self.scale ) if ( d < 0 ) else
            1.0 - 0.5 * math.exp( -d / self.scale ) )
@@ -112,10 +119,17 @@ class LaplacePrior( Prior ):
 
         Parameters
         ----------
-        uval : float
-            value within [0,1]
+        uval : float or array_like
+            value(s) within [0,1]
 
         """
+        if numpy.ndim( uval ) > 0 :
+            uval = numpy.asarray( uval, dtype=float )
+            high = uval > 0.5
+            with numpy.errstate( divide='ignore' ) :
+                lg = numpy.log( 2 * numpy.where( high, 1 - uval, uval ) ) * self.scale
+            return self.center + numpy.where( high, -lg, lg )
+
         if uval == 0 : return -math.inf
         elif uval == 1 : return math.inf
         scl = self.scale
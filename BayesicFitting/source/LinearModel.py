@@ -1,5 +1,6 @@
 import numpy as numpy
 from .Model import Model
+from .Tools import setAttribute as setatt
 
 __author__ = "Do Kester"
 __year__ = 2017
@@ -47,6 +48,12 @@ class LinearModel( Model ):
     ----------
     None of its own
 
+    Hidden Attributes
+    -----------------
+    _partialCache : None or dict
+        the partials kept by resultChange, for the xdata they were calculated at.
+        It is reset by Model.clearPartialCache.
+
     Attributes from Model
     ---------------------
         parameters, stdevs, npchain
@@ -107,3 +114,85 @@ class LinearModel( Model ):
 
         return res
 
+    def baseResultBatch( self, xdata, paramMatrix ):
+        """
+        Returns the base result of linear models for K parameter sets.
+
+        As the partials do not depend on the parameters, they are calculated
+        once and multiplied with all parameter sets.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values at which to calculate the result
+        paramMatrix : array_like of shape (K,npbase)
+            K sets of values for the parameters.
+
+        """
+        parlist = numpy.arange( self.npmax )
+        part = self.basePartial( xdata, paramMatrix[0], parlist=parlist )
+
+        return numpy.inner( paramMatrix, part )
+
+
+    def resultChange( self, xdata, oldpars, newpars, kpar, chained=True ):
+        """
+        Return the change in the result of this model, when the parameters
+        change from oldpars into newpars.
+
+        For linear models it is the sum of the changes in the parameters times
+        their partials. The partials do not depend on the parameters; they are
+        kept as long as the same xdata (object) are offered.
+        After changing the settings of the model or the xdata in place, call
+        `clearPartialCache()`. NestedSampler does so at the start of a run.
+
+        Parameters
+        ----------
+        xdata : array_like
+            input data
+        oldpars : array_like
+            old parameters for this model
+        newpars : array_like
+            new parameters for this model
+        kpar : list of int
+            indices of the changed parameters
+        chained : bool
+            whether the model is part of a compound model.
+
+        """
+        if self.fixed is not None or self.isDynamic() :
+            return super( LinearModel, self ).resultChange( xdata, oldpars, newpars,
+                            kpar, chained=chained )
+
+        self.checkParameter( oldpars )
+        self.checkParameter( newpars )
+
+        cache = self.__dict__.get( "_partialCache" )
+        if cache is None or cache["xdata"] is not xdata :
+            cache = { "xdata" : xdata, "partial" : self.basePartial( xdata, newpars ) }
+            setatt( self, "_partialCache", cache )
+
+        delta = 0.0
+        for k in kpar :
+            delta = delta + ( newpars[k] - oldpars[k] ) * cache["partial"][:,k]
+        return delta
+
+    def settingsSignature( self ) :
+        """
+        Return a signature of the settings of this model, as far as they define the partials.
+
+        The settings are the fixed parameters and the numeric attributes of the
+        model, like knots, order, degree, exponent or period. The parameters,
+        the stdevs and hidden attributes (starting with "_") are not part of it.
+
+        """
+        fixed = None if self.fixed is None else tuple( sorted( self.fixed.keys() ) )
+        signature = [fixed]
+        for name, value in sorted( self.__dict__.items() ) :
+            if name in ["parameters", "stdevs"] or name.startswith( "_" ) :
+                continue
+            if isinstance( value, ( int, float, list, tuple, numpy.ndarray ) ) :
+                value = numpy.asarray( value )
+                if value.dtype.kind in "biuf" :
+                    signature += [name, value.shape, value.tobytes()]
+        return tuple( signature )
@@ -210,6 +210,10 @@ class _Chisq( object ):
 
     It defines
     func (chisq), dfunc (dchisq/dp) and hess (hessian matrix).
+    funcAndGrad returns (func, dfunc) in one call.
+
+    The model result and the design matrix at the last parameters are kept,
+    so that func, dfunc and hessian at the same point share one model pass.
 
     """
 
@@ -230,6 +234,29 @@ class _Chisq( object ):
         self._data = data
         self._weights = weights
         self._index = index
+        self._par = None
+
+    def lastPoint( self, par, design=False ):
+        """
+        Evaluate the model at par, unless par is the same as last time.
+
+        It keeps the parameters, the model result (mock) and, on demand,
+        the design matrix.
+
+        Parameters
+        ----------
+        par : array_like
+            the parameters to be fitted
+        design : bool
+            also calculate the design matrix
+        """
+        if self._par is None or not numpy.array_equal( par, self._par ) :
+            self._par = numpy.array( par, dtype=float )
+            self._param = numpy.array( self._outer.insertParameters( par, index=self._index ) )
+            self._mock = self._outer.model.result( self._outer.xdata, self._param )
+            self._design = None
+        if design and self._design is None :
+            self._design = self._outer.getDesign( params=self._param, index=self._index )
 
     def func( self, par ):
         """
@@ -239,9 +266,15 @@ class _Chisq( object ):
             \chi^2 = \sum( D_i - F(x_i:p) )^2
 
         """
-        param = self._outer.insertParameters( par, index=self._index )
-        return self._outer.chiSquared( self._data, params=param,
-                    weights=self._weights )
+        self.lastPoint( par )
+        return self._outer.chiSquared( self._data, params=self._param,
+                    weights=self._weights, mockdata=self._mock )
+
+    def funcAndGrad( self, par ):
+        """
+        Return the function and its gradient, to be used with `jac=True`.
+        """
+        return ( self.func( par ), self.dfunc( par ) )
 
     def userdfunc( self, par ):
         """
@@ -256,19 +289,20 @@ class _Chisq( object ):
         .. math::
             d\chi^2/dp = -2 \sum( D_i - F_i ) dF_i/dp
         """
-        param = self._outer.insertParameters( par, index=self._index )
-        res = numpy.subtract( self._outer.model.result( self._outer.xdata, param ), self._data )
+        self.lastPoint( par, design=True )
+        res = numpy.subtract( self._mock, self._data )
         if self._weights is not None:
             res = numpy.multiply( res, self._weights )
-        desmat = self._outer.getDesign( params=param, index=self._index )
 
-        return 2 * numpy.inner( desmat.transpose(), res )
+        return 2 * numpy.inner( self._design.transpose(), res )
 
     def hessian( self, par ):
         """
         Return the Hessian matrix.
         """
-        return self._outer.getHessian( params=par, weights=self._weights, index=self._index )
+        self.lastPoint( par, design=True )
+        return self._outer.getHessian( params=self._param, weights=self._weights,
+                                       index=self._index, design=self._design )
 
 class _LogL( _Chisq ) :
     """
@@ -301,7 +335,7 @@ class _LogL( _Chisq ) :
 
         super( _LogL, self ).__init__( outer, data, weights, index=index )
 
-        self.problem = ClassicProblem( outer.model, xdata=outer.xdata, ydata=data,
+        self.problem = _LastPointProblem( outer.model, xdata=outer.xdata, ydata=data,
             weights=weights )
 
         if errdis == 'gauss' :
@@ -345,6 +379,12 @@ class _LogL( _Chisq ) :
 
         return - self.errdis.partialLogL( self.problem, param, self._index )
 
+    def funcAndGrad( self, par ) :
+        """
+        Return the function and its gradient, to be used with `jac=True`.
+        """
+        return ( self.func( par ), self.dfunc( par ) )
+
     def hessian( self, par ) :
         param = self._outer.insertParameters( par, index=self._index )
         param = numpy.append( param, self.hypar )
@@ -352,3 +392,34 @@ class _LogL( _Chisq ) :
         return - self.errdis.hessianLogL( self.problem, param, self._index )
 
 
+class _LastPointProblem( ClassicProblem ) :
+    """
+    Internal class: a ClassicProblem that keeps the result and the partials
+    at the last parameters.
+
+    The errordistribution calls result() and partial() for the logL, its gradient
+    and its hessian; at the same point they share one model pass.
+    The arrays returned are read-only.
+
+    """
+    def __init__( self, model=None, xdata=None, ydata=None, weights=None ) :
+        super( _LastPointProblem, self ).__init__( model=model, xdata=xdata,
+                ydata=ydata, weights=weights )
+        self._lastResult = ( None, None )
+        self._lastPartial = ( None, None )
+
+    def result( self, param ) :
+        param = numpy.asarray( param, dtype=float )
+        if not numpy.array_equal( param, self._lastResult[0] ) :
+            mock = super( _LastPointProblem, self ).result( param )
+            mock.flags.writeable = False
+            self._lastResult = ( param.copy(), mock )
+        return self._lastResult[1]
+
+    def partial( self, param ) :
+        param = numpy.asarray( param, dtype=float )
+        if not numpy.array_equal( param, self._lastPartial[0] ) :
+            dM = super( _LastPointProblem, self ).partial( param )
+            dM.flags.writeable = False
+            self._lastPartial = ( param.copy(), dM )
+        return self._lastPartial[1]
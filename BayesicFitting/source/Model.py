@@ -2,7 +2,6 @@ from __future__ import print_function
 
 import numpy as numpy
 import random
-from astropy import units
 import warnings
 
 from .FixedModel import FixedModel
@@ -113,12 +112,22 @@ class Model( FixedModel ):
         standard deviations after a fit to the data
     xUnit : astropy.units or list of
         unit of the x-values (list of in case of more dimensions)
+        Default: unitless; astropy is imported on first use.
     yUnit : astropy.units
         unit of the y-values
+        Default: unitless; astropy is imported on first use.
     npars : int (read only)
         number of parameters in this model
     npchain : int (read only)
         identical to npars
+    profiler : None or Profiler (class attribute)
+        when set, the result and partial of each component are timed
+
+    Hidden Attributes
+    -----------------
+    _priorGroups : None or dict
+        the parameters grouped by their prior, as kept by Engine.getPriorGroups
+        on the head of the chain. It is reset when the priors or the chain change.
 
     Attributes from FixedModel
     --------------------------
@@ -139,6 +148,8 @@ class Model( FixedModel ):
     DIV = 4
     PIP = 5
 
+    profiler = None
+
     #  *****CONSTRUCTOR*********************************************************
     def __init__( self, nparams=0, ndim=1, copy=None, params=None, **kwargs ):
         """
@@ -162,6 +173,7 @@ class Model( FixedModel ):
 
         setatt( self, "_next", None )
         setatt( self, "_head", self )
+        setatt( self, "_priorGroups", None )
 
         if params is None :
             params = numpy.zeros( nparams, dtype=float )
@@ -173,10 +185,7 @@ class Model( FixedModel ):
         setatt( self, "_npchain", nparams )
         setatt( self, "stdevs", None )
 
-        # xUnit is by default a (list[ndim] of) scalars, unitless
-        xUnit = units.Unit( 1.0 ) if ndim == 1 else [units.Unit( 1.0 )]*ndim
-        setatt( self, "xUnit", xUnit )
-        setatt( self, "yUnit", units.Unit( 1.0 ) )                  # scalar
+        # xUnit and yUnit are by default unitless; see __getattr__
         setatt( self, "_operation", self.NOP )
 
         if copy is None : return
@@ -193,8 +202,9 @@ class Model( FixedModel ):
         if copy.stdevs is not None :
             setatt( self, "stdevs", copy.stdevs.copy() )
 
-        setatt( self, "xUnit", copy.xUnit )
-        setatt( self, "yUnit", copy.yUnit )
+        for name in ["xUnit", "yUnit"] :
+            if name in copy.__dict__ :
+                setatt( self, name, copy.__dict__[name] )
 
     def copy( self ):
         """ Return a copy.  """
@@ -220,6 +230,7 @@ class Model( FixedModel ):
             setatt( self, name, value, type=float, islist=True, isnone=True )
 
         elif name in ['xUnit', 'yUnit'] :
+            from astropy import units
             isl = ( name == 'xUnit' and self.ndim == 2 )
             setatt( self, name, value, type=units.core.UnitBase, islist=isl, isnone=True )
 
@@ -237,6 +248,12 @@ class Model( FixedModel ):
         """
         if name == 'npars' or name == 'npchain' :
             return self._head._npchain
+        elif name == 'xUnit' or name == 'yUnit' :
+            ## xUnit is by default a (list[ndim] of) scalars, unitless
+            ## it is not stored, so astropy is only imported when units are used
+            from astropy import units
+            unit = units.Unit( 1.0 )
+            return [unit] * self.ndim if name == 'xUnit' and self.ndim > 1 else unit
 
         return super( Model, self ).__getattr__( name )
 
@@ -422,6 +439,7 @@ class Model( FixedModel ):
         while last._next != None:
             last = last._next
             setatt( last, "_head", self._head )
+        setatt( self._head, "_priorGroups", None )
 
         setatt( self, "_npchain", len( self.parameters ) + len( model.parameters ) )
 
@@ -489,10 +507,13 @@ class Model( FixedModel ):
 
         np = self.npbase
 
-        if not self._operation == self.PIP :
+        if self._operation == self.PIP :
+            nextres = None
+        elif self.profiler is None :
             nextres = super( Model, self ).result( xdata, param[:np] )
         else :
-            nextres = None
+            nextres = self.profiler.call( "result", super( Model, self ).shortName(),
+                            super( Model, self ).result, xdata, param[:np] )
         res = self.operate( res, param[:np], nextres )
         model = self._next
         if model is None :
@@ -501,6 +522,147 @@ class Model( FixedModel ):
         res = model._recursiveResult( xdata, param[np:], res )
         return res
 
+    def resultBatch( self, xdata, paramMatrix ):
+        """
+        Return the results of the model for K parameter sets at once.
+
+        The leading parameter axis is pushed through the chain of models.
+        Models that do not implement baseResultBatch are evaluated in a
+        loop over the parameter sets.
+
+        Parameters
+        ----------
+        xdata : array_like
+            input data
+        paramMatrix : array_like of shape (K,npars)
+            K sets of parameters for the model
+
+        Returns
+        -------
+        array of shape (K,N)
+        """
+        paramMatrix = numpy.array( paramMatrix, dtype=float, ndmin=2 )
+        xdata = Tools.toArray( xdata )
+        return self._recursiveResultBatch( xdata, paramMatrix, None )
+
+    def _recursiveResultBatch( self, xdata, paramMatrix, res ) :
+
+        np = self.npbase
+        pars = paramMatrix[:,:np]
+
+        if self._operation == self.PIP and res is not None :
+            res = numpy.asarray( [super( Model, self ).result( r, p )
+                                  for r, p in zip( res, pars )] )
+        else :
+            nextres = super( Model, self ).resultBatch( xdata, pars )
+            if nextres is None :
+                nextres = numpy.asarray( [super( Model, self ).result( xdata, p )
+                                          for p in pars] )
+            res = self.operate( res, pars, nextres )
+
+        model = self._next
+        if model is None :
+            return res
+
+        return model._recursiveResultBatch( xdata, paramMatrix[:,np:], res )
+
+    def updateResult( self, xdata, result, param, parval ):
+        """
+        Return the result of the model, updated from a previous result.
+
+        The previous result was calculated with the parameters in param,
+        except for those in parval, which had the old values.
+        For (compound) models that are sums of models, only the change of the
+        models that contain the changed parameters needs to be calculated.
+
+        None is returned when the update is not possible, i.e. the model chain
+        contains other operations than addition and subtraction, or the update
+        is not cheaper than a full calculation.
+
+        Parameters
+        ----------
+        xdata : array_like
+            input data
+        result : array_like
+            result of the model for the old parameters
+        param : array_like
+            (new) parameters for the model
+        parval : dict of {int : float}
+            int index of a changed parameter
+            float (old) value of the parameter
+
+        """
+        model = self
+        while model is not None :
+            if model._operation > self.SUB :
+                return None
+            model = model._next
+
+        changed = 0
+        model = self
+        np = 0
+        while model is not None :
+            npb = model.npbase
+            kpar = [k - np for k in parval if np <= k < np + npb]
+            if len( kpar ) > 0 :
+                newpars = numpy.array( param[np:np+npb], dtype=float )
+                oldpars = newpars.copy()
+                for k in kpar :
+                    oldpars[k] = parval[np+k]
+                delta = model.resultChange( xdata, oldpars, newpars, kpar,
+                                            chained=( self._next is not None ) )
+                if delta is None :
+                    return None
+                changed += 1
+                result = ( numpy.subtract( result, delta ) if model._operation == self.SUB
+                           else numpy.add( result, delta ) )
+            np += npb
+            model = model._next
+
+        return result if changed > 0 else numpy.array( result, dtype=float )
+
+    def clearPartialCache( self ):
+        """
+        Clear the partials kept by the linear models in the chain (see
+        `LinearModel.resultChange()`).
+
+        To be called when the settings of the models or the xdata have been
+        changed in place.
+        """
+        model = self
+        while model is not None :
+            setatt( model, "_partialCache", None )
+            model = model._next
+
+    def resultChange( self, xdata, oldpars, newpars, kpar, chained=True ):
+        """
+        Return the change in the result of this model, when the parameters
+        change from oldpars into newpars.
+
+        This model is taken in isolation, i.e. without the chain.
+        In this class the change is calculated as the difference of two results.
+        As that is not cheaper than a full calculation for a single model,
+        None is returned when the model is not part of a chain.
+
+        Parameters
+        ----------
+        xdata : array_like
+            input data
+        oldpars : array_like
+            old parameters for this model
+        newpars : array_like
+            new parameters for this model
+        kpar : list of int
+            indices of the changed parameters
+        chained : bool
+            whether the model is part of a compound model.
+
+        """
+        if not chained :
+            return None
+        return ( super( Model, self ).result( xdata, newpars ) -
+                 super( Model, self ).result( xdata, oldpars ) )
+
     def operate( self, res, pars, next ):
         if res is None or self._operation == self.NOP: # first one
             res = next
@@ -630,8 +792,11 @@ class Model( FixedModel ):
             xd = xdata if self._operation is not self.PIP else result
             if useNum:
                 nextpartial = super( Model, self ).numPartial( xd, par )
-            else:
+            elif self.profiler is None :
                 nextpartial = super( Model, self ).partial( xd, par )
+            else :
+                nextpartial = self.profiler.call( "partial", super( Model, self ).shortName(),
+                                super( Model, self ).partial, xd, par )
 
         else :
             inlen = Tools.length( xdata )
@@ -809,6 +974,7 @@ class Model( FixedModel ):
         np = self.npbase
         if k < np:
             super( Model, self  ).setPrior( k, prior=prior, **kwargs )
+            setatt( self._head, "_priorGroups", None )
         elif self._next != None:
             self._next.setPrior( k - np, prior=prior, **kwargs )
         else:
@@ -123,18 +123,33 @@ class MonteCarlo( object ):
         """
         if xdata is None :
             xdata = self.xdata
-        ninp = Tools.length( xdata )
-        sm1 = numpy.zeros( ninp )
-        sm2 = numpy.zeros( ninp )
-
-        for k in range( self.mcycles ) :
-            model = self.randomVariant( xdata )
-            sm1 += model
-            sm2 += numpy.square( model )
-        sm1 /= self.mcycles
-        sm2 /= self.mcycles
+
+        models = self.model.resultBatch( xdata, self.randomParameters( self.mcycles ) )
+        sm1 = numpy.mean( models, axis=0 )
+        sm2 = numpy.mean( numpy.square( models ), axis=0 )
         return numpy.sqrt( sm2  - sm1 * sm1 )
 
+    def randomParameters( self, ncycles ):
+        """
+        Return ncycles random variants of the parameters, as a (ncycles,npars) array.
+
+        Taking into account the stdev of the parameters and their covariance.
+
+        Parameters
+        ----------
+        ncycles : int
+            number of variants
+        """
+        nfit = self.model.npchain if self.index is None else len( self.index )
+        err = self._random.standard_normal( ( ncycles, nfit ) )
+        err = numpy.inner( self._eigenvalues * err, self._eigenvectors )
+        par = numpy.tile( self.model.parameters, ( ncycles, 1 ) )
+        if self.index is None :
+            par += err
+        else :
+            par[:,self.index] += err
+        return par
+
     def randomVariant( self, xdata ):
         """
         Return a random variant of the model result.
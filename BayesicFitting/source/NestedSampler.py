@@ -1,7 +1,6 @@
 from __future__ import print_function
 
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .Tools import setAttribute as setatt
@@ -9,14 +8,16 @@ from .Formatter import formatter as fmt
 from . import Plotter
 import sys
 import warnings
-import matplotlib.pyplot as plt
 
 from .Explorer import Explorer
 from .Model import Model
+from .Profiler import Profiler
+from .StopStart import StopStart
 from .Walker import Walker
 from .WalkerList import WalkerList
 from .Sample import Sample
 from .SampleList import SampleList
+from .SampleFile import SampleFile
 
 from .Problem import Problem
 from .ClassicProblem import ClassicProblem
@@ -184,8 +185,12 @@ class NestedSampler( object ):
         Engine that move the walkers around within the given constraint: logL > lowLogL
     initialEngine : Engine
         Engine that distributes the walkers over the available space
-    restart : StopStart (TBW)
-        write intermediate results to (optionally) start from.
+    restart : None or StopStart
+        write checkpoints to (optionally) restart from.
+    stream : None or SampleFile
+        file to write the samples into, in chunks (None : keep them in memory)
+    profiler : None or Profiler
+        collects timings and acceptance rates of the run (None : no profiling)
 
 
     Author       Do Kester.
@@ -199,7 +204,8 @@ class NestedSampler( object ):
     def __init__( self, xdata=None, model=None, ydata=None, weights=None,
                 problem=None, distribution=None, limits=None, keep=None, ensemble=100,
                 discard=1, seed=80409, rate=1.0, engines=None, maxsize=None,
-                threads=False, verbose=1 ) :
+                threads=False, processes=0, profile=False, restart=None, stream=None,
+                verbose=1 ) :
         """
         Create a new class, providing inputs and model.
 
@@ -282,6 +288,29 @@ class NestedSampler( object ):
             maximum size of the resulting sample list (None : no limit)
         threads : bool (False)
             Use Threads to distribute the diffusion of discarded samples over the available cores.
+        processes : int (0)
+            Number of worker processes to distribute the diffusion of discarded samples over.
+            Each process holds its own copy of the problem, distribution and engines.
+            It is most effective when discard > 1.
+            0 : do not use processes.
+        profile : bool or Profiler (False)
+            Collect the time spent in the engines, the likelihood and the model
+            components, and the acceptance rates of the engines per window.
+            The report is available from self.profiler, also as JSON.
+            True : use a Profiler with default window
+        restart : None or str or StopStart
+            Write checkpoints of the run. When the run is stopped, it restarts
+            from the last checkpoint at the next call to sample(). The
+            checkpoint is removed when the run finishes.
+            None : no checkpoints
+            str  : name of the checkpoint files for a `StopStart`
+        stream : None or str or SampleFile
+            Write the samples to a file in chunks, so that the memory does not
+            grow with the length of the run. Afterwards self.samples is a lazy
+            SampleList, memory-mapped onto the file. Only for static models;
+            it cannot be combined with maxsize.
+            None : keep the samples in memory
+            str  : name of the file for a `SampleFile`
         verbose : int (1)
             0 : silent
             1 : basic information
@@ -311,12 +340,16 @@ class NestedSampler( object ):
         object.__setattr__( self, "verbose", verbose )
 #        self.verbose = verbose
         self.rate = rate
-        self.restart = None                     ## TBD
+        self.restart = StopStart( restart ) if isinstance( restart, str ) else restart
+        self.stream = SampleFile( stream ) if isinstance( stream, str ) else stream
 
         self.minimumIterations = 100
         self.end = 2.0
         self.maxtrials = 5
         self.threads = threads
+        self.processes = processes
+        self.profiler = ( profile if isinstance( profile, Profiler ) else
+                          Profiler() if profile else None )
 
         self.iteration = 0
 
@@ -332,6 +365,12 @@ class NestedSampler( object ):
 
         self.setEngines( engines )
 
+        if self.stream is not None :
+            if model is None or model.isDynamic() :
+                raise ValueError( "Only samples of static models can be streamed" )
+            if maxsize is not None :
+                raise ValueError( "A stream cannot be combined with maxsize" )
+
         ## Initialize the sample list
         self.samples = SampleList( model, 0, ndata=self.problem.ndata )
 
@@ -409,140 +448,178 @@ class NestedSampler( object ):
             keep = self.keep
         fitIndex, allpars = self.makeFitlist( keep=keep )
 
-        self.initWalkers( allpars, fitIndex )
+        if self.profiler is not None :
+            self.profiler.reset()
+            self.profiler.start()
+            Model.profiler = self.profiler
 
-        for eng in self.engines :
-#            print( "Engine  ", eng )
-            eng.walkers = self.walkers
+        if self.problem.model :
+            ## the model settings or the xdata may have changed since the last run
+            self.problem.model.clearPartialCache( )
 
-        self.distribution.ncalls = 0                      #  reset number of calls
+        explorer = None
+        try :
+            self.initWalkers( allpars, fitIndex )
 
-        if isinstance( plot, str ) :
-            iterplot = plot == 'iter' or plot == 'all'
-            lastplot = plot == 'last' or plot == 'all'
-        else :
-            iterplot = False
-            lastplot = plot
+            for eng in self.engines :
+#                print( "Engine  ", eng )
+                eng.walkers = self.walkers
+                eng.profiler = self.profiler
 
-        self.plotData( plot=iterplot )
+            self.distribution.ncalls = 0                      #  reset number of calls
 
-        if self.verbose >= 1 :
-            print( "Fit", ( "all" if keep is None else fitIndex ), "parameters of" )
-            if self.problem.model :
-                print( " ", self.problem.model._toString( "  " ) )
+            if isinstance( plot, str ) :
+                iterplot = plot == 'iter' or plot == 'all'
+                lastplot = plot == 'last' or plot == 'all'
             else :
-                print( " ", self.problem )
-            print( "Using a", self.distribution, "with", end="" )
-            np = -1
-            cstr = " with "
-            for name,hyp in zip( self.distribution.PARNAMES, self.distribution.hyperpar ) :
-                print( cstr, end="" )
-                if np in fitIndex :
-                    print( "unknown %s" % name, end="" )
-                else :
-                    print( "%s = %7.2f " % (name, hyp.hypar), end="" )
-                np -= 1
-                cstr = " and "
-            print( "\nMoving the walkers with ", end="" )
-            for eng in self.engines :
-                print( " ", eng, end="" )
-            print( "" )
-            if self.threads :
-                print( "Using threads." )
+                iterplot = False
+                lastplot = plot
 
-        if self.verbose > 1 :
-            print( "Iteration   logZ        H     LowL     npar    parameters" )
+            self.plotData( plot=iterplot )
 
+            if self.verbose >= 1 :
+                print( "Fit", ( "all" if keep is None else fitIndex ), "parameters of" )
+                if self.problem.model :
+                    print( " ", self.problem.model._toString( "  " ) )
+                else :
+                    print( " ", self.problem )
+                print( "Using a", self.distribution, "with", end="" )
+                np = -1
+                cstr = " with "
+                for name,hyp in zip( self.distribution.PARNAMES, self.distribution.hyperpar ) :
+                    print( cstr, end="" )
+                    if np in fitIndex :
+                        print( "unknown %s" % name, end="" )
+                    else :
+                        print( "%s = %7.2f " % (name, hyp.hypar), end="" )
+                    np -= 1
+                    cstr = " and "
+                print( "\nMoving the walkers with ", end="" )
+                for eng in self.engines :
+                    print( " ", eng, end="" )
+                print( "" )
+                if self.threads :
+                    print( "Using threads." )
+                if self.processes > 0 :
+                    print( "Using %d processes." % self.processes )
 
-        explorer = Explorer( self, threads=self.threads )
+            if self.verbose > 1 :
+                print( "Iteration   logZ        H     LowL     npar    parameters" )
 
-        self.logZ = -sys.float_info.max
-        self.info = 0
 
-        logWidth = math.log( 1.0 - math.exp( (-1.0 * self.discard ) / self.ensemble) )
+            self.logZ = -sys.float_info.max
+            self.info = 0
 
-#        for w in self.walkers :
-#            print( w.id, w.allpars, w.logL )
+            logWidth = math.log( 1.0 - math.exp( (-1.0 * self.discard ) / self.ensemble) )
 
-        if self.optionalRestart() :
-            logWidth -= self.iteration * ( 1.0 * self.discard ) / self.ensemble
+#            for w in self.walkers :
+#                print( w.id, w.allpars, w.logL )
 
-        self.engines[0].calculateUnitRange()
+            if self.stream is not None :
+                self.stream.start()
+            logWidth = self.optionalRestart( logWidth )
 
-        for eng in self.engines :
-            eng.unitRange = self.engines[0].unitRange
-            eng.unitMin   = self.engines[0].unitMin
-#            print( eng, "  ",  eng.unitRange )
+            explorer = Explorer( self, threads=self.threads, processes=self.processes )
 
-        while self.iteration < self.getMaxIter( ):
+            self.engines[0].calculateUnitRange()
 
-            #  find worst walker(s) in ensemble
-            worst = self.findWorst()
-            worstLogW = logWidth + self.walkers[worst[-1]].logL
+            for eng in self.engines :
+                eng.unitRange = self.engines[0].unitRange
+                eng.unitMin   = self.engines[0].unitMin
+#                print( eng, "  ",  eng.unitRange )
+
+            if self.profiler is not None :
+                self.profiler.checkWindow( self.iteration, self.engines )
+
+            while self.iteration < self.getMaxIter( ):
+
+                #  find worst walker(s) in ensemble
+                worst = self.findWorst()
+                worstLogW = logWidth + self.walkers[worst[-1]].logL
+
+                # Keep posterior samples
+                self.storeSamples( worst, worstLogW - math.log( self.discard ) )
+
+                # Update Evidence Z and Information H
+                logZnew = numpy.logaddexp( self.logZ, worstLogW )
+
+                self.info = ( math.exp( worstLogW - logZnew ) * self.lowLhood +
+                        math.exp( self.logZ - logZnew ) * ( self.info + self.logZ ) - logZnew )
+                if math.isnan( self.info ) :
+                    self.info = 0.0
+                self.logZ = logZnew
+
+                if self.verbose >= 3 or ( self.verbose >= 1 and
+                                          self.iteration % 100 == 0 ):
+                    if self.verbose == 1 :
+#                        if self.iteration == 0 or ( self.iteration % 5000 ) > 0 :
+                        if ( self.iteration / 100 ) % 50 == 49 :
+                            nwln = "\n"
+                        else :
+                            nwln = ""
+                        print( ">", end=nwln, flush=True )
+                    else :
+                        kw = worst[0]
+                        pl = self.walkers[kw].allpars[self.walkers[kw].fitIndex]
+                        np = len( pl )
+#                       scale = self.getScale( self.walker[kw] )
+                        print( "%8d %8.1f %8.1f %8.1f %6d "%( self.iteration, self.logZ,
+                            self.info, self.lowLhood, np ), fmt( pl ) )
 
-            # Keep posterior samples
-            self.storeSamples( worst, worstLogW - math.log( self.discard ) )
+                    self.plotResult( self.walkers[worst[0]], self.iteration, plot=iterplot )
 
-            # Update Evidence Z and Information H
-            logZnew = numpy.logaddexp( self.logZ, worstLogW )
+                self.samples.weed( self.maxsize )        # remove overflow in samplelist
+                self.optionalWrite( )                    # write a full chunk to the stream
 
-            self.info = ( math.exp( worstLogW - logZnew ) * self.lowLhood +
-                    math.exp( self.logZ - logZnew ) * ( self.info + self.logZ ) - logZnew )
-            if math.isnan( self.info ) :
-                self.info = 0.0
-            self.logZ = logZnew
+                self.iteration += 1
+                self.copyWalker( worst )
 
-            if self.verbose >= 3 or ( self.verbose >= 1 and
-                                      self.iteration % 100 == 0 ):
-                if self.verbose == 1 :
-#                    if self.iteration == 0 or ( self.iteration % 5000 ) > 0 :
-                    if ( self.iteration / 100 ) % 50 == 49 :
-                        nwln = "\n"
-                    else :
-                        nwln = ""
-                    print( ">", end=nwln, flush=True )
-                else :
-                    kw = worst[0]
-                    pl = self.walkers[kw].allpars[self.walkers[kw].fitIndex]
-                    np = len( pl )
-#                   scale = self.getScale( self.walker[kw] )
-                    print( "%8d %8.1f %8.1f %8.1f %6d "%( self.iteration, self.logZ,
-                        self.info, self.lowLhood, np ), fmt( pl ) )
+                # Explore the copied walker(s)
+                explorer.explore( worst, self.lowLhood )
 
-                self.plotResult( self.walkers[worst[0]], self.iteration, plot=iterplot )
+                if self.profiler is not None :
+                    self.profiler.checkWindow( self.iteration, self.engines )
 
-            self.samples.weed( self.maxsize )        # remove overflow in samplelist
+                # Shrink the interval
+                logWidth -= ( 1.0 * self.discard ) / self.ensemble
 
-            self.iteration += 1
-            self.copyWalker( worst )
+                self.optionalSave( logWidth )
 
-            # Explore the copied walker(s)
-            explorer.explore( worst, self.lowLhood )
+                self.engines[0].calculateUnitRange()
+                for eng in self.engines :
+                    eng.unitRange = self.engines[0].unitRange
+                    eng.unitMin   = self.engines[0].unitMin
+#                        print( eng, "  ",  eng.unitRange )
 
-            # Shrink the interval
-            logWidth -= ( 1.0 * self.discard ) / self.ensemble
+            else :
+                if self.verbose > 0 :
+                    if self.verbose == 1 :
+                        print( "\nIteration   logZ        H     LowL     npar    parameters" )
+                    kw = worst[0]
+                    pl = self.walkers[kw].allpars[self.walkers[kw].fitIndex]
+                    np = len( pl )
+                    print( "%8d %8.1f %8.1f %8.1f %6d "%( self.iteration, self.logZ,
+                            self.info, self.lowLhood, np ), fmt( pl, max=None ) )
 
-            self.optionalSave( )
+        finally :
+            # End of Sampling
+            if explorer is not None :
+                explorer.close()
+            if self.profiler is not None :
+                Model.profiler = None
 
-            self.engines[0].calculateUnitRange()
-            for eng in self.engines :
-                eng.unitRange = self.engines[0].unitRange
-                eng.unitMin   = self.engines[0].unitMin
-#                    print( eng, "  ",  eng.unitRange )
+        if self.restart is not None :
+            self.restart.finish( )
 
-        else :
-            if self.verbose > 0 :
-                if self.verbose == 1 :
-                    print( "\nIteration   logZ        H     LowL     npar    parameters" )
-                kw = worst[0]
-                pl = self.walkers[kw].allpars[self.walkers[kw].fitIndex]
-                np = len( pl )
-                print( "%8d %8.1f %8.1f %8.1f %6d "%( self.iteration, self.logZ,
-                        self.info, self.lowLhood, np ), fmt( pl, max=None ) )
+        self.addEnsembleToSamples( logWidth )
 
+        if self.stream is not None :
+            self.stream.write( self.samples )
+            self.samples = self.stream.open( self.problem.model, ndata=self.problem.ndata )
 
-        # End of Sampling
-        self.addEnsembleToSamples( logWidth )
+        if self.profiler is not None :
+            self.profiler.checkWindow( self.iteration, self.engines, last=True )
+            self.profiler.stop()
 
         # Calculate weighted average and stdevs for the parameters;
         self.samples.LogZ = self.logZ
@@ -570,22 +647,42 @@ class NestedSampler( object ):
 #       return self.distribution.getScale( walker.model, params=walker.allpars[:np] )
 
 #  ===================================================================================
-    def optionalRestart( self ):
-
-        if self.restart is not None and self.restart.wantRestore( ):
-            self.walkers, self.samples = self.restart.restore( self.walkers, self.samples )
-            self.logZ = self.walkers.logZ
-            self.info = self.walkers.info
-            self.iteration = self.walkers.iteration
-            return True
-        return False
-
-    def optionalSave( self ):
-        if self.restart is not None and self.restart.wantSave( ) and self.iteration % 100 == 0:
-            self.walkers.logZ = self.logZ
-            self.walkers.info = self.info
-            self.walkers.iteration = self.iteration
-            self.restart.save( self.walkers, self.samples )
+    def optionalRestart( self, logWidth ):
+        """
+        Return the logWidth, restored from the checkpoint when there is one.
+
+        Parameters
+        ----------
+        logWidth : float
+            log of the width of the first prior mass interval
+        """
+        if self.restart is None :
+            return logWidth
+        if not self.restart.wantRestore( ) :
+            self.restart.start( )
+            return logWidth
+
+        logWidth = self.restart.resume( self )
+        if self.verbose >= 1 :
+            print( "Restart from iteration %d" % self.iteration )
+        return logWidth
+
+    def optionalSave( self, logWidth ):
+        """
+        Write a checkpoint when it is due.
+
+        Parameters
+        ----------
+        logWidth : float
+            log of the width of the present prior mass interval
+        """
+        if self.restart is not None and self.restart.wantSave( self.iteration ) :
+            self.restart.checkpoint( self, logWidth )
+
+    def optionalWrite( self ):
+        """ Write the samples to the stream when a chunk is full.  """
+        if self.stream is not None and self.stream.wantWrite( self.samples ) :
+            self.stream.write( self.samples )
 
     def storeSamples( self, worst, worstLogW ):
         for kw in worst :
@@ -599,17 +696,20 @@ class NestedSampler( object ):
         Find discard bad points in ensemble. In order worse to better.
         lowLhood is the "best" in the bad points.
 
+        The logLs of the ensemble are partitioned around the discard-th lowest.
+        Walkers with equal logL are taken in order of their index.
+
         """
-        worst = []
-        for k in range( self.discard ) :
-            self.lowLhood = sys.float_info.max
-            for i in range( self.ensemble ):
-                if self.walkers[i].logL < self.lowLhood :
-                    if i in worst :
-                        continue
-                    bad = i
-                    self.lowLhood = self.walkers[i].logL
-            worst += [bad]
+        logL = self.walkers.logL[:self.ensemble].copy()
+        if self.discard == 1 :
+            worst = [int( numpy.argmin( logL ) )]
+        else :
+            cut = numpy.partition( logL, self.discard - 1 )[self.discard - 1]
+            bad = numpy.flatnonzero( logL <= cut )
+            bad = bad[numpy.argsort( logL[bad], kind="stable" )[:self.discard]]
+            worst = [int( k ) for k in bad]
+
+        self.lowLhood = float( logL[worst[-1]] )
         return worst
 
     def copyWalker( self, worst ):
@@ -625,8 +725,8 @@ class NestedSampler( object ):
                 if kcp >= sworst[kk] :
                     kcp += 1
             self.walkers.copy( kcp, worst[k] )
-            setatt( self.walkers[worst[k]], "parent", kcp )
-            setatt( self.walkers[worst[k]], "start", self.iteration )
+            self.walkers[worst[k]].parent = kcp
+            self.walkers[worst[k]].start = self.iteration
 #            wlkr = self.walkers[worst[k]]
 #            print( k, worst[k], wlkr.id, wlkr.parent, wlkr.start, self.iteration )
 
@@ -635,23 +735,13 @@ class NestedSampler( object ):
         """
         Add the ensemble walkers to the samples
         """
-        done = [False] * self.ensemble
-
-        for nest in range( self.ensemble ):
-            # skip walkers already done
-            worst = 0
-            while done[worst] : worst += 1
+        logL = self.walkers.logL[:self.ensemble].copy()
 
-            #  find worst walker in ensemble not yet handled
-            self.lowLhood = self.walkers[worst].logL
-            for i in range( worst+1, self.ensemble ) :
-                logl = self.walkers[i].logL
-                if logl < self.lowLhood and not done[i]:
-                    worst = i
-                    self.lowLhood = logl
+        #  from worst to best; equal logLs in order of index
+        for worst in numpy.argsort( logL, kind="stable" ) :
+            self.lowLhood = float( logL[worst] )
 
             worstLogW = logWidth + self.lowLhood
-#            self.walkers[worst].logW = worstLogW
 
             # Update Evidence Z and Information H
             logZnew = numpy.logaddexp( self.logZ, worstLogW )
@@ -662,9 +752,6 @@ class NestedSampler( object ):
             # Keep posterior sample
             smpl = self.walkers[worst].toSample( worstLogW )
             self.samples.add( smpl )
-#            self.samples.add( self.walkers, worst )
-
-            done[worst] = True
 
 
     #  *********INTERNALS***************************************************
@@ -898,8 +985,13 @@ class NestedSampler( object ):
                 raise ValueError( "Unknown StartEngine name : %10s" % name )
 
         # Calculate logL for all walkers.
+        self.initialEngine.profiler = self.profiler
         for walker in self.walkers :
-            self.initialEngine.execute( walker, -math.inf )
+            if self.profiler is None :
+                self.initialEngine.execute( walker, -math.inf )
+            else :
+                self.profiler.call( "engines", str( self.initialEngine ),
+                                    self.initialEngine.execute, walker, -math.inf )
 
         # Find best in ensemble and copy it into the last, extra position.
         lbest = self.walkers[0].logL
@@ -911,6 +1003,7 @@ class NestedSampler( object ):
         self.walkers.copy( kbest, -1 )
 
     def plotData( self, plot=False ):
+        import matplotlib.pyplot as plt
         if not plot :
             return
         plt.figure( 'iterplot' )
@@ -918,6 +1011,7 @@ class NestedSampler( object ):
         plt.show( block=False )
 
     def plotResult( self, walker, iter, plot=False ):
+        import matplotlib.pyplot as plt
         if not plot :
             return
 
@@ -958,5 +1052,8 @@ class NestedSampler( object ):
         print( "Samples  %10d" % len( self.samples ) )
         print( "Evidence    %10.3f +- %10.3f" % (self.evidence, self.precision ) )
 
+        if self.profiler is not None :
+            self.profiler.printReport()
+
 
 
@@ -1,7 +1,5 @@
 import numpy as numpy
 import math as math
-import matplotlib.pyplot as plt
-import matplotlib.gridspec as gridspec
 from numpy.testing import assert_array_almost_equal as assertAAE
 from . import Tools
 from .Formatter import formatter as fmt
@@ -52,6 +50,8 @@ def plotFit( x, data=None, yfit=None, model=None, fitter=None, show=True,
     residuals : bool
         plot the residuals in a separate panel
     """
+    import matplotlib.pyplot as plt
+    import matplotlib.gridspec as gridspec
 
     minx = numpy.min( x )
     maxx = numpy.max( x )
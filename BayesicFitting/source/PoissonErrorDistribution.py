@@ -159,6 +159,28 @@ class PoissonErrorDistribution( ErrorDistribution ):
 
         return lld
 
+    def logLdataBatch( self, problem, allparsMatrix, mockdata ) :
+        """
+        Return the log( likelihood ) for each residual, for K sets of parameters.
+
+        Parameters
+        ----------
+        problem : Problem
+            to be solved
+        allparsMatrix : array_like of shape (K,npars+nphypar)
+            K sets of parameters of the problem
+        mockdata : array_like of shape (K,N)
+            as calculated by the model for each parameter set
+
+        """
+        lfdata = logFactorial( problem.ydata )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter( "ignore", category=RuntimeWarning )
+            lld = problem.ydata * numpy.log( mockdata ) - mockdata - lfdata
+
+        return numpy.where( numpy.isfinite( lld ), lld, -math.inf )
+
     def partialLogL_alt( self, problem, allpars, fitIndex ):
         """
         Return the partial derivative of log( likelihood ) to the parameters.
@@ -120,7 +120,9 @@ class PolySurfaceModel( LinearModel ):
             values for the parameters.
 
         """
-        nx = Tools.length( xdata[:,0] )
+        x0 = xdata[:,0]
+        x1 = xdata[:,1]
+        nx = Tools.length( x0 )
         part = numpy.zeros( ( nx, self.npmax ), dtype=float )
         n = 0
         for d in range( self.degree + 1 ) :
@@ -128,13 +130,13 @@ class PolySurfaceModel( LinearModel ):
             i = 0
             while i <= d :
                 part[:,n+i] = x
-                x *= xdata[:,1]
+                x *= x1
                 i += 1
             x = numpy.ones( nx, dtype=float )
             i = d
             while i >= 0 :
                 part[:,n+i] *= x
-                x *= xdata[:,0]
+                x *= x0
                 i -= 1
             n += d + 1
         if parlist is None :
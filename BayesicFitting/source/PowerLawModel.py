@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .NonLinearModel import NonLinearModel
@@ -171,6 +170,7 @@ class PowerLawModel( NonLinearModel ):
             parameter number.
 
         """
+        from astropy import units
         if k == 0:
             return self.yUnit
         if k == 1:
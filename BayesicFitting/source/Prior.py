@@ -37,6 +37,9 @@ class Prior( object ):
 
     Two methods need to be defined which map the values between [0,1]
     on to the domain, and vice versa: unit2Domain and domain2Unit.
+    They take and return a float. A subclass whose methods also take and
+    return arrays, sets the class attribute VECTORIZED to True; the Engines
+    then transform all parameters with the same prior in one call.
 
     The copy method is also necessary.
 
@@ -57,6 +60,7 @@ class Prior( object ):
         upper limit of the Priors possible values
 
     """
+    VECTORIZED = False              # unit2Domain and domain2Unit take floats only
 
     #*********CONSTRUCTORS***************************************************
     def __init__( self, limits=None, prior=None ):
@@ -159,6 +159,41 @@ class Problem( object ):
         """
         pass
 
+    def resultBatch( self, paramMatrix ):
+        """
+        Returns the results for K parameter sets at once, as a (K,N) array.
+
+        In this (base)class it is a placeholder, returning None.
+        It indicates that the problem does not support batch evaluation.
+
+        Parameters
+        ----------
+        paramMatrix : array_like of shape (K,npars)
+            K sets of values for the parameters.
+
+        """
+        return None
+
+    def updateResult( self, result, param, parval ):
+        """
+        Returns the result, updated from a previous result, after a change in
+        a few parameters.
+
+        In this (base)class it is a placeholder, returning None.
+        It indicates that the problem does not support updating.
+
+        Parameters
+        ----------
+        result : array_like
+            result for the old parameters.
+        param : array_like
+            (new) values for the parameters.
+        parval : dict of {int : float}
+            int index of a changed parameter
+            float (old) value of the parameter
+
+        """
+        return None
 
     def residuals( self, param, mockdata=None ) :
         """
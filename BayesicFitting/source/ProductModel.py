@@ -2,7 +2,6 @@ import numpy as numpy
 from . import Tools
 from .Model import Model
 from .NonLinearModel import NonLinearModel
-from astropy import units
 
 __author__ = "Do Kester"
 __year__ = 2017
@@ -226,6 +225,7 @@ class ProductModel( NonLinearModel ):
             the kth parameter.
 
         """
+        from astropy import units
         u = units.Unit( 1.0 )
         n = 0
         print( self.attsingle )
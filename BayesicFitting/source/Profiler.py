@@ -0,0 +1,250 @@
+import json
+import time
+import threading
+
+__author__ = "Do Kester"
+__year__ = 2020
+__license__ = "GPL3"
+__version__ = "0.9"
+__maintainer__ = "Do"
+__status__ = "Development"
+
+#  *
+#  * This file is part of the BayesicFitting package.
+#  *
+#  * BayesicFitting is free software: you can redistribute it and/or modify
+#  * it under the terms of the GNU Lesser General Public License as
+#  * published by the Free Software Foundation, either version 3 of
+#  * the License, or ( at your option ) any later version.
+#  *
+#  * BayesicFitting is distributed in the hope that it will be useful,
+#  * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  * GNU Lesser General Public License for more details.
+#  *
+#  * The GPL3 license can be found at <http://www.gnu.org/licenses/>.
+#  *
+#  *    2020 Do Kester
+
+class Profiler( object ):
+    """
+    Profiler collects counts and timings of a NestedSampler run.
+
+    It is switched on by NestedSampler( ..., profile=True ). Without it the
+    engines and the models only check that no profiler is present.
+
+    The wall time is split over
+        engines     time spent in Engine.execute, per engine
+        likelihood  time spent in the error distribution, per method
+        result      time spent in the result of each model component
+        partial     time spent in the partials of each model component
+    The time in the engines outside the likelihood is the engine overhead.
+    Model components inside a bracket are also counted in their bracket.
+
+    The acceptance rates of the engines are kept per window of iterations.
+
+    The profiler is shared by the threads of the Explorer. The worker processes
+    each have their own; their timings are merged into this one.
+
+    Attributes
+    ----------
+    window : int (100)
+        number of iterations per window of acceptance rates
+    timings : dict of { str : dict of { str : [int, float] } }
+        number of calls and seconds, per group and per name
+    windows : list of dict
+        acceptance counts of the engines per window
+    wall : float
+        wall time of the run (seconds)
+
+    Author       Do Kester.
+
+    """
+    GROUPS = ["engines", "likelihood", "result", "partial"]
+
+    def __init__( self, window=100 ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        window : int (100)
+            number of iterations per window of acceptance rates
+        """
+        self.window = window
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset( self ):
+        """ Remove all collected numbers.  """
+        self.timings = {grp : {} for grp in self.GROUPS}
+        self.windows = []
+        self.wall = 0.0
+        self._tstart = None
+        self._last = None
+
+    def __getstate__( self ):
+        """ Return the state without the lock, which cannot be pickled.  """
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__( self, state ):
+        self.__dict__.update( state )
+        self.lock = threading.Lock()
+
+    def start( self ):
+        """ Start the wall clock.  """
+        self._tstart = time.perf_counter()
+
+    def stop( self ):
+        """ Stop the wall clock.  """
+        if self._tstart is not None :
+            self.wall += time.perf_counter() - self._tstart
+            self._tstart = None
+
+    def add( self, group, name, seconds, calls=1 ):
+        """
+        Add calls and seconds to the name in the group.
+
+        Parameters
+        ----------
+        group : str
+            one of GROUPS
+        name : str
+            name of the engine, method or model component
+        seconds : float
+            time spent
+        calls : int
+            number of calls
+        """
+        with self.lock :
+            entry = self.timings[group].setdefault( name, [0, 0.0] )
+            entry[0] += calls
+            entry[1] += seconds
+
+    def call( self, group, name, method, *args, **kwargs ):
+        """
+        Return the result of method( *args, **kwargs ), timing the call.
+
+        Parameters
+        ----------
+        group : str
+            one of GROUPS
+        name : str
+            name of the engine, method or model component
+        method : callable
+            to be timed
+        args, kwargs : arguments
+            for the method
+        """
+        tim = time.perf_counter()
+        res = method( *args, **kwargs )
+        self.add( group, name, time.perf_counter() - tim )
+        return res
+
+    def merge( self, timings ):
+        """
+        Add the timings of another profiler, e.g. of a worker process.
+
+        Parameters
+        ----------
+        timings : dict
+            as in the attribute timings
+        """
+        for group, entries in timings.items() :
+            for name, ( calls, seconds ) in entries.items() :
+                self.add( group, name, seconds, calls=calls )
+
+    def checkWindow( self, iteration, engines, last=False ):
+        """
+        Store the acceptance counts of the engines at the end of a window.
+
+        The first call marks the begin of the first window.
+
+        Parameters
+        ----------
+        iteration : int
+            present iteration
+        engines : list of Engine
+            the engines of the NestedSampler
+        last : bool
+            store the (incomplete) window at the end of the run
+        """
+        if self._last is not None and ( iteration == self._last[0] or
+                not ( last or iteration % self.window == 0 ) ) :
+            return
+
+        reports = [list( eng.report ) for eng in engines]
+        if self._last is None :
+            self._last = ( iteration, reports )
+            return
+
+        begin, previous = self._last
+        wind = { "begin" : begin, "end" : iteration, "engines" : {} }
+        for eng, rep, prev in zip( engines, reports, previous ) :
+            success, reject, failed = [r - p for r, p in zip( rep[:3], prev[:3] )]
+            trials = success + reject + failed
+            wind["engines"][str( eng )] = { "success" : success, "reject" : reject,
+                        "failed" : failed,
+                        "acceptance" : ( success / trials if trials > 0 else 0.0 ) }
+        self.windows += [wind]
+        self._last = ( iteration, reports )
+
+    def getReport( self ):
+        """
+        Return the collected numbers as a dictionary of plain python types.
+        """
+        def entries( group ) :
+            return { name : { "calls" : cs[0], "time" : cs[1] }
+                     for name, cs in sorted( self.timings[group].items() ) }
+
+        def total( group ) :
+            return sum( cs[1] for cs in self.timings[group].values() )
+
+        engtime = total( "engines" )
+        logltime = total( "likelihood" )
+        summary = { "wall" : self.wall, "engines" : engtime, "likelihood" : logltime,
+                    "engineOverhead" : engtime - logltime,
+                    "result" : total( "result" ), "partial" : total( "partial" ) }
+
+        return { "summary" : summary,
+                 "engines" : entries( "engines" ),
+                 "likelihood" : entries( "likelihood" ),
+                 "models" : { "result" : entries( "result" ),
+                              "partial" : entries( "partial" ) },
+                 "windows" : self.windows }
+
+    def toJson( self, filename=None, indent=2 ):
+        """
+        Return the report as a JSON string, optionally written to a file.
+
+        Parameters
+        ----------
+        filename : None or str
+            name of the file to write the report into
+        indent : int
+            indentation of the JSON string
+        """
+        jstr = json.dumps( self.getReport(), indent=indent )
+        if filename is not None :
+            with open( filename, "w" ) as fp :
+                fp.write( jstr )
+        return jstr
+
+    def printReport( self ):
+        """ Print a summary of the timings.  """
+        rep = self.getReport()
+        summ = rep["summary"]
+        print( "Profile                         calls       time" )
+        print( "%-24.24s %10s %10.3f" % ( "Wall", "", summ["wall"] ) )
+        for name, ent in rep["engines"].items() :
+            print( "%-24.24s %10d %10.3f" % ( name, ent["calls"], ent["time"] ) )
+        for name, ent in rep["likelihood"].items() :
+            print( "%-24.24s %10d %10.3f" % ( name, ent["calls"], ent["time"] ) )
+        print( "%-24.24s %10s %10.3f" % ( "Engine overhead", "", summ["engineOverhead"] ) )
+        for grp in ["result", "partial"] :
+            for name, ent in rep["models"][grp].items() :
+                print( "%-24.24s %10d %10.3f" % ( "%s %s" % ( grp, name ), ent["calls"],
+                        ent["time"] ) )
+
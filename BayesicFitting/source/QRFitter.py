@@ -78,6 +78,11 @@ class QRFitter( BaseFitter ):
             It only works properly when the model, the x-data etc are exactly the
             same in the previous run.<br>
             Whenever weights are used, it always needs a new decomposition.
+            A change in the parameters to be fitted (keep) also needs one.
+
+    qrindex : None or tuple of int
+        indices of the fitted parameters of the unweighted qrmat
+        (None: the qrmat can not be reused)
 
     qrmat : matrix
         matrix formed by :math:`q * r^{-1}`, where q,r is the QR decomposition
@@ -113,6 +118,7 @@ class QRFitter( BaseFitter ):
         super( QRFitter, self ).__init__( xdata, model, map=map, keep=keep )
 
         self.needsNewDecomposition = True
+        self.qrindex = None
         self.qrmat = None
 
     def fit( self, ydata, weights=None, keep=None ):
@@ -157,18 +163,7 @@ class QRFitter( BaseFitter ):
 
         ydatacopy = ydatacopy * wgts
 
-        if self.needsNewDecomposition or weights is not None:
-            design = ( self.getDesign( index=fi ).transpose() * wgts ).transpose()
-
-            # The QR decomposition in numpy has a different interface from that in scipy.
-            # Here we use numpy. See:
-            #   https://docs.scipy.org/doc/numpy/reference/generated/numpy.linalg.qr.html
-
-            q, r = numpy.linalg.qr( design )
-            self.qrmat = numpy.dot( numpy.linalg.inv( r ), q.transpose() )
-            self.needsNewDecomposition = False
-
-        params = numpy.dot( self.qrmat, ydatacopy )
+        params = numpy.dot( self.getQRmat( fi, wgts, weights ), ydatacopy )
 
         params = self.insertParameters( params, index=fi )
         self.model.parameters = params
@@ -176,6 +171,107 @@ class QRFitter( BaseFitter ):
 
         return params
 
+    def fitMany( self, ydata, weights=None, keep=None ):
+        """
+        Return model parameters fitted to many datasets at once.
+
+        All datasets, the columns of ydata, share the xdata of the fitter.
+        When the weights are shared too, the QR decomposition is done only once
+        and all datasets are solved in one go. Weights per dataset need a
+        decomposition per dataset.
+
+        The model itself is not changed.
+
+        Parameters
+        ----------
+        ydata : array_like of shape (nxdata, nsets)
+            the data matrix to be fitted; one dataset per column.
+        weights : array_like of shape (nxdata,) or (nxdata, nsets)
+            weights pertaining to the data ( = 1.0 / sigma^2 )
+        keep : dict of {int:float}
+            dictionary of indices (int) to be kept at a fixed value (float)
+            The values will override those at initialization.
+            They are only used in this call of fit.
+
+        Returns
+        -------
+        params : ndarray of shape (npchain, nsets)
+            the fitted parameters, one set per column
+        chisq : ndarray of shape (nsets,)
+            chisquared per dataset
+        stdevs : ndarray of shape (npchain, nsets)
+            standard deviations of the parameters, one set per column
+
+        Raises
+        ------
+            ValueError when ydata or weights contain a NaN or have the wrong shape
+
+        """
+        fi, params, ydata, weights, ycorr = self.fitManyProlog( ydata, weights=weights, keep=keep )
+
+        nsets = ydata.shape[1]
+        wgts = ( numpy.ones( self.nxdata, dtype=float ) if weights is None else
+                 numpy.sqrt( weights ) )
+
+        if hasattr( self, "normdata" ) :
+            normweight = numpy.sqrt( self.normweight )
+            ycorr = numpy.append( ycorr, numpy.repeat( self.normdata[:,numpy.newaxis],
+                                  nsets, axis=1 ), axis=0 )
+            normweight = ( normweight if wgts.ndim == 1 else
+                           numpy.repeat( normweight[:,numpy.newaxis], nsets, axis=1 ) )
+            wgts = numpy.append( wgts, normweight, axis=0 )
+
+        if wgts.ndim == 1 :
+            ycorr = ycorr * wgts[:,numpy.newaxis]
+            qrmat = self.getQRmat( fi, wgts, weights )
+            fitpar = numpy.dot( qrmat, ycorr )
+            invdiag = numpy.sum( numpy.square( qrmat ), axis=1 )
+        else :
+            ycorr = ycorr * wgts
+            design = self.getDesign( index=fi )
+            fitpar = numpy.zeros( ( len( fi ), nsets ), dtype=float )
+            invdiag = numpy.zeros( ( len( fi ), nsets ), dtype=float )
+            for k in range( nsets ) :
+                q, r = numpy.linalg.qr( ( design.transpose() * wgts[:,k] ).transpose() )
+                qrmat = numpy.dot( numpy.linalg.inv( r ), q.transpose() )
+                fitpar[:,k] = numpy.dot( qrmat, ycorr[:,k] )
+                invdiag[:,k] = numpy.sum( numpy.square( qrmat ), axis=1 )
+
+        return self.fitManyPostscript( ydata, params, fitpar, weights, fi, invdiag )
+
+    def getQRmat( self, fitIndex, wgts, weights ) :
+        """
+        Return the matrix inv( r ) * q^T of the QR decomposition of the weighted design.
+
+        The matrix of an unweighted fit is kept. It is reused as long as the
+        same parameters are fitted and needsNewDecomposition is False.
+
+        Parameters
+        ----------
+        fitIndex : array_like of int
+            indices of the parameters to be fitted
+        wgts : array_like
+            square root of the weights (ones when unweighted)
+        weights : None or array_like
+            the weights as provided by the user
+        """
+        index = tuple( int( k ) for k in fitIndex )
+        if ( not self.needsNewDecomposition and weights is None and
+                self.qrmat is not None and self.qrindex == index ) :
+            return self.qrmat
+
+        design = ( self.getDesign( index=fitIndex ).transpose() * wgts ).transpose()
+
+        # The QR decomposition in numpy has a different interface from that in scipy.
+        # Here we use numpy. See:
+        #   https://docs.scipy.org/doc/numpy/reference/generated/numpy.linalg.qr.html
+
+        q, r = numpy.linalg.qr( design )
+        self.qrmat = numpy.dot( numpy.linalg.inv( r ), q.transpose() )
+        self.qrindex = index if weights is None else None
+        self.needsNewDecomposition = False
+        return self.qrmat
+
 #  *************************************************************************
     def __str__( self ):
         """ Return the name of the fitter. """
@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .Tools import setAttribute as setatt
@@ -49,7 +48,9 @@ class RadialVelocityModel( NonLinearModel ) :
     Attributes
     ----------
     keppler : Kepplers2ndLaw()
-        to calculate the radius and true anomaly
+        to calculate the radius and true anomaly. It keeps the eccentric
+        anomalies, so result, partial and derivative at the same parameters
+        solve Kepplers equation only once.
 
     Examples
     --------
@@ -241,6 +242,7 @@ class RadialVelocityModel( NonLinearModel ) :
             the kth parameter.
 
         """
+        from astropy import units
         if k == 0:
             return units.Unit( units.si.rad ) / self.xUnit
         return self.yUnit
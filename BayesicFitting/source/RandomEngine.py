@@ -97,9 +97,13 @@ class RandomEngine( Engine ):
         q = numpy.where( ux > 1 )
         ux[q] = 1 - um[q]
 
+        ## model result of the walker, to be updated for each one-parameter move
+        mock = problem.result( walker.allpars[:problem.npars] )
+
+        ## param stays equal to the walker: accepted moves are committed, others undone
+        param = self.getScratch( walker.allpars, nbuf=1 )[0]
         t = 0
         for c in perm :
-            param = walker.allpars.copy( )
             save = param[c]
             kk = 0
             while True :
@@ -107,10 +111,12 @@ class RandomEngine( Engine ):
                 uval = self.rng.uniform( um[c], ux[c], 1 )
                 param[c] = self.unit2Domain( problem, uval, c )
 
-                Ltry = self.errdis.updateLogL( problem, param, parval={c : save} )
+                Ltry, mtry = self.updateLogLmock( problem, param, mock,
+                                                  parval={c : save} )
                 if Ltry >= lowLhood:
                     self.reportSuccess( )
                     self.setWalker( walker, problem, param, Ltry, fitIndex=fitIndex )
+                    mock = mtry
                     t += 1
                     break
                 elif kk < self.maxtrials :
@@ -120,6 +126,11 @@ class RandomEngine( Engine ):
                     param[c] = save
                     break
 
+        if t > 0 :
+            ## commit the walker with an exact logL instead of the incrementally updated one
+            self.setWalker( walker, problem, param, self.logLikelihood( problem, param ),
+                            fitIndex=fitIndex )
+
         return t                        # nr of succesfull steps
 
 
@@ -66,10 +66,19 @@ class Sample( object ):
     allpars : array_like (read only)
         list of parameters, nuisance parameters and hyperparameters
 
+    When the Sample is a member of a SampleList, the attributes id, parent, start,
+    logL, logW and (for static models) parameters are views into the columns
+    of the SampleList. In a SampleList opened from a SampleFile, also hyper and
+    nuisance are.
+
     Author       Do Kester
 
     """
 
+    #  attributes that are views into the columns of a SampleList
+    VIEWS = {"id" : int, "parent" : int, "start" : int, "logL" : float, "logW" : float,
+             "parameters" : None, "hyper" : None, "nuisance" : None}
+
     def __init__( self, id, parent, start, model, parameters=None, fitIndex=None, copy=None ):
         """
         Constructor.
@@ -104,7 +113,7 @@ class Sample( object ):
             self.logL = 0.0
             self.logW = 0.0
         else :
-            self.model = copy.model.copy()
+            self.model = copy.model.copy() if copy.model.isDynamic() else copy.model
             self.parameters = copy.parameters.copy()
             if hasattr( copy, "nuisance" ) : self.nuisance = copy.nuisance.copy()
             if hasattr( copy, "hyper" ) : self.hyper = copy.hyper.copy()
@@ -116,16 +125,54 @@ class Sample( object ):
         """
         Copy.
 
-        The copy points to the same instance of model.
+        The copy points to the same instance of model, except for dynamic models.
+        The copy is not a member of a SampleList.
         """
         return Sample( self.id, self.parent, self.start, self.model, copy=self )
 
+    def attach( self, samplelist, row ) :
+        """
+        Make the sample a view into row of the columns of the samplelist.
+
+        The values of the sample are copied into the columns.
+
+        Parameters
+        ----------
+        samplelist : SampleList
+            the list to attach to
+        row : int
+            the row in the columns of the list
+        """
+        self.detach()
+        for name in self.VIEWS :
+            if name in self.__dict__ and samplelist.hasView( name ) :
+                samplelist.setView( row, name, self.__dict__.pop( name ) )
+        object.__setattr__( self, "_view", ( samplelist, row ) )
+
+    def detach( self ) :
+        """
+        Take the sample out of the columns of its SampleList, keeping its values.
+        """
+        view = self.__dict__.pop( "_view", None )
+        if view is None :
+            return
+        samplelist, row = view
+        for name in self.VIEWS :
+            if samplelist.hasView( name ) :
+                value = samplelist.getView( row, name )
+                if self.VIEWS[name] is None :
+                    value = value.copy()
+                object.__setattr__( self, name, value )
+
     def __getattr__( self, name ) :
         """
         Return the value of one of `parameters`, `scale`,
 
         """
-        if name == "weight" :
+        view = self.__dict__.get( "_view" )
+        if name in self.VIEWS and view is not None and view[0].hasView( name ) :
+            return view[0].getView( view[1], name )
+        elif name == "weight" :
             return math.exp( self.logW )
         elif name == "allpars" :
             allpars = self.parameters.copy()
@@ -145,6 +192,13 @@ class Sample( object ):
         """
         Set attributes.
         """
+        view = self.__dict__.get( "_view" )
+        if view is not None and name in self.VIEWS and view[0].hasView( name ) :
+            if self.VIEWS[name] is not None and not Tools.isInstance( value, self.VIEWS[name] ) :
+                raise TypeError( name + ' has not the proper type: ' + str( self.VIEWS[name] ) )
+            view[0].setView( view[1], name, value )
+            return
+
         if name == "parameters" :
             object.__setattr__( self, name, value )
             return
@@ -0,0 +1,241 @@
+import numpy as numpy
+import os
+import json
+
+from .SampleList import SampleList
+
+__author__ = "Do Kester"
+__year__ = 2020
+__license__ = "GPL3"
+__version__ = "0.9"
+__maintainer__ = "Do"
+__status__ = "Development"
+
+#  *
+#  * This file is part of the BayesicFitting package.
+#  *
+#  * BayesicFitting is free software: you can redistribute it and/or modify
+#  * it under the terms of the GNU Lesser General Public License as
+#  * published by the Free Software Foundation, either version 3 of
+#  * the License, or ( at your option ) any later version.
+#  *
+#  * BayesicFitting is distributed in the hope that it will be useful,
+#  * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  * GNU Lesser General Public License for more details.
+#  *
+#  * The GPL3 license can be found at <http://www.gnu.org/licenses/>.
+#  *
+#  *    2020 Do Kester
+
+class SampleFile( object ):
+    """
+    SampleFile is an append-only file with the samples of a NestedSampler.
+
+    The NestedSampler writes the samples to the file in chunks, keeping only
+    the last chunk in memory. So the memory does not grow with the length of
+    the run. Afterwards the file is opened as a lazy SampleList, of which the
+    parameters, hyper and nuisance parameters are memory-mapped onto the file.
+
+    The file starts with the magic string, the length of the header and the
+    header in JSON. The records follow, one per sample, with id, parent, start,
+    logL, logW, parameters, hyper and nuisance (when present).
+
+    Only samples of static models can be written.
+
+    Attributes
+    ----------
+    filename : str
+        name of the file
+    chunk : int (1000)
+        number of samples kept in memory before they are written
+    count : int
+        number of samples in the file
+    npars, nhyper, nnuis : int
+        number of parameters, hyperparameters and nuisance parameters
+    fitIndex : list of int
+        indices of the parameters that were fitted
+
+    Examples
+    --------
+    >>> ns = NestedSampler( xdata, model, ydata, stream="mysamples.bfs" )
+    >>> evid = ns.sample()
+    >>> sl = SampleFile( "mysamples.bfs" ).open( model )
+
+    Author       Do Kester.
+
+    """
+    MAGIC = b"BFSAMPLE"
+    ALIGN = 64
+    COLUMNS = ["id", "parent", "start", "logL", "logW"]
+
+    def __init__( self, filename, chunk=1000 ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        filename : str
+            name of the file
+        chunk : int (1000)
+            number of samples kept in memory before they are written
+        """
+        self.filename = filename
+        self.chunk = chunk
+        self.start()
+
+    def start( self ):
+        """ Start anew: the file is overwritten at the next write.  """
+        self.count = 0
+        self.dtype = None
+        self.offset = 0
+
+    def makeDtype( self ):
+        """ Return the dtype of the records.  """
+        fields = [( "id", numpy.int64 ), ( "parent", numpy.int64 ), ( "start", numpy.int64 ),
+                  ( "logL", numpy.float64 ), ( "logW", numpy.float64 ),
+                  ( "parameters", numpy.float64, ( self.npars, ) )]
+        if self.nhyper > 0 :
+            fields += [( "hyper", numpy.float64, ( self.nhyper, ) )]
+        if self.nnuis > 0 :
+            fields += [( "nuisance", numpy.float64, ( self.nnuis, ) )]
+        return numpy.dtype( fields )
+
+    def create( self, sample ):
+        """
+        Write the header of a new file, with the sizes taken from the sample.
+
+        Parameters
+        ----------
+        sample : Sample
+            a sample of the ones to be written
+        """
+        self.npars = len( sample.parameters )
+        self.nhyper = len( sample.hyper ) if hasattr( sample, "hyper" ) else 0
+        self.nnuis = len( sample.nuisance ) if hasattr( sample, "nuisance" ) else 0
+        self.fitIndex = [int( k ) for k in sample.fitIndex]
+
+        header = json.dumps( { "npars" : self.npars, "nhyper" : self.nhyper,
+                               "nnuis" : self.nnuis, "fitIndex" : self.fitIndex } ).encode()
+        size = len( self.MAGIC ) + 8 + len( header )
+        header += b" " * ( -size % self.ALIGN )
+
+        with open( self.filename, "wb" ) as fp :
+            fp.write( self.MAGIC )
+            fp.write( numpy.int64( len( header ) ).tobytes() )
+            fp.write( header )
+            self.offset = fp.tell()
+        self.dtype = self.makeDtype()
+        self.count = 0
+
+    def readHeader( self ):
+        """
+        Read the header of an existing file.
+
+        Raises
+        ------
+        ValueError when the file is not a SampleFile
+        """
+        with open( self.filename, "rb" ) as fp :
+            if fp.read( len( self.MAGIC ) ) != self.MAGIC :
+                raise ValueError( "%s is not a SampleFile" % self.filename )
+            size = int( numpy.frombuffer( fp.read( 8 ), dtype=numpy.int64 )[0] )
+            header = json.loads( fp.read( size ).decode() )
+            self.offset = fp.tell()
+
+        self.npars = header["npars"]
+        self.nhyper = header["nhyper"]
+        self.nnuis = header["nnuis"]
+        self.fitIndex = header["fitIndex"]
+        self.dtype = self.makeDtype()
+        self.count = ( os.path.getsize( self.filename ) - self.offset ) // self.dtype.itemsize
+
+    def wantWrite( self, samples ):
+        """ Return True when a chunk of samples is to be written.  """
+        return len( samples ) >= self.chunk
+
+    def write( self, samples ):
+        """
+        Append the samples to the file and remove them from the list.
+
+        Parameters
+        ----------
+        samples : SampleList
+            samples of a static model
+        """
+        nsamp = len( samples )
+        if nsamp == 0 :
+            return
+        if self.dtype is None :
+            self.create( samples[0] )
+
+        records = numpy.zeros( nsamp, dtype=self.dtype )
+        for name in self.COLUMNS + ["parameters"] :
+            records[name] = samples.getColumn( name )
+        for name in self.dtype.names[6:] :
+            records[name] = [getattr( s, name ) for s in samples]
+
+        with open( self.filename, "r+b" ) as fp :
+            fp.seek( self.offset + self.count * self.dtype.itemsize )
+            records.tofile( fp )
+            fp.truncate()
+        self.count += nsamp
+        samples.clear()
+
+    def truncate( self, count ):
+        """
+        Keep only the first count samples in the file, e.g. at a restart.
+
+        Parameters
+        ----------
+        count : int
+            number of samples to keep
+        """
+        if count <= 0 :
+            self.start()
+            return
+        self.readHeader()
+        if count > self.count :
+            raise ValueError( "%s contains less than %d samples" % ( self.filename, count ) )
+        os.truncate( self.filename, self.offset + count * self.dtype.itemsize )
+        self.count = count
+
+    def records( self, mode="r" ):
+        """
+        Return the records of the file, memory-mapped.
+
+        Parameters
+        ----------
+        mode : str ("r")
+            mode of numpy.memmap
+        """
+        self.readHeader()
+        if self.count == 0 :
+            return numpy.zeros( 0, dtype=self.dtype )
+        return numpy.memmap( self.filename, dtype=self.dtype, mode=mode, offset=self.offset,
+                             shape=( self.count, ) )
+
+    def open( self, model, ndata=1 ):
+        """
+        Return a lazy SampleList of the samples in the file.
+
+        The columns id, parent, start, logL and logW are read into memory; the
+        others are memory-mapped copy-on-write, so that changes in the list do
+        not reach the file.
+
+        Parameters
+        ----------
+        model : Model
+            the (static) model of the samples
+        ndata : int
+            length of the data vector; to be used in stdev calculations
+        """
+        records = self.records( mode="c" )
+        columns = { name : records[name] for name in records.dtype.names }
+        for name in self.COLUMNS :
+            columns[name] = numpy.array( records[name] )
+
+        samples = SampleList( model, 0, ndata=ndata )
+        samples.setLazy( model, columns, fitIndex=numpy.asarray( self.fitIndex, dtype=int ) )
+        return samples
+
@@ -1,6 +1,8 @@
 import numpy as numpy
-from astropy import units
 import math
+import sys
+import heapq
+import bisect
 from . import Tools
 from .Sample import Sample
 
@@ -50,6 +52,18 @@ class SampleList( list ):
     A large set of utility functions is provided to extract the information from the
     SampleList.
 
+    The ids, parents, starts, logLs, logWs and (for static models) the parameters
+    of the samples are kept in columns, one row per sample. The samples in the
+    list are views into these columns, so that the weighted averages, medians and
+    quantiles are calculated on whole columns at once.
+    Removing a sample from the middle of the list leaves a free row in the
+    columns; the columns are compacted when there are too many free rows, or
+    when a whole column is asked for.
+
+    A SampleList opened from a `SampleFile` is lazy: its columns are memory-mapped
+    onto the file and its samples are only constructed when they are asked for.
+    Any change of the list, other than normalize, fills it with all its samples.
+
 
     Attributes
     ----------
@@ -98,6 +112,9 @@ class SampleList( list ):
     Author       Do Kester
 
     """
+    BATCHSIZE = 256                 # number of samples per call to Model.resultBatch
+    MINFREE = 16                    # free rows allowed before compacting the columns
+
     def __init__( self, model, nsamples, parameters=None, fitIndex=None, ndata=1 ):
         """
         Default Constructor.
@@ -121,12 +138,48 @@ class SampleList( list ):
         self.iteration = 0
         self.logZ = 0.0
         self.info = 0.0
+
+        self._head = 0                          # row of the first sample
+        self._free = []                         # sorted rows of removed samples
+        self._columns = {"id" : numpy.zeros( 0, dtype=int ),
+                         "parent" : numpy.zeros( 0, dtype=int ),
+                         "start" : numpy.zeros( 0, dtype=int ),
+                         "logL" : numpy.zeros( 0, dtype=float ),
+                         "logW" : numpy.zeros( 0, dtype=float ) }
+        if not model.isDynamic() :
+            self._columns["parameters"] = numpy.zeros( ( 0, model.npchain ), dtype=float )
+
+        self._heap = None                       # min-heap on logW; only used by weed
+        self._serial = 0
+        self._lazy = None                       # ( model, fitIndex ) of a lazy list
+
         self.addSamples( model, nsamples, parameters, fitIndex=fitIndex )
         self.maxLikelihoodIndex = -1            # always the last one
         self.normalized = False
         self.ndata = ndata
 
     def addSamples( self, model, nSamples, parameters, fitIndex=None ):
+        """
+        Add samples to the list.
+
+        Parameters
+        ----------
+        model : Model
+            to be used in the samples
+        nSamples : int
+            number of samples to add
+        parameters : array_like
+            list of model parameters, optionally followed by hyperparameters
+        fitIndex : array of int
+            indicating which parameters need fitting
+        """
+        hyper = None
+        if parameters is not None and not model.isDynamic() :
+            if len( parameters ) > model.npchain :
+                hyper = parameters[model.npchain:]
+            parameters = parameters[:model.npchain]
+
+        self.reserve( nSamples )
         for i in range( nSamples ) :
             if model.isDynamic() :
                 model = model.copy()
@@ -134,9 +187,406 @@ class SampleList( list ):
                     fitIndex = fitIndex.copy()
             sample = Sample( self._count, -1, self.iteration, model,
                              parameters=parameters, fitIndex=fitIndex )
+            if hyper is not None :
+                sample.hyper = hyper
             self.append( sample )
             self._count += 1
 
+    # ===== COLUMNS ===========================================================
+    def reserve( self, nrows ) :
+        """
+        Make room in the columns for nrows more samples.
+
+        Parameters
+        ----------
+        nrows : int
+            number of rows to add
+        """
+        n = len( self )
+        if self._head + n + len( self._free ) + nrows <= len( self._columns["logL"] ) :
+            return
+
+        size = 2 * ( n + nrows )
+        live = self.liveRows()
+        for name, col in self._columns.items() :
+            new = numpy.zeros( ( size, ) + col.shape[1:], dtype=col.dtype )
+            new[:n] = col[live]
+            self._columns[name] = new
+        self._head = 0
+        self._free = []
+        self.renumber( 0 )
+
+    def liveRows( self ) :
+        """ Return the rows of the samples in the columns: a slice, or an index array.  """
+        n = len( self )
+        if len( self._free ) == 0 :
+            return slice( self._head, self._head + n )
+        rows = numpy.arange( self._head, self._head + n + len( self._free ) )
+        return numpy.setdiff1d( rows, self._free, assume_unique=True )
+
+    def compact( self ) :
+        """
+        Move the samples into the free rows, so that the columns are contiguous again.
+        """
+        if len( self._free ) == 0 :
+            return
+        n = len( self )
+        live = self.liveRows()
+        for col in self._columns.values() :
+            col[self._head:self._head+n] = col[live]
+        self._free = []
+        self.renumber( 0 )
+
+    def renumber( self, start ) :
+        """
+        Point the samples from start onwards to their rows in the columns.
+        There should be no free rows.
+
+        Parameters
+        ----------
+        start : int
+            index of the first sample to renumber
+        """
+        for k in range( start, len( self ) ) :
+            sample = super( SampleList, self ).__getitem__( k )
+            object.__setattr__( sample, "_view", ( self, self._head + k ) )
+
+    def rebuild( self ) :
+        """
+        Rebuild the columns after the order of the list has changed.
+        """
+        for sample in self :
+            sample.detach()
+        n = len( self )
+        for name, col in self._columns.items() :
+            self._columns[name] = numpy.zeros( ( n, ) + col.shape[1:], dtype=col.dtype )
+        self._head = 0
+        self._free = []
+        for k, sample in enumerate( self ) :
+            sample.attach( self, k )
+
+    def hasView( self, name ) :
+        """ Return whether the attribute (of a sample) is kept in a column.  """
+        return name in self._columns
+
+    def getView( self, row, name ) :
+        """
+        Return the attribute of the sample at row.
+
+        Parameters
+        ----------
+        row : int
+            row of the sample
+        name : str
+            name of the attribute: one of Sample.VIEWS
+        """
+        col = self._columns[name]
+        if col.ndim > 1 :
+            return col[row]
+        elif name == "logL" or name == "logW" :
+            return float( col[row] )
+        else :
+            return int( col[row] )
+
+    def setView( self, row, name, value ) :
+        """
+        Set the attribute of the sample at row.
+
+        Parameters
+        ----------
+        row : int
+            row of the sample
+        name : str
+            name of the attribute: one of Sample.VIEWS
+        value : array_like or float or int
+            the value
+        """
+        col = self._columns[name]
+        if name == "logW" :
+            self._heap = None
+        elif name == "parameters" and len( value ) != col.shape[1] :
+            raise ValueError( "Sample %d: wrong number of parameters: %d is not %d" %
+                    ( row, len( value ), col.shape[1] ) )
+        col[row] = value
+
+    def getColumn( self, name ) :
+        """
+        Return the (writable) column of the named attribute for all samples in the list.
+
+        Parameters
+        ----------
+        name : str
+            name of the attribute: one of Sample.VIEWS
+        """
+        self.compact()
+        return self._columns[name][self._head:self._head+len( self )]
+
+    def adopt( self, sample ) :
+        """ Return the sample, or a copy when it is a member of a(nother) list.  """
+        return sample.copy() if "_view" in sample.__dict__ else sample
+
+    # ===== PICKLE ============================================================
+    def __reduce__( self ) :
+        """
+        Return the list for pickling as its attributes and detached copies of its samples.
+
+        Pickle would append the samples before the columns are restored, so the
+        samples are part of the state; see `__setstate__`.
+        """
+        state = { key : value for key, value in self.__dict__.items()
+                  if key not in ["_columns", "_head", "_free", "_heap", "_lazy"] }
+        state["_columns"] = { name : numpy.zeros( ( 0, ) + col.shape[1:], dtype=col.dtype )
+                              for name, col in self._columns.items() }
+        state["_samples"] = [sample.copy() for sample in self]
+        return ( SampleList.__new__, ( type( self ), ), state )
+
+    def __setstate__( self, state ) :
+        """
+        Restore the attributes and rebuild the columns from the pickled samples.
+
+        Parameters
+        ----------
+        state : dict
+            as produced by `__reduce__`
+        """
+        state = dict( state )
+        samples = state.pop( "_samples" )
+        self.__dict__.update( state )
+        self._head = 0
+        self._free = []
+        self._heap = None
+        self._lazy = None
+        for sample in samples :
+            self.append( sample )
+
+    # ===== LAZY LISTS ========================================================
+    def setLazy( self, model, columns, fitIndex=None ) :
+        """
+        Make the list a lazy view into the columns.
+
+        Parameters
+        ----------
+        model : Model
+            the (static) model of the samples
+        columns : dict of { str : array_like }
+            one row per sample for the attributes in Sample.VIEWS. At least
+            id, parent, start, logL and logW are needed.
+        fitIndex : array of int
+            indicating which parameters need fitting
+        """
+        self.clear()
+        self._columns = dict( columns )
+        self._lazy = ( model, numpy.arange( model.npars ) if fitIndex is None else fitIndex )
+        ids = self._columns["id"]
+        self._count = int( numpy.max( ids ) ) + 1 if len( ids ) > 0 else 0
+        self.normalized = False
+
+    def lazySample( self, row ) :
+        """ Return a new sample of a lazy list, as a view into row of the columns.  """
+        model, fitIndex = self._lazy
+        sample = Sample.__new__( Sample )
+        object.__setattr__( sample, "model", model )
+        object.__setattr__( sample, "fitIndex", fitIndex )
+        object.__setattr__( sample, "_view", ( self, row ) )
+        return sample
+
+    def materialize( self ) :
+        """ Fill a lazy list with all its samples.  """
+        if self._lazy is None :
+            return
+        samples = [self.lazySample( k ) for k in range( len( self ) )]
+        self._lazy = None
+        super( SampleList, self ).extend( samples )
+
+    def __len__( self ) :
+        if self._lazy is not None :
+            return len( self._columns["logL"] )
+        return super( SampleList, self ).__len__()
+
+    def __getitem__( self, k ) :
+        if self._lazy is None :
+            return super( SampleList, self ).__getitem__( k )
+        if isinstance( k, slice ) :
+            return [self.lazySample( i ) for i in range( len( self ) )[k]]
+        return self.lazySample( range( len( self ) )[k] )
+
+    def __iter__( self ) :
+        if self._lazy is None :
+            return super( SampleList, self ).__iter__()
+        return ( self.lazySample( k ) for k in range( len( self ) ) )
+
+    def __reversed__( self ) :
+        if self._lazy is None :
+            return super( SampleList, self ).__reversed__()
+        return ( self.lazySample( k ) for k in reversed( range( len( self ) ) ) )
+
+    def lazyRow( self, sample ) :
+        """ Return the row of a sample of this lazy list, or None when it is not one.  """
+        view = sample.__dict__.get( "_view" ) if isinstance( sample, Sample ) else None
+        return view[1] if view is not None and view[0] is self else None
+
+    def __contains__( self, sample ) :
+        if self._lazy is None :
+            return super( SampleList, self ).__contains__( sample )
+        return self.lazyRow( sample ) is not None
+
+    def index( self, sample, start=0, stop=sys.maxsize ) :
+        """
+        Return the index of the sample in the list.
+
+        The samples of a lazy list are new objects at every access; they are
+        found by their row in the columns.
+
+        Raises
+        ------
+        ValueError when the sample is not in the list.
+        """
+        if self._lazy is None :
+            return super( SampleList, self ).index( sample, start, stop )
+        row = self.lazyRow( sample )
+        if row is None or row not in range( len( self ) )[start:stop] :
+            raise ValueError( "Sample is not in list" )
+        return row
+
+    def count( self, sample ) :
+        """ Return the number of occurrences of the sample in the list.  """
+        if self._lazy is None :
+            return super( SampleList, self ).count( sample )
+        return 1 if sample in self else 0
+
+    def __repr__( self ) :
+        return repr( self[:] ) if self._lazy is not None else super( SampleList, self ).__repr__()
+
+    # ===== LIST METHODS ======================================================
+    def append( self, sample ) :
+        """
+        Append a sample to the list; it becomes a view into the columns.
+
+        Parameters
+        ----------
+        sample : Sample
+            the sample to be appended
+        """
+        self.materialize()
+        sample = self.adopt( sample )
+        self.reserve( 1 )
+        row = self._head + len( self ) + len( self._free )
+        super( SampleList, self ).append( sample )
+
+        heap, self._heap = self._heap, None
+        sample.attach( self, row )
+        if heap is not None :
+            self._heap = heap
+            self.pushHeap( sample )
+
+    def extend( self, samples ) :
+        for sample in samples :
+            self.append( sample )
+
+    def __iadd__( self, samples ) :
+        self.extend( samples )
+        return self
+
+    def insert( self, k, sample ) :
+        self.materialize()
+        super( SampleList, self ).insert( k, self.adopt( sample ) )
+        self.rebuild()
+
+    def __setitem__( self, k, sample ) :
+        """
+        Replace the sample at k; the new one becomes a view into the columns.
+
+        Parameters
+        ----------
+        k : int or slice
+            index of the sample
+        sample : Sample or list of Sample
+            the sample(s) to be placed at k
+        """
+        self.materialize()
+        if isinstance( k, slice ) :
+            super( SampleList, self ).__setitem__( k, [self.adopt( s ) for s in sample] )
+            self.rebuild()
+            return
+
+        k = range( len( self ) )[k]
+        old = super( SampleList, self ).__getitem__( k )
+        if old is sample :
+            return
+        sample = self.adopt( sample )
+        row = old.__dict__["_view"][1]
+        old.detach()
+        super( SampleList, self ).__setitem__( k, sample )
+        sample.attach( self, row )
+
+    def __delitem__( self, k ) :
+        """
+        Remove the sample(s) at k.
+
+        The columns are not moved: the row of the sample becomes free, unless it
+        is the first or the last one. The columns are compacted when there are
+        more than MINFREE plus a quarter of the length free rows.
+
+        Parameters
+        ----------
+        k : int or slice
+            index of the sample
+        """
+        self.materialize()
+        n = len( self )
+        if isinstance( k, slice ) :
+            for i in sorted( range( n )[k], reverse=True ) :
+                del self[i]
+            return
+
+        k = range( n )[k]
+        sample = super( SampleList, self ).__getitem__( k )
+        row = sample.__dict__["_view"][1]
+        sample.detach()
+        super( SampleList, self ).__delitem__( k )
+        free = self._free
+        if k == 0 :
+            self._head = row + 1
+            while len( free ) > 0 and free[0] == self._head :
+                free.pop( 0 )
+                self._head += 1
+        elif k == n - 1 :
+            last = super( SampleList, self ).__getitem__( -1 ).__dict__["_view"][1]
+            while len( free ) > 0 and free[-1] > last :
+                free.pop()
+        else :
+            bisect.insort( free, row )
+            if len( free ) > self.MINFREE + len( self ) // 4 :
+                self.compact()
+
+    def remove( self, sample ) :
+        self.materialize()
+        del self[self.index( sample )]
+
+    def pop( self, k=-1 ) :
+        sample = self[k]
+        del self[k]
+        return sample
+
+    def clear( self ) :
+        self.materialize()
+        for sample in self :
+            sample.detach()
+        super( SampleList, self ).clear()
+        self._head = 0
+        self._free = []
+        self._heap = None
+
+    def sort( self, *args, **kwargs ) :
+        self.materialize()
+        super( SampleList, self ).sort( *args, **kwargs )
+        self.rebuild()
+
+    def reverse( self ) :
+        self.materialize()
+        super( SampleList, self ).reverse()
+        self.rebuild()
+
     def __getattr__( self, name ) :
         if name == "parameters" :
             return self.getParameters()
@@ -171,8 +621,7 @@ class SampleList( list ):
         elif name == "medianScale" :
             return self[self.medianIndex].hypars[0]
         elif name == "modusIndex" :
-            we = list( self.getLogWeightEvolution() )
-            self.modusIndex = we.index( max( we ) )
+            self.modusIndex = int( numpy.argmax( self.getLogWeightEvolution() ) )
             return self.modusIndex
         elif name == "modusParameters" :
             return self[self.modusIndex].parameters
@@ -210,15 +659,13 @@ class SampleList( list ):
 
         """
         self.normalized = True
-        lwev = self.getLogWeightEvolution()
+        self._heap = None
+        lwev = self.getColumn( "logW" )
 
         lmax = numpy.max( lwev )
-        lwev -= lmax
-
-        lswt = math.log( numpy.sum( numpy.exp( lwev ) ) )
+        lswt = math.log( numpy.sum( numpy.exp( lwev - lmax ) ) )
 
-        for sample in self :
-            sample.logW -= ( lmax + lswt )
+        lwev -= ( lmax + lswt )
 
 
 # TBC why is the logZ in this ???
@@ -264,20 +711,52 @@ class SampleList( list ):
 
         If MaxSamples has been set, it is checked whether the size of the
         SampleList exceeds the maximum. If so the Sample with the smallest
-        log( Weight ) is removed.
-        weed( ) is called recursively until the size has the required length.
+        log( Weight ) is removed, until the size has the required length.
+        Of equal log( Weight )s the newest is removed first.
+
+        The samples are found in a min-heap on log( Weight ), which is kept
+        up to date while samples are appended. The order of the remaining
+        samples is unchanged; their rows in the columns are not moved
+        (see `__delitem__`).
+
+        Parameters
+        ----------
+        maxsize : None or int
+            maximum number of samples to keep
 
         """
-        if maxsize is None :
+        if maxsize is None or len( self ) <= maxsize :
             return
 
+        self.materialize()
+        if self._heap is None and len( self ) > maxsize :
+            self._serial = 0
+            self._heap = []
+            for sample in self :
+                self.pushHeap( sample )
+
         while len( self ) > maxsize :
-            if self[0].logW < self[-1].logW :
-                self.remove( self[0] )
-            else :
-                self.remove( self[-1] )
+            sample = heapq.heappop( self._heap )[2]
+            view = sample.__dict__.get( "_view" )
+            if view is not None and view[0] is self :        # still in the list
+                row = view[1]
+                del self[row - self._head - bisect.bisect_left( self._free, row )]
         return
 
+    def pushHeap( self, sample ) :
+        """
+        Push the sample on the heap of weed().
+
+        When the heap holds more than twice as many entries as there are
+        samples in the list, the entries of removed samples are pruned.
+        """
+        heap = self._heap
+        if len( heap ) > 2 * len( self ) + self.MINFREE :
+            heap = [entry for entry in heap if entry[2].__dict__.get( "_view", ( None, ) )[0] is self]
+            heapq.heapify( heap )
+            self._heap = heap
+        heapq.heappush( heap, ( sample.logW, -self._serial, sample ) )
+        self._serial += 1
 
     def logPlus( self, x, y ):
         return numpy.logaddexp( x, y )
@@ -328,18 +807,7 @@ class SampleList( list ):
         """
         Return the super parameters
         """
-        nhp = len( self[0].hyper )
-
-        hypar = numpy.zeros( nhp, dtype=float )
-        hydev = numpy.zeros( nhp, dtype=float )
-        sw = 0.0
-        for sample in self :
-            wt = math.exp( sample.logW )
-            sw += wt
-            ws = wt * sample.hyper
-            hypar = hypar + ws
-            hydev = hydev + ws * sample.hyper
-        self.stdevHypars = numpy.sqrt( hydev - hypar * hypar )
+        ( hypar, self.stdevHypars ) = self.averstd( "hyper" )
         self.hypars = hypar
         return self.hypars
 
@@ -357,35 +825,61 @@ class SampleList( list ):
         name : str
             name of an attribute from Sample
         """
-        np = len( getattr( self[0], name ) )
+        if self.hasView( name ) :
+            values = self.getColumn( name )
+        else :
+            values = numpy.asarray( [getattr( sample, name ) for sample in self] )
 
-        aver = numpy.zeros( np, dtype=float )
-        stdv = numpy.zeros( np, dtype=float )
-        sw = 0.0
-        for sample in self :
-            wt = math.exp( sample.logW )
-            sw += wt
-            ss = getattr( sample, name )
-            ws = wt * ss
-            aver = aver + ws
-            stdv = stdv + ws * ss
-        stdv = numpy.sqrt( stdv - aver * aver )
+        wt = self.getWeightEvolution()
+        aver = numpy.dot( wt, values )
+        stdv = numpy.sqrt( numpy.dot( wt, values * values ) - aver * aver )
 
         return ( aver, stdv )
 
     # ===== MEDIAN ===========================================================
     def getMedianIndex( self ) :
-        sum = 0.0
-        k = 0
-        for sample in self :
-            sum += math.exp( sample.logW )
-            if sum < 0.5 :
-                k += 1
-            else :
-                break
-        self.medianIndex = k
+        cumwt = numpy.cumsum( self.getWeightEvolution() )
+        self.medianIndex = int( numpy.searchsorted( cumwt, 0.5 ) )
         return self.medianIndex
 
+    def getQuantiles( self, probs, kpar=None ) :
+        """
+        Return the weighted quantiles of (some of) the parameters.
+
+        The quantile is the smallest parameter value for which the cumulative
+        (normalized) weight reaches the probability.
+
+        Parameters
+        ----------
+        probs : float or array_like
+            probabilitie(s) in [0,1]
+        kpar : int or tuple of ints
+            the parameter to be selected. Default: all
+
+        Returns
+        -------
+        numpy.array of shape ( len( probs ), npars ); dimensions are dropped
+            for a single probability or a single parameter.
+        """
+        values = self.getParameterEvolution( kpar=kpar )
+        single = ( values.ndim == 1 )
+        if single :
+            values = values[:,numpy.newaxis]
+
+        srt = numpy.argsort( values, axis=0, kind="stable" )
+        cumwt = numpy.cumsum( self.getWeightEvolution()[srt], axis=0 )
+        cumwt /= cumwt[-1]
+
+        pp = numpy.atleast_1d( probs )
+        quant = numpy.zeros( ( len( pp ), values.shape[1] ), dtype=float )
+        for k in range( values.shape[1] ) :
+            qx = numpy.searchsorted( cumwt[:,k], pp ).clip( max=len( self ) - 1 )
+            quant[:,k] = values[srt[qx,k],k]
+
+        if single :
+            quant = quant[:,0]
+        return quant if numpy.ndim( probs ) > 0 else quant[0]
+
      # ===== EVOLUTIONS ========================================================
     def getMaximumNumberOfParameters( self ):
         """
@@ -410,13 +904,14 @@ class SampleList( list ):
             the parameter to be selected. Default: all
 
         """
-        pe = []
-        for sample in self :
-            pe += [sample.parameters]
+        if self.hasView( "parameters" ) :
+            pe = self.getColumn( "parameters" )
+        else :
+            pe = numpy.asarray( [sample.parameters for sample in self] )
         if kpar is None :
-            return numpy.asarray( pe )
+            return pe.copy()
         else :
-            return numpy.asarray( pe )[:,kpar]
+            return pe[:,kpar]
 
     def getNumberOfParametersEvolution( self ):
         """ Return the evolution of the number of parameters.  """
@@ -425,13 +920,14 @@ class SampleList( list ):
 
     def getScaleEvolution( self ):
         """ Return the evolution of the scale.  """
+        if self.hasView( "hyper" ) :
+            return self.getColumn( "hyper" ).copy()
         pe = [sample.hypars for sample in self]
         return numpy.asarray( pe )
 
     def getLogLikelihoodEvolution( self ):
         """ Return the evolution of the log( Likelihood ).  """
-        pe = [sample.logL for sample in self]
-        return numpy.asarray( pe )
+        return self.getColumn( "logL" ).copy()
 
     def getLogWeightEvolution( self ):
         """
@@ -441,8 +937,7 @@ class SampleList( list ):
         @see #getWeightEvolution( ).
 
         """
-        pe = [sample.logW for sample in self]
-        return numpy.asarray( pe )
+        return self.getColumn( "logW" ).copy()
 
     def getWeightEvolution( self ):
         """
@@ -455,38 +950,23 @@ class SampleList( list ):
 
     def getParentEvolution( self ):
         """ Return the evolution of the parentage.  """
-        pe = []
-        for sample in self :
-            pe += [sample.parent]
-        return numpy.asarray( pe )
+        return self.getColumn( "parent" ).copy()
 
     def getStartEvolution( self ):
         """ Return the evolution of the start generation.  """
-        pe = []
-        for sample in self :
-            pe += [sample.start]
-        return numpy.asarray( pe )
+        return self.getColumn( "start" ).copy()
 
     def getGeneration( self ):
         """ Return the generation number pertaining to the evolution.  """
-        pe = []
-        for sample in self :
-            pe += [sample.id]
-        return numpy.asarray( pe )
+        return self.getColumn( "id" ).copy()
 
     def getLowLogL( self ):
         """
         Return the lowest value of logL in the samplelist, plus its index.
         """
-        low = self[0].logL
-        klo = 0
-        k = 0
-        for sample in self :
-            if sample.logL < low :
-                klo = k
-                low = sample.logL
-            k += 1
-        return ( low, klo )
+        logL = self.getColumn( "logL" )
+        klo = int( numpy.argmin( logL ) )
+        return ( float( logL[klo] ), klo )
 
 
     # ===== AVERAGE RESULTS ===================================================
@@ -494,6 +974,9 @@ class SampleList( list ):
         """
         Return the (weighted) average result of the model(s) over the samples.
 
+        For static models the results are calculated in batches of
+        BATCHSIZE samples, using Model.resultBatch.
+
         Parameters
         ----------
         xdata : array_like
@@ -503,14 +986,23 @@ class SampleList( list ):
         ndata = Tools.length( xdata )
         result = numpy.zeros( ndata, dtype=float )
         error = numpy.zeros( ndata, dtype=float )
-        sumwgt = 0
-        for sample in self :
-            yfit = sample.model.result( xdata, sample.parameters )
-            wgt = math.exp( sample.logW )
-            yw = yfit * wgt
-            result += yw
-            error  += yw * yfit
-            sumwgt += wgt
+
+        if self[0].model.isDynamic() :
+            for sample in self :
+                yfit = sample.model.result( xdata, sample.parameters )
+                wgt = math.exp( sample.logW )
+                yw = yfit * wgt
+                result += yw
+                error  += yw * yfit
+        else :
+            model = self[0].model
+            param = self.getColumn( "parameters" )
+            wgt = self.getWeightEvolution()
+            for k in range( 0, len( self ), self.BATCHSIZE ) :
+                yfit = model.resultBatch( xdata, param[k:k+self.BATCHSIZE] )
+                yw = yfit * wgt[k:k+self.BATCHSIZE,numpy.newaxis]
+                result += numpy.sum( yw, axis=0 )
+                error  += numpy.sum( yw * yfit, axis=0 )
 
 #        self.error = numpy.sqrt( ( error - result * result ) / self.ndata )
         self.error = numpy.sqrt( error - result * result )
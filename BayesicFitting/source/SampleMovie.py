@@ -2,9 +2,6 @@
 import numpy as numpy
 import math
 from . import Tools
-import matplotlib
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 
 from .Sample import Sample
 from .SampleList import SampleList
@@ -54,6 +51,9 @@ class SampleMovie( object ):
     def __init__( self, samplelist, filename="samplemovie.mp4", problem=None, kpar=[0,1] ) :
 
 
+        import matplotlib
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
         bakend = matplotlib.get_backend()       ## save present backend to restore
 
         matplotlib.use("Agg")					## need to use this one to make a movie
@@ -244,6 +244,12 @@ class ScipyFitter( MaxLikelihoodFitter ):
 
         (func,gradient,hess) = self.makeFuncs( data, weights=weights, index=fitIndex )
 
+        # the model gradient comes together with the function in one call
+        if ( gradient is not None and gradient == self.landscape.dfunc and
+             self.method not in ['NELDER-MEAD', 'POWELL', 'COBYLA'] ) :
+            func = self.landscape.funcAndGrad
+            gradient = True
+
         print( self.method )
 
         # - hessp
@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .NonLinearModel import NonLinearModel
@@ -186,6 +185,7 @@ class SineDriftModel( NonLinearModel ):
             the kth parameter.
 
         """
+        from astropy import units
         if k == 0:
             return units.Unit( units.si.rad ) / self.xUnit
         if k == 3:
@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .Tools import setAttribute as setatt
@@ -57,6 +56,9 @@ class SineModel( NonLinearModel ):
 
     The parameters are initialized as [1.0, 1.0, 0.0].
 
+    The cosine and sine are kept for the last xdata and parameters, so that
+    result, partial and derivative at the same parameters calculate them once.
+
 
     Examples
     --------
@@ -119,6 +121,7 @@ class SineModel( NonLinearModel ):
                         names=names, **kwargs )
 
         setatt( self, "phase", phase )
+        setatt( self, "_trig", None )
         if phase :
             setatt( self, "baseResult", self.phaseResult )
             setatt( self, "basePartial", self.phasePartial )
@@ -143,10 +146,26 @@ class SineModel( NonLinearModel ):
             values for the parameters.
 
         """
-        x = self.TWOPI * xdata * params[0]
-        result = params[1] * numpy.cos( x ) + params[2] * numpy.sin( x )
+        x, cxf, sxf = self.trigonometry( xdata, params[0] )
+        result = params[1] * cxf + params[2] * sxf
         return result
 
+    def baseResultBatch( self, xdata, paramMatrix ):
+        """
+        Returns the result of the model function for K parameter sets.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values at which to calculate the result
+        paramMatrix : array_like of shape (K,3)
+            K sets of values for the parameters.
+
+        """
+        params = paramMatrix[:,:,numpy.newaxis]
+        x = self.TWOPI * xdata * params[:,0]
+        return params[:,1] * numpy.cos( x ) + params[:,2] * numpy.sin( x )
+
     def basePartial( self, xdata, params, parlist=None ):
         """
         Returns the partials at the input value.
@@ -165,10 +184,7 @@ class SineModel( NonLinearModel ):
         partial = numpy.ndarray( ( Tools.length( xdata ), np ) )
 
         #  disregard count
-        x = self.TWOPI * xdata
-        xf = x * params[0]
-        cxf = numpy.cos( xf )
-        sxf = numpy.sin( xf )
+        x, cxf, sxf = self.trigonometry( xdata, params[0] )
 
         parts = { 0 : ( lambda: x * params[2] * cxf - x * params[1] * sxf ),
                   1 : ( lambda: cxf ),
@@ -194,10 +210,40 @@ class SineModel( NonLinearModel ):
             values for the parameters.
 
         """
-        x = self.TWOPI * xdata * params[0]
-        df = self.TWOPI * params[0] * ( params[2] * numpy.cos( x ) - params[1] * numpy.sin( x ) )
+        x, cxf, sxf = self.trigonometry( xdata, params[0] )
+        df = self.TWOPI * params[0] * ( params[2] * cxf - params[1] * sxf )
         return df
 
+    def trigonometry( self, xdata, freq, phase=0.0 ):
+        """
+        Return 2 * pi * x, and the cosine and sine of ( 2 * pi * x * freq + phase ).
+
+        They are kept, read-only, as long as xdata with the same values, frequency
+        and phase are offered.
+
+        Parameters
+        ----------
+        xdata : array_like
+            values at which to calculate the result
+        freq : float
+            the frequency
+        phase : float
+            the phase
+
+        """
+        trig = self._trig
+        if ( trig is not None and trig[1] == freq and trig[2] == phase and
+                numpy.array_equal( trig[0], xdata ) ) :
+            return trig[3:]
+
+        x = self.TWOPI * xdata
+        xf = x * freq + phase
+        trig = ( numpy.array( xdata ), freq, phase, x, numpy.cos( xf ), numpy.sin( xf ) )
+        for a in trig[3:] :
+            a.flags.writeable = False
+        setatt( self, "_trig", trig )
+        return trig[3:]
+
     def baseName( self ):
         """
         Returns a string representation of the model.
@@ -215,6 +261,7 @@ class SineModel( NonLinearModel ):
             the kth parameter.
 
         """
+        from astropy import units
         if k == 0:
             return units.Unit( units.si.rad ) / self.xUnit
         return self.yUnit
@@ -256,11 +303,10 @@ class SineModel( NonLinearModel ):
         partial = numpy.ndarray( ( Tools.length( xdata ), np ) )
 
         #  disregard count
-        x = self.TWOPI * xdata
-        xf = x * params[1] + params[2]
-        cxf = params[0] * numpy.cos( xf )
+        x, cxf, sxf = self.trigonometry( xdata, params[1], phase=params[2] )
+        cxf = params[0] * cxf
 
-        parts = { 0 : ( lambda: numpy.sin( xf ) ),
+        parts = { 0 : ( lambda: sxf ),
                   1 : ( lambda: cxf * x ),
                   2 : ( lambda: cxf ) }
 
@@ -284,8 +330,8 @@ class SineModel( NonLinearModel ):
             values for the parameters.
 
         """
-        x = self.TWOPI * xdata * params[1] + params[2]
-        df = params[0] * numpy.cos( x ) * self.TWOPI * params[1]
+        x, cxf, sxf = self.trigonometry( xdata, params[1], phase=params[2] )
+        df = params[0] * cxf * self.TWOPI * params[1]
         return df
 
     def phaseName( self ):
@@ -305,6 +351,7 @@ class SineModel( NonLinearModel ):
             the kth parameter.
 
         """
+        from astropy import units
         if k == 0:
             return self.yUnit
         if k == 1:
@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .Formatter import formatter as fmt
@@ -119,7 +118,7 @@ class StartEngine( Engine ):
 #               xdata = self.errdis.xdata
 #               allp = self.constrain( model, allp, xdata )
 
-            logL = self.errdis.logLikelihood( problem, allp )
+            logL = self.logLikelihood( problem, allp )
 
             if numpy.isfinite( logL ) :
                 break
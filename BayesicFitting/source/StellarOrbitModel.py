@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .Tools import setAttribute as setatt
@@ -56,6 +55,10 @@ class StellarOrbitModel( NonLinearModel ):
         if True return the results in spherical coordinates.
     cyclic : { 1 : 2*pi }
         Only is spherical, indicating that result[:,1] is cyclic.
+    keppler : Kepplers2ndLaw()
+        to calculate the radius and true anomaly. It keeps the eccentric
+        anomalies, so result, partial and derivative at the same parameters
+        solve Kepplers equation only once.
 
     Attributes from Model
     ---------------------
@@ -411,6 +414,7 @@ class StellarOrbitModel( NonLinearModel ):
             the kth parameter.
 
         """
+        from astropy import units
         if k == 0:
             return units.Unit( units.si.rad ) / self.xUnit
         return self.yUnit
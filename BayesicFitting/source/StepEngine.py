@@ -87,7 +87,6 @@ class StepEngine( Engine ):
         """
         self.reportCall()
 
-        walker = walker.copy()
         problem = walker.problem
         fitIndex = walker.fitIndex
         np = len( fitIndex )
@@ -96,11 +95,10 @@ class StepEngine( Engine ):
         dur = urange / len( self.walkers )      ## why this ???
         urange += 2 * dur
 
-        param = walker.allpars
-        usav = self.domain2Unit( problem, param[fitIndex], kpar=fitIndex )
+        ptry = self.getScratch( walker.allpars, nbuf=1 )[0]
+        usav = self.domain2Unit( problem, ptry[fitIndex], kpar=fitIndex )
 
         sz = 1.0
-        ptry = param.copy()
         kk = 0
         while True :
             kk += 1
@@ -122,7 +120,7 @@ class StepEngine( Engine ):
 
             ptry[fitIndex] = self.unit2Domain( problem, utry, kpar=fitIndex  )
 
-            Ltry = self.errdis.logLikelihood( problem, ptry )
+            Ltry = self.logLikelihood( problem, ptry )
             if Ltry >= lowLhood:
                 self.reportSuccess( )
                 self.setWalker( walker, problem, ptry, Ltry, fitIndex=fitIndex )
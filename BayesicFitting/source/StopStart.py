@@ -0,0 +1,414 @@
+import numpy as numpy
+import os
+import random
+import hashlib
+from heapq import heapify
+
+from .Sample import Sample
+
+__author__ = "Do Kester"
+__year__ = 2020
+__license__ = "GPL3"
+__version__ = "0.9"
+__maintainer__ = "Do"
+__status__ = "Development"
+
+#  *
+#  * This file is part of the BayesicFitting package.
+#  *
+#  * BayesicFitting is free software: you can redistribute it and/or modify
+#  * it under the terms of the GNU Lesser General Public License as
+#  * published by the Free Software Foundation, either version 3 of
+#  * the License, or ( at your option ) any later version.
+#  *
+#  * BayesicFitting is distributed in the hope that it will be useful,
+#  * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  * GNU Lesser General Public License for more details.
+#  *
+#  * The GPL3 license can be found at <http://www.gnu.org/licenses/>.
+#  *
+#  *    2020 Do Kester
+
+class StopStart( object ):
+    """
+    StopStart writes checkpoints of a NestedSampler run, from which a stopped
+    run can be restarted.
+
+    A restarted run continues exactly as the original one would have done.
+
+    The checkpoint consists of 2 files.
+    filename.npz
+        the state of the run: the walkers, the iteration, logZ, info, the states
+        of the random number generators, the reports of the engines and the ids
+        of the samples present in the SampleList. It is rewritten at every
+        checkpoint.
+    filename.samples
+        the samples, as a sequence of numpy arrays. At every checkpoint only
+        the new samples are appended.
+
+    At a restart, a stream of samples (SampleFile) is cut back to the length it
+    had at the checkpoint.
+
+    The state also holds a fingerprint of the problem: the number of parameters,
+    the number of data, the name of the model and a hash of the data. A
+    checkpoint of another problem is not resumed.
+
+    For dynamic models the models of the walkers and the samples are pickled.
+
+    The files are removed when the run has finished. Running again with the
+    same filename, starts a new run.
+
+    Attributes
+    ----------
+    filename : str
+        name of the checkpoint files, without extension
+    every : int (100)
+        number of iterations between checkpoints
+    restore : bool (True)
+        restart from the checkpoint, if it exists
+    save : bool (True)
+        write checkpoints
+
+    Examples
+    --------
+    >>> ns = NestedSampler( xdata, model, ydata, restart="mymodel" )
+    >>> evid = ns.sample()          # killed halfway; run again to continue
+
+    Author       Do Kester.
+
+    """
+    def __init__( self, filename, every=100, restore=True, save=True ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        filename : str
+            name of the checkpoint files, without extension
+        every : int (100)
+            number of iterations between checkpoints
+        restore : bool (True)
+            restart from the checkpoint, if it exists
+        save : bool (True)
+            write checkpoints
+        """
+        self.filename = filename
+        self.every = every
+        self.restore = restore
+        self.save = save
+        self.start()
+
+    def start( self ):
+        """ Start anew: the samples file is overwritten at the next checkpoint. """
+        self._offset = 0
+        self._written = 0
+
+    def stateFile( self ):
+        return self.filename + ".npz"
+
+    def samplesFile( self ):
+        return self.filename + ".samples"
+
+    def finish( self ):
+        """ Remove the checkpoint files of a finished run (when saving).  """
+        if not self.save :
+            return
+        for name in [self.stateFile(), self.samplesFile()] :
+            if os.path.exists( name ) :
+                os.remove( name )
+
+    def fingerprint( self, ns ):
+        """
+        Return the fingerprint of the problem of the NestedSampler.
+
+        Parameters
+        ----------
+        ns : NestedSampler
+            the sampler involved
+
+        Returns
+        -------
+        ndarray of str : number of parameters, number of data, model name, data hash
+        """
+        problem = ns.problem
+        model = problem.model
+        sha = hashlib.sha1()
+        for data in [problem.xdata, problem.ydata, problem.weights] :
+            if data is not None :
+                sha.update( numpy.ascontiguousarray( data ).tobytes() )
+        return numpy.asarray( [str( problem.npars ), str( problem.ndata ),
+                               "" if model is None else model.shortName(),
+                               sha.hexdigest()] )
+
+    def wantRestore( self ):
+        """ Return True when the run is to be restarted from a checkpoint.  """
+        return self.restore and os.path.exists( self.stateFile() )
+
+    def wantSave( self, iteration ):
+        """
+        Return True when a checkpoint is to be written.
+
+        Parameters
+        ----------
+        iteration : int
+            present iteration
+        """
+        return self.save and iteration % self.every == 0
+
+    #  *************************************************************************
+    def checkpoint( self, ns, logWidth ):
+        """
+        Write a checkpoint of the NestedSampler.
+
+        Parameters
+        ----------
+        ns : NestedSampler
+            the sampler to be saved
+        logWidth : float
+            log of the width of the present prior mass interval
+        """
+        dynamic = ns.problem.model is not None and ns.problem.model.isDynamic()
+        self.appendSamples( ns.samples, dynamic )
+
+        walkers = ns.walkers
+        state = { "iteration" : ns.iteration, "logZ" : ns.logZ, "info" : ns.info,
+                  "logWidth" : logWidth,
+                  "ensemble" : ns.ensemble, "discard" : ns.discard,
+                  "fingerprint" : self.fingerprint( ns ),
+                  "ncalls" : ns.distribution.ncalls, "nparts" : ns.distribution.nparts,
+                  "reports" : numpy.asarray( [eng.report for eng in ns.engines] ),
+                  "walkerCount" : walkers._count,
+                  "walkerId" : numpy.asarray( [w.id for w in walkers] ),
+                  "logL" : walkers.logL, "parent" : walkers.parent, "start" : walkers.start,
+                  "uvals" : numpy.asarray( self.priorStates( ns ), dtype=float ) }
+
+        if dynamic :
+            state["allpars"] = self.objectArray( [w.allpars for w in walkers] )
+            state["fitIndex"] = self.objectArray( [w.fitIndex for w in walkers] )
+            state["models"] = self.objectArray( [w.problem.model for w in walkers] )
+        else :
+            state["allpars"] = walkers.allpars
+            state["fitIndex"] = numpy.asarray( walkers[0].fitIndex )
+
+        state.update( self.rngStates( [ns.rng] + [eng.rng for eng in ns.engines] ) )
+
+        samples = ns.samples
+        state["sampleCount"] = samples._count
+        state["sampleIds"] = samples.getColumn( "id" )
+        state["samplesWritten"] = self._written
+        state["samplesOffset"] = self._offset
+        serial = {}
+        if samples._heap is not None :
+            serial = { id( entry[2] ) : -entry[1] for entry in samples._heap }
+        state["heapSerial"] = numpy.asarray( [serial.get( id( s ), -1 ) for s in samples],
+                                             dtype=int )
+        state["heap"] = numpy.asarray( [-1 if samples._heap is None else samples._serial] )
+        state["streamCount"] = 0 if ns.stream is None else ns.stream.count
+
+        ## write to a temporary file first, so that a kill leaves the old checkpoint
+        tmpname = self.filename + ".tmp.npz"
+        numpy.savez( tmpname, **state )
+        os.replace( tmpname, self.stateFile() )
+
+    def appendSamples( self, samples, dynamic ):
+        """
+        Append the samples that are not written yet to the samples file.
+
+        Parameters
+        ----------
+        samples : SampleList
+            the samples of the NestedSampler
+        dynamic : bool
+            whether the model is dynamic
+        """
+        new = [s for s in samples if s.id >= self._written]
+        mode = "ab" if self._offset > 0 else "wb"
+        with open( self.samplesFile(), mode ) as fp :
+            fp.seek( self._offset )
+            fp.truncate()
+            if len( new ) > 0 :
+                numpy.save( fp, numpy.asarray( [[s.id, s.parent, s.start] for s in new],
+                                               dtype=int ) )
+                numpy.save( fp, numpy.asarray( [[s.logL, s.logW] for s in new], dtype=float ) )
+                for name in ["parameters", "hyper", "nuisance"] :
+                    if not hasattr( new[0], name ) :
+                        numpy.save( fp, numpy.zeros( ( len( new ), 0 ), dtype=float ) )
+                    elif dynamic :
+                        numpy.save( fp, self.objectArray( [getattr( s, name ) for s in new] ) )
+                    else :
+                        numpy.save( fp, numpy.asarray( [getattr( s, name ) for s in new] ) )
+                if dynamic :
+                    numpy.save( fp, self.objectArray( [s.model for s in new] ) )
+                    numpy.save( fp, self.objectArray( [s.fitIndex for s in new] ) )
+                self._written = samples._count
+            self._offset = fp.tell()
+
+    #  *************************************************************************
+    def resume( self, ns ):
+        """
+        Restore the NestedSampler from the checkpoint.
+
+        Parameters
+        ----------
+        ns : NestedSampler
+            the sampler to be restored; its walkers are initialized
+
+        Returns
+        -------
+        float : log of the width of the present prior mass interval
+
+        Raises
+        ------
+        ValueError when the checkpoint is of another problem or setup.
+        """
+        dynamic = ns.problem.model is not None and ns.problem.model.isDynamic()
+        state = numpy.load( self.stateFile(), allow_pickle=dynamic )
+
+        if "fingerprint" not in state :
+            raise ValueError( "Checkpoint %s has no fingerprint" % self.stateFile() )
+        names = ["number of parameters", "number of data", "model", "data"]
+        differ = [name for name, fp, nsfp in
+                  zip( names, state["fingerprint"], self.fingerprint( ns ) ) if fp != nsfp]
+        if len( differ ) > 0 :
+            raise ValueError( "Checkpoint %s does not match: %s differ" %
+                              ( self.stateFile(), ", ".join( differ ) ) )
+        if int( state["ensemble"] ) != ns.ensemble or int( state["discard"] ) != ns.discard :
+            raise ValueError( "Checkpoint %s does not match: ensemble or discard differ" %
+                              self.stateFile() )
+
+        ns.iteration = int( state["iteration"] )
+        ns.logZ = float( state["logZ"] )
+        ns.info = float( state["info"] )
+        ns.distribution.ncalls = int( state["ncalls"] )
+        ns.distribution.nparts = int( state["nparts"] )
+        for eng, rep in zip( ns.engines, state["reports"] ) :
+            eng.report = [int( r ) for r in rep]
+
+        self.setRngStates( [ns.rng] + [eng.rng for eng in ns.engines], state )
+        self.setPriorStates( ns, state["uvals"] )
+
+        walkers = ns.walkers
+        walkers._count = int( state["walkerCount"] )
+        walkers.logL[:] = state["logL"]
+        walkers.parent[:] = state["parent"]
+        walkers.start[:] = state["start"]
+        for k, walker in enumerate( walkers ) :
+            walker.id = int( state["walkerId"][k] )
+            if dynamic :
+                walker.problem.model = state["models"][k]
+                walker.allpars = state["allpars"][k]
+                walker.fitIndex = state["fitIndex"][k]
+        if not dynamic :
+            walkers.allpars[:] = state["allpars"]
+
+        self._written = int( state["samplesWritten"] )
+        self._offset = int( state["samplesOffset"] )
+        self.restoreSamples( ns, state, dynamic )
+
+        count = int( state["streamCount"] )
+        if ns.stream is not None :
+            ns.stream.truncate( count )
+        elif count > 0 :
+            raise ValueError( "Checkpoint %s needs the stream of samples" % self.stateFile() )
+
+        return float( state["logWidth"] )
+
+    def restoreSamples( self, ns, state, dynamic ):
+        """
+        Rebuild the SampleList from the samples file and the ids in the state.
+
+        Parameters
+        ----------
+        ns : NestedSampler
+            the sampler to be restored
+        state : dict
+            as loaded from the state file
+        dynamic : bool
+            whether the model is dynamic
+        """
+        samples = ns.samples
+        samples.clear()
+        keep = set( state["sampleIds"].tolist() )
+        fitIndex = None if dynamic else state["fitIndex"]
+
+        with open( self.samplesFile(), "rb" ) as fp :
+            while fp.tell() < self._offset :
+                ids = numpy.load( fp )
+                logs = numpy.load( fp )
+                parhynu = [numpy.load( fp, allow_pickle=dynamic ) for k in range( 3 )]
+                if dynamic :
+                    models = numpy.load( fp, allow_pickle=True )
+                    fitIndices = numpy.load( fp, allow_pickle=True )
+
+                for k, ( id, parent, start ) in enumerate( ids ) :
+                    if id not in keep :
+                        continue
+                    model = models[k] if dynamic else ns.problem.model
+                    sample = Sample( int( id ), int( parent ), int( start ), model,
+                                     parameters=parhynu[0][k],
+                                     fitIndex=( fitIndices[k] if dynamic else fitIndex ) )
+                    if parhynu[1].shape[-1:] != ( 0, ) :
+                        sample.hyper = parhynu[1][k]
+                    if parhynu[2].shape[-1:] != ( 0, ) :
+                        sample.nuisance = parhynu[2][k]
+                    sample.logL = float( logs[k,0] )
+                    sample.logW = float( logs[k,1] )
+                    samples.append( sample )
+
+        samples._count = int( state["sampleCount"] )
+        if state["heap"][0] >= 0 :
+            samples._serial = int( state["heap"][0] )
+            samples._heap = [( s.logW, -int( ser ), s )
+                             for s, ser in zip( samples, state["heapSerial"] ) if ser >= 0]
+            heapify( samples._heap )
+
+    #  *************************************************************************
+    def rngStates( self, rngs ):
+        """ Return the states of the random generators, as a dict of arrays.  """
+        states = [rng.get_state() for rng in rngs]
+        pystate = random.getstate()
+        gauss = pystate[2]
+        return { "rngKeys" : numpy.asarray( [st[1] for st in states] ),
+                 "rngPos" : numpy.asarray( [st[2] for st in states] ),
+                 "rngGauss" : numpy.asarray( [[st[3], st[4]] for st in states] ),
+                 "pyRandom" : numpy.asarray( ( pystate[0], ) + pystate[1], dtype=numpy.int64 ),
+                 "pyGauss" : numpy.asarray( [0.0, 0.0] if gauss is None else [1.0, gauss] ) }
+
+    def setRngStates( self, rngs, state ):
+        """ Set the states of the random generators from the state.  """
+        for k, rng in enumerate( rngs ) :
+            rng.set_state( ( "MT19937", state["rngKeys"][k], int( state["rngPos"][k] ),
+                             int( state["rngGauss"][k,0] ), float( state["rngGauss"][k,1] ) ) )
+        pyr = state["pyRandom"]
+        pyg = state["pyGauss"]
+        random.setstate( ( int( pyr[0] ), tuple( int( p ) for p in pyr[1:] ),
+                           float( pyg[1] ) if pyg[0] else None ) )
+
+    def priors( self, ns ):
+        """ Return the priors of the model and of the hyperparameters.  """
+        priors = []
+        model = ns.problem.model
+        while model is not None :
+            priors += list( model.priors or [] )
+            model = model._next
+        return priors + [hp.prior for hp in ns.distribution.hyperpar]
+
+    def priorStates( self, ns ):
+        """ Return the internal values of the priors that keep one (ExponentialPrior). """
+        return [p._uval for p in self.priors( ns ) if hasattr( p, "_uval" )]
+
+    def setPriorStates( self, ns, uvals ):
+        """ Set the internal values of the priors that keep one.  """
+        priors = [p for p in self.priors( ns ) if hasattr( p, "_uval" )]
+        for prior, uval in zip( priors, uvals ) :
+            prior._uval = uval
+
+    def objectArray( self, items ):
+        """ Return the items in a 1-dim array of objects.  """
+        arr = numpy.empty( len( items ), dtype=object )
+        for k, item in enumerate( items ) :
+            arr[k] = item
+        return arr
+
+
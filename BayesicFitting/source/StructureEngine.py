@@ -103,10 +103,9 @@ class StructureEngine( Engine ):
         """
         self.reportCall()
 
-        cwalker = walker.copy()                  ## work on local copy.
-        problem = cwalker.problem
-        ptry = cwalker.allpars
-        ftry = cwalker.fitIndex
+        problem = walker.problem.copy()          ## vary the model in a copy
+        ptry = walker.allpars
+        ftry = walker.fitIndex
 
         if self.verbose > 4 :
             print( "SEN0  ", walker.id, walker.parent, len( ptry ), len( ftry ) )
@@ -120,18 +119,18 @@ class StructureEngine( Engine ):
         if self.verbose > 4 :
             nc = model.ncomp
             np = model.npbase
-            print( "SEN1  ", cwalker.id, nc, np, len( ptry ), len( ftry ) )
+            print( "SEN1  ", walker.id, nc, np, len( ptry ), len( ftry ) )
 
         if not model.vary( rng=self.rng ):
 #            print( "SEN2  ", "failed" )
             self.reportReject()
             return 0
 
-        Ltry = self.errdis.logLikelihood( problem, ptry )
+        Ltry = self.logLikelihood( problem, ptry )
 
         if Ltry >= lowLhood:
             self.reportSuccess()
-            self.setWalker( cwalker, problem, ptry, Ltry, fitIndex=ftry )
+            self.setWalker( walker, problem, ptry, Ltry, fitIndex=ftry )
             wlkr = self.walkers[walker.id]
 
 #            Tools.printclass( walker )
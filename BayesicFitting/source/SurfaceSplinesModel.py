@@ -162,13 +162,19 @@ class SurfaceSplinesModel( LinearModel ):
         parlist : array_like
             not used in this model
         """
-        ndata = Tools.length( xdata[:,0] )
+        ndata = Tools.length( xdata )
         partial = numpy.ones( ( ndata, 1 ), dtype=float )
+        grid = Tools.isGrid( xdata )
         np = 1
         n = 0
         for mdl in self.models :
             nw = numpy.zeros( ( ndata, np * mdl.npbase ), dtype= float )
-            mpart = mdl.basePartial( xdata[:,n], params )
+            if grid :
+                ## splines on the axis positions only
+                ax = xdata.axes[xdata.axis( n )]
+                mpart = xdata.expand( mdl.basePartial( ax, params ), n )
+            else :
+                mpart = mdl.basePartial( xdata[:,n], params )
             k = 0
             for i in range( np ) :
                 for j in range( mdl.npbase ) :
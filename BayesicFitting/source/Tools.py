@@ -6,8 +6,6 @@ import sys
 import trace
 import re
 
-from astropy.table import Table
-
 __author__ = "Do Kester"
 __year__ = 2019
 __license__ = "GPL3"
@@ -50,6 +48,36 @@ def getItem( ilist, k ) :
              ilist[-1] if k >= len( ilist ) else ilist[k] )
 
 
+def isTable( xdata ) :
+    """
+    Return True when xdata is an astropy Table.
+
+    When astropy.table has not been imported (by the user), xdata cannot be a Table.
+
+    Parameters
+    ----------
+    xdata : any
+        the data
+    """
+    if "astropy.table" not in sys.modules :
+        return False
+    from astropy.table import Table
+    return isinstance( xdata, Table )
+
+def isGrid( xdata ) :
+    """
+    Return True when xdata is a PixelGrid (see ImageAssistant.getGrid).
+
+    When the ImageAssistant has not been imported, xdata cannot be a PixelGrid.
+
+    Parameters
+    ----------
+    xdata : any
+        the data
+    """
+    module = sys.modules.get( __name__.rpartition( "." )[0] + ".ImageAssistant" )
+    return module is not None and isinstance( xdata, module.PixelGrid )
+
 def getColumnData( xdata, kcol ) :
     """
     Return the kcol-th column from xdata
@@ -61,13 +89,65 @@ def getColumnData( xdata, kcol ) :
     kcol    int
         column index
     """
-    if isinstance( xdata, Table ) :
+    if isTable( xdata ) :
         return xdata.columns[kcol].data
     elif xdata.ndim == 2 :
         return xdata[:,kcol]
     else :
         return xdata
 
+def sortData( xdata, cache=None ) :
+    """
+    Return the xdata with its (first column) in ascending order.
+
+    When the cache holds a copy of the same (first column of) xdata, it is
+    returned as is. Comparing the values is cheaper than sorting them again and
+    it also notices xdata that are changed in place.
+
+    Parameters
+    ----------
+    xdata : array_like
+        1-d array, or 2-d array of which the first column is sorted
+    cache : None or tuple
+        the result of a previous call
+
+    Returns
+    -------
+    tuple of ( xcol, xsort, order )
+        xcol  : a copy of the (first column of) xdata
+        xsort : the (first column of) xdata in ascending order
+        order : sorting index; None when xdata are in ascending order already
+    """
+    xcol = xdata if xdata.ndim == 1 else xdata[:,0]
+    if cache is not None and numpy.array_equal( cache[0], xcol ) :
+        return cache
+
+    xcol = numpy.array( xcol )
+    if numpy.all( xcol[1:] >= xcol[:-1] ) :
+        return ( xcol, xcol, None )
+    order = numpy.argsort( xcol, kind="stable" )
+    return ( xcol, xcol[order], order )
+
+def windowIndex( sorted, low, high ) :
+    """
+    Return an index to the xdata which are within [low,high].
+
+    Parameters
+    ----------
+    sorted : tuple
+        the result of sortData
+    low, high : float
+        limits of the window
+
+    Returns
+    -------
+    slice when the xdata are in ascending order; otherwise an index array
+    """
+    xcol, xsort, order = sorted
+    lo = numpy.searchsorted( xsort, low, side="left" )
+    hi = numpy.searchsorted( xsort, high, side="right" )
+    return slice( lo, hi ) if order is None else order[lo:hi]
+
 def isBetween( xs, x, xe ) :
     """
     Return True when x falls between xs and xe or on xs or xe.
@@ -259,7 +339,7 @@ def toArray( x, ndim=1, dtype=None ) :
         conversion to type (None : as is)
 
     """
-    if isinstance( x, Table ) :
+    if isTable( x ) or isGrid( x ) :
         return x
     return numpy.array( x, dtype=dtype, copy=False, ndmin=ndim )
 
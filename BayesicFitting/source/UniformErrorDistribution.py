@@ -174,6 +174,28 @@ class UniformErrorDistribution( ScaledErrorDistribution ):
         return lld
 
 
+    def logLdataBatch( self, problem, allparsMatrix, mockdata ) :
+        """
+        Return the log( likelihood ) for each residual, for K sets of parameters.
+
+        Parameters
+        ----------
+        problem : Problem
+            to be solved
+        allparsMatrix : array_like of shape (K,npars+nphypar)
+            K sets of parameters of the problem
+        mockdata : array_like of shape (K,N)
+            as calculated by the model for each parameter set
+
+        """
+        scale = allparsMatrix[:,-1:]
+        ares = numpy.abs( problem.ydata - mockdata )
+
+        lld = numpy.where( ares < scale, -numpy.log( 2 * scale ), -math.inf )
+        if problem.weights is not None :
+            lld *= problem.weights
+        return lld
+
     def partialLogL_alt( self, problem, allpars, fitIndex ) :
         """
         Return the partial derivative of log( likelihood ) to the parameters.
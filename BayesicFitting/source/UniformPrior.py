@@ -1,4 +1,5 @@
 import math
+import numpy as numpy
 
 from .Prior import Prior
 
@@ -48,6 +49,7 @@ class UniformPrior( Prior ):
         valid range ( highLimit - lowLimit )
 
     """
+    VECTORIZED = True               # unit2Domain and domain2Unit accept arrays
 
     #  *********CONSTRUCTORS***************************************************
     def __init__( self, limits=None, prior=None ):
@@ -80,13 +82,18 @@ class UniformPrior( Prior ):
 
         Parameters
         ----------
-        dval : float
-            value within the domain of a parameter
+        dval : float or array_like
+            value(s) within the domain of a parameter
 
         """
         if math.isinf( self._range ) :
             raise AttributeError( "Limits are needed for UniformPrior" )
-        return 0 if self.isOutOfLimits( dval ) else ( dval - self.lowLimit ) / self._range
+        if numpy.ndim( dval ) == 0 :
+            return 0 if self.isOutOfLimits( dval ) else ( dval - self.lowLimit ) / self._range
+
+        dval = numpy.asarray( dval )
+        out = numpy.logical_or( dval < self.lowLimit, dval > self.highLimit )
+        return numpy.where( out, 0.0, ( dval - self.lowLimit ) / self._range )
 
     def unit2Domain( self, uval ):
         """
@@ -95,8 +102,8 @@ class UniformPrior( Prior ):
 
         Parameters
         ----------
-        uval : float
-            value within [0,1]
+        uval : float or array_like
+            value(s) within [0,1]
 
         """
         if math.isinf( self._range ) :
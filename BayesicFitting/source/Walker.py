@@ -40,6 +40,9 @@ class Walker( object ):
 
     Each Walker maintains 5 attributes
 
+    When the Walker is a member of a WalkerList, the attributes allpars, logL,
+    parent and start are views into the arrays of the WalkerList.
+
     Attributes
     ----------
     id : int
@@ -67,6 +70,9 @@ class Walker( object ):
 
     """
 
+    #  attributes that are views into the arrays of a WalkerList
+    VIEWS = {"allpars" : None, "logL" : float, "parent" : int, "start" : int}
+
     def __init__( self, id, problem, allpars, fitIndex, parent=-1, start=0, copy=None ):
         """
         Constructor.
@@ -115,9 +121,44 @@ class Walker( object ):
         Copy.
 
         The copy points to the same instance of model.
+        The copy is not a member of a WalkerList.
         """
         return Walker( self.id, self.problem, self.allpars, self.fitIndex, copy=self )
 
+    def attach( self, walkerlist, row ) :
+        """
+        Make the walker a view into row of the walkerlist.
+
+        The values of the walker are copied into the arrays of the walkerlist.
+
+        Parameters
+        ----------
+        walkerlist : WalkerList
+            the list to attach to
+        row : int
+            the row in the arrays of the list
+        """
+        self.detach()
+        for name in self.VIEWS :
+            if name in self.__dict__ and walkerlist.hasView( name ) :
+                walkerlist.setView( row, name, self.__dict__.pop( name ) )
+        object.__setattr__( self, "_view", ( walkerlist, row ) )
+
+    def detach( self ) :
+        """
+        Take the walker out of the arrays of its WalkerList, keeping its values.
+        """
+        view = self.__dict__.pop( "_view", None )
+        if view is None :
+            return
+        walkerlist, row = view
+        for name in self.VIEWS :
+            if walkerlist.hasView( name ) :
+                value = walkerlist.getView( row, name )
+                if name == "allpars" :
+                    value = value.copy()
+                object.__setattr__( self, name, value )
+
     def toSample( self, logW ) :
         """
         Return the contents of the Walker as a Sample.
@@ -126,14 +167,14 @@ class Walker( object ):
         np = self.problem.npars
         nm = self.problem.model.npars if self.problem.model else np
 
-        param = self.allpars[:nm]
+        param = self.allpars[:nm].copy()
         sample = Sample( self.id, self.parent, self.start, self.problem.model,
                          parameters=param, fitIndex=self.fitIndex )
 
         if len( self.allpars ) > np :
-            sample.hyper = self.allpars[np:]
+            sample.hyper = self.allpars[np:].copy()
         if np > nm :
-            sample.nuisance = self.allpars[nm:np]
+            sample.nuisance = self.allpars[nm:np].copy()
 
         sample.logL = self.logL
         sample.logW = logW
@@ -144,7 +185,10 @@ class Walker( object ):
         Return the value of one of `parameters`, `scale`,
 
         """
-        if name == "parameters" :
+        if name in self.VIEWS and "_view" in self.__dict__ :
+            walkerlist, row = self.__dict__["_view"]
+            return walkerlist.getView( row, name )
+        elif name == "parameters" :
             np = self.problem.model.npars
             return self.allpars[:np]
         elif name == "hypars" :
@@ -162,6 +206,13 @@ class Walker( object ):
         """
         Set attributes.
         """
+        view = self.__dict__.get( "_view" )
+        if view is not None and name in self.VIEWS and view[0].hasView( name ) :
+            if name != "allpars" and not Tools.isInstance( value, self.VIEWS[name] ) :
+                raise TypeError( name + ' has not the proper type: ' + str( self.VIEWS[name] ) )
+            view[0].setView( view[1], name, value )
+            return
+
         if name == "allpars" or name == "fitIndex":
             object.__setattr__( self, name, value )
             return
@@ -1,5 +1,4 @@
 import numpy as numpy
-from astropy import units
 import math
 from . import Tools
 from .Walker import Walker
@@ -37,6 +36,15 @@ class WalkerList( list ):
     """
     WalkerList is a list of `Walker`s
 
+    The parameters, logLs, parents and starts of the walkers are kept in arrays,
+    one row per walker. The walkers in the list are views into these arrays.
+    The arrays grow geometrically, so that appending walkers one by one takes
+    amortized constant time.
+    For dynamic models, where the number of parameters varies, the walkers
+    keep their own parameters.
+
+    Walkers are added by `append()` and replaced by item assignment.
+
     WalkerList is the main result of the NestedSampler. It contains all
     information to calculate averages, medians, modi or maximum likihood solutions
     of the parameters, or of any function of the parameters; in particular of the
@@ -94,6 +102,21 @@ class WalkerList( list ):
     normalized : bool
         True when the weights are normalized to SUM( weights ) = 1
 
+    allpars : numpy.array of shape (nwalkers, npars) or None
+        the (hyper)parameters of all walkers; None for dynamic models
+    logL : numpy.array of shape (nwalkers,)
+        the log likelihoods of all walkers
+    parent : numpy.array of shape (nwalkers,)
+        the ids of the parents of all walkers
+    start : numpy.array of shape (nwalkers,)
+        the iterations in which the walkers were started
+
+    Hidden Attributes
+    -----------------
+    _columns : dict of {str : numpy.array}
+        the arrays with room for more walkers, of which allpars, logL, parent
+        and start are the first nwalkers rows. No allpars for dynamic models.
+
 
     Author       Do Kester
 
@@ -120,10 +143,19 @@ class WalkerList( list ):
         self.logZ = 0.0
         self.info = 0.0
         allpars = numpy.asarray( allpars )
+
+        dynamic = problem.model and problem.model.isDynamic()
+        self._columns = { "logL" : numpy.zeros( 0, dtype=float ),
+                          "parent" : numpy.zeros( 0, dtype=int ),
+                          "start" : numpy.zeros( 0, dtype=int ) }
+        if not dynamic :
+            self._columns["allpars"] = numpy.zeros( ( 0, len( allpars ) ), dtype=float )
+
         self.addWalkers( problem, nsamples, allpars, fitIndex )
 
 
     def addWalkers( self, problem, nWalkers, allpars, fitIndex ):
+        self.reserve( nWalkers )
         for i in range( nWalkers ) :
             if problem.model and problem.model.isDynamic() :
                 problem = problem.copy()
@@ -132,6 +164,112 @@ class WalkerList( list ):
             self.append( walker )
             self._count += 1
 
+    def reserve( self, nrows ) :
+        """
+        Make room in the arrays for nrows more walkers.
+
+        Parameters
+        ----------
+        nrows : int
+            number of rows to add
+        """
+        n = len( self )
+        if n + nrows <= len( self._columns["logL"] ) :
+            return
+
+        size = 2 * ( n + nrows )
+        for name, col in self._columns.items() :
+            new = numpy.zeros( ( size, ) + col.shape[1:], dtype=col.dtype )
+            new[:n] = col[:n]
+            self._columns[name] = new
+
+    def append( self, walker ) :
+        """
+        Append a walker to the list; it becomes a view into the arrays.
+
+        Parameters
+        ----------
+        walker : Walker
+            the walker to be appended
+        """
+        if "_view" in walker.__dict__ :
+            walker = walker.copy()
+        row = len( self )
+        self.reserve( 1 )
+        super( WalkerList, self ).append( walker )
+        walker.attach( self, row )
+
+    def __setitem__( self, k, walker ) :
+        """
+        Replace the walker at k; the new one becomes a view into the arrays.
+
+        Parameters
+        ----------
+        k : int
+            index of the walker
+        walker : Walker
+            the walker to be placed at k
+        """
+        k = range( len( self ) )[k]
+        old = super( WalkerList, self ).__getitem__( k )
+        if old is walker :
+            return
+        if "_view" in walker.__dict__ :
+            walker = walker.copy()
+        old.detach()
+        super( WalkerList, self ).__setitem__( k, walker )
+        walker.attach( self, k )
+
+    def hasView( self, name ) :
+        """ Return whether the attribute (of a walker) is kept in an array.  """
+        return name in self._columns
+
+    def getView( self, row, name ) :
+        """
+        Return the attribute of the walker at row.
+
+        Parameters
+        ----------
+        row : int
+            row of the walker
+        name : str
+            name of the attribute: "allpars", "logL", "parent" or "start"
+        """
+        if name == "allpars" :
+            return self._columns[name][row]
+        elif name == "logL" :
+            return float( self._columns[name][row] )
+        else :
+            return int( self._columns[name][row] )
+
+    def setView( self, row, name, value ) :
+        """
+        Set the attribute of the walker at row.
+
+        Parameters
+        ----------
+        row : int
+            row of the walker
+        name : str
+            name of the attribute: "allpars", "logL", "parent" or "start"
+        value : array_like or float or int
+            the value
+        """
+        column = self._columns[name]
+        if name == "allpars" and len( value ) != column.shape[1] :
+            raise ValueError( "Walker %d: wrong number of parameters: %d is not %d" %
+                    ( row, len( value ), column.shape[1] ) )
+        column[row] = value
+
+    def __getattr__( self, name ) :
+        """
+        Return allpars, logL, parent or start: the rows of the walkers in the arrays.
+        """
+        if name in ["allpars", "logL", "parent", "start"] and "_columns" in self.__dict__ :
+            column = self._columns.get( name )
+            return None if column is None else column[:len( self )]
+        raise AttributeError( "Unknown attribute " + name )
+
     # ===========================================================================
     def add( self, samplelist, index ):
         """
@@ -187,13 +325,14 @@ class WalkerList( list ):
             the parameter to be selected. Default: all
 
         """
-        pe = []
-        for sample in self :
-            pe += [sample.parameters]
+        if self.allpars is not None :
+            pe = self.allpars[:,:self[0].problem.model.npars]
+        else :
+            pe = numpy.asarray( [sample.parameters for sample in self] )
         if kpar is None :
-            return numpy.asarray( pe )
+            return pe.copy()
         else :
-            return numpy.asarray( pe )[:,kpar]
+            return pe[:,kpar]
 
     def getScaleEvolution( self ):
         """ Return the evolution of the scale.  """
@@ -202,21 +341,13 @@ class WalkerList( list ):
 
     def getLogLikelihoodEvolution( self ):
         """ Return the evolution of the log( Likelihood ).  """
-        pe = [sample.logL for sample in self]
-        return numpy.asarray( pe )
+        return self.logL.copy()
 
     def getLowLogL( self ):
         """
         Return the lowest value of logL in the samplelist, plus its index.
         """
-        low = self[0].logL
-        klo = 0
-        k = 0
-        for sample in self :
-            if sample.logL < low :
-                klo = k
-                low = sample.logL
-            k += 1
-        return ( low, klo )
+        klo = int( numpy.argmin( self.logL ) )
+        return ( float( self.logL[klo] ), klo )
 
 
@@ -1,57 +1,48 @@
 # -*- coding: utf-8 -*-
-"""Python/Numpy implementation of Bspline basis functions via Cox - de Boor algorithm."""
+"""Python/Numpy implementation of Bspline basis functions via the de Boor algorithm."""
 
 from __future__ import division
 
-from functools import partial
+from collections import OrderedDict
 import numpy as np
 
-class memoize(object):
+class LruCache(object):
     """
-       Cache the return value of a method
-
-       This class is meant to be used as a decorator of methods. The return value
-       from a given method invocation will be cached on the instance whose method
-       was invoked. All arguments passed to a method decorated with memoize must
-       be hashable.
-
-       If a memoized method is invoked directly on its class the result will not
-       be cached. Instead the method will be invoked like a static method:
-       class Obj(object):
-           @memoize
-           def add_to(self, arg):
-               return self + arg
-       Obj.add_to(1) # not enough arguments
-       Obj.add_to(1, 2) # returns 3, result is not cached
-
-       Script borrowed from here:
-       MIT Licensed, attributed to Daniel Miller, Wed, 3 Nov 2010
-       http://code.activestate.com/recipes/577452-a-memoize-decorator-for-instance-methods/
+       Bounded cache of collocation matrices.
+
+       The entries are keyed by the contents of the collocation sites and the
+       derivative order. A copy of the sites is kept to exclude hash collisions,
+       and the cached matrices are read-only. When the cache is full, the least
+       recently used entry is removed.
     """
-    def __init__(self, func):
-        self.func = func
-    def __get__(self, obj, objtype=None):
-        if obj is None:
-            return self.func
-        return partial(self, obj)
-    def __call__(self, *args, **kw):
-        obj = args[0]
-        try:
-            cache = obj.__cache
-        except AttributeError:
-            cache = obj.__cache = {}
-        key = (self.func, args[1:], frozenset(kw.items()))
-        try:
-            res = cache[key]
-        except KeyError:
-            res = cache[key] = self.func(*args, **kw)
+    def __init__(self, size=4):
+        self.size = size
+        self.entries = OrderedDict()
+
+    def get(self, tau, deriv_order, func):
+        """
+        Return the cached value for (tau, deriv_order), or store func(tau, deriv_order).
+        """
+        key = (deriv_order, tau.shape, hash(tau.tobytes()))
+        entry = self.entries.get(key)
+        if entry is not None and np.array_equal(entry[0], tau):
+            self.entries.move_to_end(key)
+            return entry[1]
+
+        res = func(tau, deriv_order)
+        res.flags.writeable = False
+        self.entries[key] = (tau.copy(), res)
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
         return res
 
+    def clear(self):
+        self.entries.clear()
 
 
 class Bspline():
     """
-    Numpy implementation of Cox - de Boor algorithm in 1D
+    Numpy implementation of de Boor algorithm in 1D
 
     inputs:
         knot_vector: Python list or Numpy array containing knot vector
@@ -60,89 +51,40 @@ class Bspline():
                   knots, 1 -> piecewise linear between knots, etc.
     last : bool
         if True the xi equal to the value of the last knot are also taken along
+    cachesize : int
+        number of collocation matrices kept in the cache of `collmat`
 
     outputs:
            basis object that is callable to evaluate basis functions at given
            values of knot span
     """
 
-    def __init__(self, knot_vector, order, last=False ):
+    def __init__(self, knot_vector, order, last=False, cachesize=4 ):
         """Initialize attributes"""
-        self.knot_vector = np.array(knot_vector)
-        if last :
-            self.last_knot = np.full_like( knot_vector, knot_vector[0] - 1 )
-            self.last_knot[-order-1] = knot_vector[-order-1]
+        self.knot_vector = np.array(knot_vector, dtype=float)
         self.last = last
         self.p = order
+        self.nbasis = len(self.knot_vector) - order - 1
+        self.cache = LruCache(size=cachesize)
 
-        #Dummy calls to the functions for memory storage
-        self.__call__(0.0)
-        self.d(0.0)
-
-
-    def __basis0(self, xi):
-        """Order zero basis"""
-
-        upper =  xi < self.knot_vector[1:]
-        if self.last :
-            upper = np.any( [upper, xi == self.last_knot[1:]], axis=0 )
-
-        b = np.where(np.all([self.knot_vector[:-1] <= xi, upper], axis=0 ), 1.0, 0.0 )
-        return b
-
-    def __basis(self, xi, p, compute_derivatives=False):
-        """
-        Recursive Cox - de Boor function to compute basis functions and
-           optionally their derivatives
-        """
+        # knot vector padded with p extra end knots on both sides, so that the
+        # local recursion never reaches beyond its ends. A basis function only
+        # depends on its own knots, so the padding does not change them.
+        t = self.knot_vector
+        self.padded = np.concatenate([np.full(order, t[0]), t, np.full(order, t[-1])])
 
-        if p == 0:
-            return self.__basis0(xi)
-        else:
-            basis_p_minus_1 = self.__basis(xi, p - 1)
 
-        first_term_numerator = xi - self.knot_vector[:-p]
-        first_term_denominator = self.knot_vector[p:] - self.knot_vector[:-p]
-
-        second_term_numerator = self.knot_vector[(p + 1):] - xi
-        second_term_denominator = (self.knot_vector[(p + 1):] -
-                                   self.knot_vector[1:-p])
-
-
-        #Change numerator in last recursion if derivatives are desired
-        if compute_derivatives and p == self.p:
-
-            first_term_numerator = p
-            second_term_numerator = -p
-
-        #Disable divide by zero error because we check for it
-        with np.errstate(divide='ignore', invalid='ignore'):
-            first_term = np.where(first_term_denominator != 0.0,
-                                  (first_term_numerator /
-                                   first_term_denominator), 0.0)
-            second_term = np.where(second_term_denominator != 0.0,
-                                   (second_term_numerator /
-                                    second_term_denominator), 0.0)
-
-        return  (first_term[:-1] * basis_p_minus_1[:-1] +
-                 second_term * basis_p_minus_1[1:])
-
-
-    @memoize
     def __call__(self, xi):
         """
-        Convenience function to make the object callable.  Also 'memoized'
-           for speed.
+        Convenience function to make the object callable.
         """
-        return self.__basis(xi, self.p, compute_derivatives=False)
+        return self.collmat(xi)
 
-    @memoize
     def d(self, xi):
         """
         Convenience function to compute derivate of basis functions.
-           'Memoized' for speed.
         """
-        return self.__basis(xi, self.p, compute_derivatives=True)
+        return self.collmat(xi, deriv_order=1)
 
     def plot(self):
         """
@@ -270,6 +212,8 @@ class Bspline():
         """
         Compute collocation matrix.
 
+        The results are kept in a bounded cache, see `LruCache`.
+
         Parameters:
         tau:
             Python list or rank-1 array, collocation sites
@@ -295,17 +239,104 @@ class Bspline():
         Similarly for derivatives (if the supplied `deriv_order`> 0).
 
         """
-        # get number of basis functions and output dtype
-        dummy = self.__call__(0.)
-        nbasis = dummy.shape[0]
-
-        tau = np.atleast_1d(tau)
+        tau = np.atleast_1d( np.asarray( tau, dtype=float ) )
         if tau.ndim > 1:
             raise ValueError("tau must be a list or a rank-1 array")
 
-        A = np.empty( (tau.shape[0], nbasis), dtype=dummy.dtype )
-        f = self.diff(order=deriv_order)
-        for i,taui in enumerate(tau):
-            A[i,:] = f(taui)
+        return np.squeeze( self.cache.get( tau, int( deriv_order ), self.__collmat ) )
+
+    def __collmat(self, tau, deriv_order):
+        """ Scatter the banded collocation matrix into a full one.  """
+        first, band = self.collband(tau, deriv_order=deriv_order)
+
+        A = np.zeros( (tau.shape[0] + 1, self.nbasis + 2 * self.p), dtype=float )
+        rows = np.arange( tau.shape[0] )
+        rows[self.__outside(tau)] = tau.shape[0]        # dump row
+        for k in range( self.p + 1 ):
+            A[rows, first + k + self.p] = band[:,k]
+
+        return A[:-1, self.p:self.p+self.nbasis]
+
+    def __outside(self, tau):
+        """ Return True where tau is outside the domain of the knots.  """
+        t = self.knot_vector
+        upper = ( tau > t[-1] ) if self.last else ( tau >= t[-1] )
+        return ( tau < t[0] ) | upper
+
+    def collband(self, tau, deriv_order=0):
+        """
+        Compute the collocation matrix in banded form.
+
+        At any site only p+1 consecutive basis functions are nonzero. They are
+        evaluated for all sites at once with the local de Boor recursion.
+        Derivatives follow from the values of the basis functions of lower
+        order, with the same recursion as in `diff`.
+
+        For clamped knot vectors (with p+1 equal knots at both ends, see
+        `splinelab.augknt`), the columns first[i]..first[i]+p are valid basis
+        functions for all sites inside the knots. Otherwise the columns outside
+        0..nbasis-1 should be ignored.
+
+        Parameters:
+        tau:
+            Python list or rank-1 array, collocation sites
+        deriv_order:
+            int, >=0, order of derivative for which to compute the band.
+
+        Returns:
+        first:
+            rank-1 int array, index of the first nonzero basis function at tau[i]
+        band:
+            rank-2 array of shape (len(tau), p+1) such that
+                band[i,k] = D**deriv_order B_(first[i]+k)(tau[i])
+
+        """
+        t = self.padded
+        p = self.p
+
+        tau = np.atleast_1d( np.asarray( tau, dtype=float ) )
+        if tau.ndim > 1:
+            raise ValueError("tau must be a list or a rank-1 array")
 
-        return np.squeeze(A)
+        # knot span t[span] <= tau < t[span+1]; the last knot is in the last nonempty span
+        span = np.searchsorted( t, tau, side='right' ) - 1
+        atlast = tau >= t[-1]
+        span[atlast] = np.searchsorted( t, t[-1], side='left' ) - 1
+        span = np.clip( span, p, len( t ) - p - 2 )
+
+        band = np.zeros( ( tau.shape[0], p + 1 ), dtype=float )
+        if deriv_order > p:
+            return span - 2 * p, band
+
+        # values of the basis functions of order q, in the first q+1 columns
+        q = p - deriv_order
+        band[:,0] = 1.0
+        left = np.empty( ( tau.shape[0], p + 1 ), dtype=float )
+        right = np.empty( ( tau.shape[0], p + 1 ), dtype=float )
+        for j in range( 1, q + 1 ):
+            left[:,j] = tau - t[span+1-j]
+            right[:,j] = t[span+j] - tau
+            saved = np.zeros_like( tau )
+            for r in range( j ):
+                denom = right[:,r+1] + left[:,j-r]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    temp = np.where( denom != 0.0, band[:,r] / denom, 0.0 )
+                band[:,r] = saved + right[:,r+1] * temp
+                saved = left[:,j-r] * temp
+            band[:,j] = saved
+
+        # D B_(i,j) = j * ( B_(i,j-1) / (t[i+j]-t[i]) - B_(i+1,j-1) / (t[i+j+1]-t[i+1]) )
+        for j in range( q + 1, p + 1 ):
+            lower = band[:,:j].copy()
+            band[:,:j+1] = 0.0
+            for k in range( j + 1 ):
+                i = span - j + k
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    if k > 0:
+                        denom = t[i+j] - t[i]
+                        band[:,k] += np.where( denom != 0.0, j * lower[:,k-1] / denom, 0.0 )
+                    if k < j:
+                        denom = t[i+j+1] - t[i+1]
+                        band[:,k] -= np.where( denom != 0.0, j * lower[:,k] / denom, 0.0 )
+
+        return span - 2 * p, band
@@ -438,6 +438,63 @@ class TestCompoundModel( unittest.TestCase ):
 
         numpy.testing.assert_array_equal( m.result( x ), mc.result( x ) )
 
+    def testResultBatch( self ):
+        print( "******RESULT BATCH*********************" )
+        x = numpy.linspace( -2, 3, 51, dtype=float )
+        numpy.random.seed( 2345 )
+
+        m1 = GaussModel( )
+        m1 += PolynomialModel( 1 )
+        m1 *= ExpModel( )
+        m1 -= SineModel( )
+        m2 = PolynomialModel( 1 )
+        m2 |= SineModel( )
+        m2 /= PolynomialModel( 0 )
+        m3 = ArctanModel( )
+        m3 += HarmonicModel( 2 )
+        m4 = PolynomialModel( 1, fixed={ 1 : 0.5 } )
+        m4 += GaussModel( )
+
+        for m in [m1, m2, m3, m4] :
+            print( m )
+            pmat = numpy.random.rand( 7, m.npars ) + 0.5
+            res = m.resultBatch( x, pmat )
+            self.assertTrue( res.shape == ( 7, len( x ) ) )
+            for k in range( 7 ) :
+                numpy.testing.assert_array_almost_equal( res[k], m.result( x, pmat[k] ) )
+
+    def testUpdateResult( self ):
+        print( "******UPDATE RESULT*********************" )
+        x = numpy.linspace( -2, 3, 51, dtype=float )
+        numpy.random.seed( 3456 )
+
+        m1 = GaussModel( )
+        m1 += PolynomialModel( 2 )
+        m1 -= SineModel( )
+        m2 = PolynomialModel( 1 )
+        m2 += HarmonicModel( 2 )
+        m3 = PolynomialModel( 1, fixed={ 1 : 0.5 } )
+        m3 -= GaussModel( )
+        m4 = PolynomialModel( 1 )
+        m4 *= ExpModel( )
+
+        for m in [m1, m2, m3, m4] :
+            print( m )
+            par = numpy.random.rand( m.npars ) + 0.5
+            res = m.result( x, par )
+            for k in range( m.npars ) :
+                new = par.copy()
+                new[k] += 0.3
+                upd = m.updateResult( x, res, new, { k : par[k] } )
+                if m is m4 :
+                    self.assertTrue( upd is None )
+                    continue
+                numpy.testing.assert_array_almost_equal( upd, m.result( x, new ) )
+
+        pm = PolynomialModel( 2 )
+        self.assertTrue( pm.updateResult( x, res, par[:3], {} ) is not None )
+        self.assertTrue( SineModel().updateResult( x, res, par[:3], { 0 : 1.0 } ) is None )
+
     def suite( cls ):
         return unittest.TestCase.suite( CompoundModelTest.__class__ )
 
@@ -85,6 +85,37 @@ class TestDynamicModel( unittest.TestCase ):
         print( "fin      ", fmt( fin, max=None ) )
 
 
+    def testDecisionTreeLeafIndex( self ) :
+        print( "  Test DecisionTreeModel leaf index" )
+        x = numpy.linspace( 0, 1, 21 ).reshape( -1, 1 )
+        m = DecisionTreeModel( ndim=1, depth=2, kdim=[0,0,0], split=[0.5,0.5,0.5] )
+        p = numpy.asarray( [1.0, 2.0, 3.0, 4.0] )
+
+        lix = m.getLeafIndex( x )
+        self.assertTrue( m.getLeafIndex( x ) is lix )
+        self.assertTrue( numpy.all( numpy.diff( lix ) <= 0 ) )     ## high x go left
+        self.assertTrue( numpy.all( m.result( x, p ) == p[lix] ) )
+        part = m.partial( x, p )
+        self.assertTrue( numpy.all( part.sum( axis=1 ) == 1 ) )
+        self.assertTrue( numpy.all( part[numpy.arange( 21 ), lix] == 1 ) )
+        self.assertTrue( numpy.all( numpy.diff( lix[m.sortXdata( x )] ) >= 0 ) )
+
+        m.vary( location=0, split=0.2, kdim=0 )
+        self.assertTrue( m.getLeafIndex( x ) is not lix )
+        lix = m.getLeafIndex( x )
+        m.grow( location=3 )
+        self.assertTrue( m.getLeafIndex( x ) is not lix )
+        self.assertTrue( numpy.max( m.getLeafIndex( x ) ) == 4 )
+
+        ## xdata changed in place get a new index
+        lix = m.getLeafIndex( x )
+        self.assertTrue( m.getLeafIndex( x.copy() ) is lix )
+        x *= -1
+        self.assertTrue( numpy.array_equal( m.getLeafIndex( x ), m.copy().getLeafIndex( x ) ) )
+        self.assertFalse( numpy.array_equal( m.getLeafIndex( x ), lix ) )
+        p = numpy.arange( 1.0, m.npars + 1 )
+        self.assertTrue( numpy.all( m.result( x, p ) == p[m.getLeafIndex( x )] ) )
+
     def test1Model1( self ):
         print( "  Test PolynomialDynamicModel" )
         m = PolynomialDynamicModel( 0 )
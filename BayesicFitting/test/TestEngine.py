@@ -119,6 +119,149 @@ class TestEngine( unittest.TestCase ):
         print( "DomR  ", engine.unit2Domain( problem, engine.unitRange ) )
         engine.printReport()
 
+    def testPriorGroups( self ):
+        print( "\n   Engine prior groups Test\n" )
+        x = numpy.linspace( -1, 1, 11 )
+        m = PolynomialModel( 3 )
+        m.setPrior( 0, prior=UniformPrior(), limits=[-2,2] )
+        m.setPrior( 1, prior=JeffreysPrior(), limits=[0.1,10] )
+        m.setPrior( 2, prior=GaussPrior( scale=2 ) )
+        m.setPrior( 3, prior=LaplacePrior( scale=1 ) )
+        g = GaussModel( )
+        g.setPrior( 0, prior=CauchyPrior( scale=3 ) )
+        g.setPrior( 1, prior=UniformPrior(), limits=[-1,1] )
+        g.setPrior( 2, prior=ExponentialPrior( scale=2 ) )
+        m.addModel( g )
+
+        errdis = GaussErrorDistribution( )
+        errdis.setLimits( [0.1, 10.0] )
+        problem = ClassicProblem( m, x, x )
+        engine = Engine( None, errdis )
+
+        fi = [5,0,3,6,1,4,2,-1]
+        uval = numpy.linspace( 0.05, 0.95, len( fi ) )
+        dval = engine.unit2Domain( problem, uval, kpar=fi )
+        for i,kp in enumerate( fi ) :
+            dv = ( problem.unit2Domain( uval[i], kp ) if kp >= 0 else
+                   errdis.unit2Domain( uval[i], kp ) )
+            self.assertAlmostEqual( dval[i], dv )
+        assertAAE( engine.domain2Unit( problem, dval, kpar=fi ), uval )
+
+        groups, single, hyper = engine.getPriorGroups( problem, fi )
+        self.assertTrue( len( groups ) == 7 and len( single ) == 0 )
+        assertAAE( hyper, [7] )
+        self.assertTrue( engine.getPriorGroups( problem, fi )[0] is groups )
+
+        ## changing a prior or the index regroups
+        m.setPrior( 0, prior=UniformPrior(), limits=[0,4] )
+        self.assertTrue( m._priorGroups is None )
+        self.assertTrue( engine.getPriorGroups( problem, fi )[0] is not groups )
+        self.assertAlmostEqual( engine.unit2Domain( problem, uval, kpar=fi )[1], 4 * uval[1] )
+        self.assertTrue( len( engine.getPriorGroups( problem, [0,1] )[0] ) == 2 )
+        groups = engine.getPriorGroups( problem, fi )[0]
+        m.setLimits( [-3], [3] )
+        self.assertTrue( engine.getPriorGroups( problem, fi )[0] is not groups )
+        self.assertAlmostEqual( engine.unit2Domain( problem, uval, kpar=fi )[1], 6 * uval[1] - 3 )
+
+        ## priors that take floats only, go one by one
+        class SquarePrior( Prior ) :
+            def unit2Domain( self, uval ) :
+                return 2 * math.sqrt( uval )
+            def domain2Unit( self, dval ) :
+                return ( dval / 2 ) ** 2 if dval > 0 else 0.0
+            def copy( self ) :
+                return SquarePrior( )
+
+        sp = SquarePrior( )
+        m.setPrior( 4, prior=sp )
+        m.setPrior( 6, prior=sp )
+        groups, single, hyper = engine.getPriorGroups( problem, fi )
+        self.assertTrue( len( groups ) == 5 )
+        assertAAE( single, [3,5] )
+        dval = engine.unit2Domain( problem, uval, kpar=fi )
+        self.assertAlmostEqual( dval[5], 2 * math.sqrt( uval[5] ) )
+        assertAAE( engine.domain2Unit( problem, dval, kpar=fi ), uval )
+
+    def testCommit( self ):
+        print( "\n   Engine commit Test\n" )
+        m, xdata, data = self.initEngine()
+        errdis = GaussErrorDistribution( )
+        errdis.setLimits( [0.1, 10.0] )
+        problem = ClassicProblem( m, xdata, data )
+
+        allpars = numpy.append( m.parameters, 1.0 )
+        wl = WalkerList( problem, 11, allpars, [0,1,2,-1] )
+        start = StartEngine( wl, errdis, seed=2345 )
+        for w in wl :
+            start.execute( w, -math.inf )
+
+        for eng in [GalileanEngine, ChordEngine, GibbsEngine, StepEngine] :
+            engine = eng( wl, errdis, seed=4567 )
+            engine.calculateUnitRange()
+            walker = wl[3]
+            lowL = float( numpy.min( wl.logL[:-1] ) )
+            moves = engine.execute( walker, lowL )
+            print( engine, moves, walker.logL )
+
+            ## the walker is updated in place
+            self.assertTrue( wl[3] is walker )
+            self.assertTrue( numpy.shares_memory( walker.allpars, wl.allpars ) )
+            self.assertAlmostEqual( walker.logL,
+                                    errdis.logLikelihood( problem, walker.allpars ) )
+            self.assertTrue( wl[-1].logL >= walker.logL )
+
+            ## the scratch arrays of the engine are not shared with the walkers
+            keep = wl.allpars.copy()
+            engine.getScratch( walker.allpars, nbuf=3 )[:] = 0.0
+            assertAAE( wl.allpars, keep )
+
+    def testWalkerList( self ):
+        print( "\n   WalkerList Test\n" )
+        m, xdata, data = self.initEngine()
+        problem = ClassicProblem( m, xdata, data )
+
+        allpars = numpy.append( m.parameters, 1.0 )
+        wl = WalkerList( problem, 5, allpars, [0,1,2,-1] )
+        self.assertTrue( wl.allpars.shape == ( 5, 4 ) )
+
+        for k, w in enumerate( wl ) :
+            w.allpars = allpars + k
+            w.logL = -k
+            self.assertTrue( numpy.shares_memory( w.allpars, wl.allpars ) )
+        assertAAE( wl.allpars[:,0], allpars[0] + numpy.arange( 5 ) )
+        assertAAE( wl.logL, -numpy.arange( 5 ) )
+        self.assertTrue( wl.getLowLogL() == ( -4.0, 4 ) )
+        assertAAE( wl.getParameterEvolution( 1 ), allpars[1] + numpy.arange( 5 ) )
+
+        wl.copy( 1, 3 )
+        self.assertTrue( wl[3].id == 3 )
+        self.assertTrue( wl[3].logL == -1.0 )
+        assertAAE( wl.allpars[3], wl.allpars[1] )
+        wl[3].allpars[0] = 10.0
+        self.assertTrue( wl[1].allpars[0] == allpars[0] + 1 )
+
+        old = wl[2]
+        wl[2] = wl[0].copy()
+        self.assertTrue( old.logL == -2.0 )
+        self.assertTrue( not numpy.shares_memory( old.allpars, wl.allpars ) )
+
+        wl.addWalkers( problem, 2, allpars, [0,1,2,-1] )
+        self.assertTrue( len( wl.logL ) == 7 )
+        self.assertTrue( wl[4].logL == -4.0 )
+        self.assertTrue( wl[6].id == 6 )
+
+        with self.assertRaises( ValueError ) :
+            wl[0].allpars = allpars[:3]
+
+        ## appending one by one grows the arrays geometrically
+        grown = 0
+        for k in range( 100 ) :
+            column = wl._columns["logL"]
+            wl.add( wl, k % 7 )
+            grown += wl._columns["logL"] is not column
+        self.assertTrue( len( wl.logL ) == 107 and grown <= 4 )
+        assertAAE( wl.logL[7:14], wl.logL[:7] )
+        assertAAE( wl.allpars[98:105], wl.allpars[:7] )
 
 
     def suite( cls ):
@@ -957,6 +957,70 @@ class TestErrorDistribution( unittest.TestCase ):
             print( "" )
 
 
+    def testLogLikelihoodBatch( self ):
+        print( "\n   Test logLikelihoodBatch\n" )
+        poly = PolynomialModel( 1 )
+
+        problem = ClassicProblem( model=poly, xdata=self.x, ydata=self.data )
+
+        edlist = [GaussErrorDistribution( ), LaplaceErrorDistribution( ),
+                  CauchyErrorDistribution( ), UniformErrorDistribution( ),
+                  ExponentialErrorDistribution( ),
+                  MixedErrorDistribution( GaussErrorDistribution( ),
+                                          UniformErrorDistribution( ) )]
+
+        numpy.random.seed( 3456 )
+        for wgt in [None, self.wgt] :
+            problem.weights = wgt
+            for ed in edlist :
+                nh = ed.nphypar
+                pmat = numpy.ones( ( 6, 2 + nh ), dtype=float )
+                pmat[:,:2] = [0.3,10.0] + numpy.random.randn( 6, 2 )
+                pmat[:,2:] += numpy.random.rand( 6, nh )
+                pmat[:,-1] *= 4
+
+                ncalls = ed.ncalls
+                logL = ed.logLikelihoodBatch( problem, pmat )
+                self.assertTrue( ed.ncalls == ncalls + 6 )
+                print( ed, fmt( logL, max=None ) )
+
+                for k in range( 6 ) :
+                    assertAAE( logL[k], ed.logLikelihood( problem, pmat[k] ) )
+
+        ped = PoissonErrorDistribution( )
+        problem = ClassicProblem( model=poly, xdata=self.x, ydata=self.data + 12 )
+        pmat = [[12.0,10.0],[11.0,9.0],[13.0,10.5]]
+        logL = ped.logLikelihoodBatch( problem, pmat )
+        print( ped, fmt( logL, max=None ) )
+        for k in range( 3 ) :
+            assertAAE( logL[k], ped.logLikelihood( problem, numpy.asarray( pmat[k] ) ) )
+
+    def testUpdateLogL( self ):
+        print( "\n   Test updateLogLmock\n" )
+        model = PolynomialModel( 1 )
+        model += GaussModel( )
+
+        problem = ClassicProblem( model=model, xdata=self.x, ydata=self.data )
+
+        edlist = [GaussErrorDistribution( ), LaplaceErrorDistribution( ),
+                  CauchyErrorDistribution( ), ExponentialErrorDistribution( )]
+
+        numpy.random.seed( 4567 )
+        for ed in edlist :
+            allpars = numpy.append( [0.3, 10.0, 1.0, 0.0, 1.0],
+                                    1.0 + numpy.random.rand( ed.nphypar ) )
+            mock = problem.result( allpars[:5] )
+            for k in range( len( allpars ) ) :
+                param = allpars.copy()
+                param[k] += 0.2
+                ncalls = ed.ncalls
+                logL, mtry = ed.updateLogLmock( problem, param, mock,
+                                                parval={ k : allpars[k] } )
+                self.assertTrue( ed.ncalls == ncalls + 1 )
+                assertAAE( mtry, problem.result( param[:5] ) )
+                assertAAE( logL, ed.logLikelihood( problem, param ) )
+                assertAAE( logL, ed.updateLogL( problem, param, parval={ k : allpars[k] } ) )
+
     @classmethod
     def suite( cls ):
         return unittest.TestCase.suite( ErrorDistributionTest.__class__ )
@@ -126,6 +126,23 @@ class TestFitter( unittest.TestCase ):
         print( "error = ", error1 )
 
     #  **************************************************************
+    def testKeepStdevs( self ):
+        print( "\n   Fitter Test keep stdevs \n" )
+        x = numpy.linspace( 0, 10, 21 )
+        y = 1.0 + 0.3 * x + 0.2 * numpy.sin( 3 * x )
+
+        ## the number of fitted parameters excludes the kept ones
+        fitter = Fitter( x, PolynomialModel( 2 ) )
+        par = fitter.fit( y, keep={2:0.0} )
+        self.assertTrue( fitter.npfit == 2 )
+
+        line = Fitter( x, PolynomialModel( 1 ) )
+        assertAAE( par[:2], line.fit( y ) )
+        assertAAE( fitter.scale, line.scale )
+        print( fitter.stdevs, fitter.getEvidence( limits=[-10,10] ) )
+        assertAAE( fitter.stdevs, [0.08796869, 0.04076697, 0.00393588] )
+        assertAAE( fitter.getEvidence( limits=[-10,10] ), -13.651083576 )
+
     def testNormalize( self, plot=False ):
         """
         test normalized parameter, alternative for keepfixed.
@@ -166,6 +183,130 @@ class TestFitter( unittest.TestCase ):
 
 #        assertAAE( std, ast )
 
+    def testDesignCache( self ):
+        print( "\n   Fitter Test 3 Design Cache  \n" )
+        numpy.random.seed( 3456 )
+        x = numpy.linspace( 0.0, 10.0, 101 )
+        model = PolynomialModel( 2 )
+        model += HarmonicModel( 1, period=5 )
+        fitter = Fitter( x, model )
+
+        self.assertTrue( fitter.designSignature() is not None )
+        for k in range( 3 ) :
+            y = 1.0 + 0.5 * x - 0.2 * x * x + numpy.random.randn( 101 ) * 0.1
+            par = fitter.fit( y )
+            design = fitter.designCache
+            hessian = fitter.hessian
+            assertAAE( par, Fitter( x, model.copy() ).fit( y ) )
+            if k > 0 :
+                self.assertTrue( design is prevdesign )
+                self.assertTrue( numpy.array_equal( hessian, prevhessian ) )
+                self.assertTrue( fitter.factorized[0] is prevfactor )
+            prevdesign = design
+            prevhessian = hessian
+            prevfactor = fitter.factorized[0]
+
+        w = numpy.ones( 101, dtype=float ) * 2
+        par = fitter.fit( y, weights=w )
+        self.assertTrue( fitter.designCache is design )
+        assertAAE( par, Fitter( x, model.copy() ).fit( y, weights=w ) )
+
+        ## moving the knots of a splines model invalidates the cache
+        sm = SplinesModel( knots=[0.0, 3.0, 7.0, 10.0] )
+        fitter = Fitter( x, sm )
+        par = fitter.fit( y )
+        design = fitter.designCache
+        sm.knots = [0.0, 4.0, 6.0, 10.0]
+        par = fitter.fit( y )
+        self.assertFalse( fitter.designCache is design )
+        assertAAE( par, Fitter( x, sm.copy() ).fit( y ) )
+
+        ## nonlinear models are not cached
+        sm = GaussModel( ) + PolynomialModel( 1 )
+        fitter = Fitter( x, sm )
+        self.assertTrue( fitter.designSignature() is None )
+        par = fitter.fit( y )
+        self.assertTrue( fitter.designCache is None )
+
+    def testFitMany( self ):
+        print( "\n   Fitter Test FitMany  \n" )
+        numpy.random.seed( 4567 )
+        x = numpy.linspace( 0.0, 10.0, 31 )
+        model = PolynomialModel( 2 )
+        fitter = Fitter( x, model )
+        ydata = numpy.zeros( ( 31, 5 ), dtype=float )
+        for k in range( 5 ) :
+            ydata[:,k] = 1.0 + 0.5 * k * x - 0.02 * x * x + numpy.random.randn( 31 ) * 0.3
+        wmat = numpy.random.rand( 31, 5 ) + 0.5
+
+        for weights in [None, wmat[:,0], wmat] :
+            params, chisq, stdevs = fitter.fitMany( ydata, weights=weights )
+            self.assertTrue( params.shape == ( 3, 5 ) )
+            self.assertTrue( stdevs.shape == ( 3, 5 ) )
+            for k in range( 5 ) :
+                w = None if weights is None else weights if weights.ndim == 1 else weights[:,k]
+                alt = Fitter( x, model.copy() )
+                par = alt.fit( ydata[:,k], weights=w )
+                assertAAE( params[:,k], par )
+                assertAAE( chisq[k], alt.chisq )
+                var = alt.makeVariance()
+                std = numpy.sqrt( alt.getInverseHessian( weights=w ).diagonal() * var )
+                assertAAE( stdevs[:,k], std )
+
+        params, chisq, stdevs = fitter.fitMany( ydata, keep={2:-0.02} )
+        assertAAE( params[2,:], -0.02 )
+        self.assertTrue( numpy.all( stdevs[2,:] == 0 ) )
+        alt = Fitter( x, model.copy() )
+        assertAAE( params[:,3], alt.fit( ydata[:,3], keep={2:-0.02} ) )
+
+        ## after a plain fit; neither the model nor the fitter changes
+        fitter = Fitter( x, model )
+        par = fitter.fit( ydata[:,0] )
+        params, chisq, stdevs = fitter.fitMany( ydata, keep={2:-0.02} )
+        assertAAE( params[:,3], alt.fit( ydata[:,3], keep={2:-0.02} ) )
+        self.assertTrue( numpy.array_equal( model.parameters, par ) )
+        self.assertTrue( fitter.npfit == 3 and alt.npfit == 2 )
+        var = alt.makeVariance()
+        std = numpy.sqrt( alt.getInverseHessian( index=[0,1] ).diagonal() * var )
+        assertAAE( stdevs[:2,3], std )
+        assertAAE( fitter.fit( ydata[:,0] ), par )
+
+        self.assertRaises( ValueError, fitter.fitMany, ydata[:,0] )
+
+    def testBandedDesign( self ):
+        print( "\n   Fitter Test Banded Design  \n" )
+        numpy.random.seed( 5678 )
+        x = numpy.linspace( 0.0, 10.0, 201 )
+        y = numpy.sin( x ) + numpy.random.randn( 201 ) * 0.1
+        w = numpy.random.rand( 201 ) + 0.5
+
+        model = BSplinesModel( nrknots=11, min=0.0, max=10.0 )
+        fitter = Fitter( x, model )
+        first, band = fitter.getBandedDesign()
+        self.assertTrue( band.shape == ( 201, 4 ) )
+        design = model.partial( x, model.parameters )
+        dense = numpy.zeros_like( design )
+        for k in range( 4 ) :
+            dense[numpy.arange( 201 ),first+k] = band[:,k]
+        assertAAE( dense, design )
+
+        ## compare with the dense path through a compound model
+        alt = BSplinesModel( nrknots=11, min=0.0, max=10.0 ) + ConstantModel()
+        altfit = Fitter( x, alt )
+        self.assertTrue( altfit.getBandedDesign() is None )
+        for wgt in [None, w] :
+            par = fitter.fit( y, weights=wgt )
+            assertAAE( par, altfit.fit( y, weights=wgt ) )
+            assertAAE( fitter.chisq, altfit.chisq )
+            assertAAE( fitter.hessian, numpy.inner( design.T, design.T ) )
+            assertAAE( fitter.stdevs, altfit.stdevs )
+            assertAAE( model.result( x ), alt.result( x ) )
+
+        ## not all parameters fitted: the dense path
+        self.assertTrue( fitter.getBandedDesign( index=[0,1,2] ) is None )
+        par = fitter.fit( y, keep={0:0.0} )
+        self.assertTrue( par[0] == 0 )
+
 if __name__ == '__main__':
     unittest.main( )
 
@@ -9,6 +9,8 @@ import warnings
 
 from BayesicFitting import PolySurfaceModel
 from BayesicFitting import ImageAssistant
+from BayesicFitting import Kernel2dModel
+from BayesicFitting import Fitter
 
 __author__ = "Do Kester"
 __year__ = 2017
@@ -107,6 +109,53 @@ class TestImageAssistant( unittest.TestCase ):
         print( ymap1 )
         assertAAE( ymap1, ymap + 1 )
 
+    def testIndices( self ):
+        print( "====ImageAssistant indices ===================" )
+        for shape in [(7,), (3,5), (2,3,4), (4,1,3)] :
+            ymap = numpy.zeros( shape, dtype=float )
+            for order in ['C', 'F'] :
+                ia = ImageAssistant( order=order )
+                xdata = ia.getIndices( ymap )
+                if len( shape ) == 1 :
+                    assertAAE( xdata, numpy.arange( 7 ) )
+                    continue
+                ## the pixels are in C order; the columns reversed for F
+                kdata = numpy.asarray( numpy.unravel_index( numpy.arange( ymap.size ), shape ) )
+                if order == 'F' :
+                    kdata = kdata[::-1]
+                self.assertTrue( xdata.dtype == int )
+                assertAAE( xdata, kdata.transpose() )
+
+                pos = ia.getPositions( ymap )
+                assertAAE( pos, xdata + 0.5 )
+
+                grid = ia.getGrid( ymap )
+                self.assertTrue( grid.shape == pos.shape )
+                self.assertTrue( len( grid ) == ymap.size )
+                for k in range( len( shape ) ) :
+                    assertAAE( grid[:,k], pos[:,k] )
+                assertAAE( numpy.asarray( grid ), pos )
+                assertAAE( ia.getGrid( ymap, center=False )[:,0], xdata[:,0] )
+
+    def testGridFit( self ):
+        print( "====ImageAssistant grid fit ===================" )
+        ymap = numpy.zeros( ( 12, 15 ), dtype=float )
+        ia = ImageAssistant()
+        pos = ia.getPositions( ymap )
+        grid = ia.getGrid( ymap )
+
+        models = [PolySurfaceModel( 2 ), Kernel2dModel( )]
+        for mdl in models :
+            par = numpy.linspace( 0.5, 1.5, mdl.npars )
+            if isinstance( mdl, Kernel2dModel ) :
+                par = [1.0, 7.0, 6.0, 3.0]
+            assertAAE( mdl.result( grid, par ), mdl.result( pos, par ) )
+            assertAAE( mdl.partial( grid, par ), mdl.partial( pos, par ) )
+
+        mdl = PolySurfaceModel( 2 )
+        y = mdl.result( pos, [1.0, 0.1, -0.2, 0.01, 0.02, -0.01] ) + 0.1 * numpy.sin( pos[:,0] )
+        assertAAE( Fitter( grid, mdl ).fit( y ), Fitter( pos, PolySurfaceModel( 2 ) ).fit( y ) )
+
     @classmethod
     def suite( cls ):
         return unittest.TestCase.suite( TestImageAssistant.__class__ )
@@ -271,7 +271,65 @@ class TestKepplers2ndLaw( unittest.TestCase ):
         print( "Numer ", fma( nv ) )
         assertAAE( dvdp, nv )
 
+    def test5( self ):
+        x  = numpy.linspace( 0, 100, 1001, dtype=float )
+        print( "******KEPPLERS LAW test 5***************" )
+        KL = Kepplers2ndLaw( )
+        p = [0.7, 2.0, 10.0, 0.3]
 
+        e = KL.eccentricAnomaly( x, p )
+        niter = KL.iter
+        M = KL.meanAnomaly( x, p )
+        assertAAE( e - p[0] * numpy.sin( e ), M, 12 )
+        assertAAE( KL.sinE, numpy.sin( e ), 12 )
+        assertAAE( KL.cosE, numpy.cos( e ), 12 )
+
+        ## same xdata and parameters: no iterations
+        self.assertTrue( KL.eccentricAnomaly( x, p ) is e )
+        self.assertTrue( KL.iter == 0 )
+
+        ## the cached anomalies can not be changed by the caller
+        for arr in [e, KL.sinE, KL.cosE] :
+            with self.assertRaises( ValueError ) :
+                arr[0] = 0.0
+
+        ## nearby parameters: warm start from the previous anomalies
+        q = [0.701, 3.0, 10.001, 0.301]
+        e1 = KL.eccentricAnomaly( x, q )
+        print( "iterations  ", niter, KL.iter )
+        self.assertTrue( KL.iter < niter )
+        assertAAE( e1, Kepplers2ndLaw( ).eccentricAnomaly( x, q ), 12 )
+
+        ## a copy of the xdata: no iterations either
+        e2 = KL.eccentricAnomaly( x.copy(), q )
+        self.assertTrue( KL.iter == 0 )
+        assertAAE( e1, e2, 12 )
+
+        ## xdata changed in place: solved again
+        xx = x.copy()
+        KL.eccentricAnomaly( xx, q )
+        xx += 0.7
+        e3 = KL.eccentricAnomaly( xx, q )
+        self.assertTrue( KL.iter > 0 )
+        assertAAE( e3, Kepplers2ndLaw( ).eccentricAnomaly( xx, q ), 12 )
+
+        ## xdata of another length: cold start
+        e4 = KL.eccentricAnomaly( x[1:], q )
+        self.assertTrue( KL.iter >= niter )
+        assertAAE( e4, e1[1:], 12 )
+
+        ## models share the anomalies between result, partial and derivative
+        for m, p in [( RadialVelocityModel( ), [0.3, 2.0, 7.0, 1.0, 0.5] ),
+                     ( StellarOrbitModel( ), [0.3, 2.0, 7.0, 1.0, 0.5, 0.2, 0.1] )] :
+            m.result( x, p )
+            m.partial( x, p )
+            self.assertTrue( m.keppler.iter == 0 )
+            m.derivative( x, p )
+            self.assertTrue( m.keppler.iter == 0 )
+            xx = x.copy()
+            m.result( xx, p )
+            xx += 0.7
+            assertAAE( m.result( xx, p ), type( m )( ).result( xx, p ), 12 )
 
     @classmethod
     def suite( cls ):
@@ -119,6 +119,33 @@ class TestKernel2dModel( unittest.TestCase ):
         assertAAE( m.result(x ), mc.result( x ) )
         self.assertTrue( isinstance( mc.kernel, Cosine ) )
 
+    def testKernel2dWindow( self ):
+        print( "*******************************************************" )
+        print( "*  Kernel2dModel Rotated Biweight in a window         *" )
+        print( "*******************************************************" )
+
+        numpy.random.seed( 2345 )
+        ia = ImageAssistant()
+        grid = ia.getGrid( numpy.zeros( ( 60, 80 ) ) )
+        pos = numpy.asarray( grid )
+        x = pos[numpy.random.permutation( len( pos ) )]
+        ps = [numpy.asarray( [1.0, 30.3, 20.7, 4.0] ),
+              numpy.asarray( [1.0, 30.3, 20.7, 4.0, 2.5] ),
+              numpy.asarray( [1.0, 30.3, 20.7, 6.0, 2.5, 0.6] )]
+
+        for shape in range( 1, 4 ) :
+            m = Kernel2dModel( kernel=Biweight(), shape=shape )
+            p = ps[shape-1]
+            index, xwin = m.getWindow( x, p )
+            self.assertTrue( len( index ) < len( x ) / 10 )
+            for xx in [x, pos, grid] :
+                xa = numpy.asarray( xx )
+                assertAAE( m.result( xx, p ), m.shape2d.result( xa, p ) )
+                assertAAE( m.partial( xx, p ), m.shape2d.partial( xa, p ) )
+            self.assertTrue( numpy.sum( m.result( x, p ) > 0 ) > 10 )
+
+        m = Kernel2dModel( kernel=Gauss() )
+        self.assertTrue( m.getWindow( x, ps[0] ) is None )
 
     @classmethod
     def suite( cls ):
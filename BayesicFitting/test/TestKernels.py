@@ -61,6 +61,38 @@ class TestKernels( unittest.TestCase ):
             self.stdKerneltest( kernel, plot=plot )
             self.assertTrue( kernel.isBound() or ( kernl in kernels[:3] ) )
 
+    def testKernelWindow( self ) :
+        numpy.random.seed( 1234 )
+        x = numpy.random.rand( 1000 ) * 100
+        p = numpy.asarray( [1.2, 40.0, 0.7] )
+        u = ( x - p[1] ) / p[2]
+        for kernel in [Biweight(), Tophat( nconv=3 ), Uniform(), Gauss()] :
+            model = KernelModel( kernel=kernel )
+            win = model.getWindow( x, p )
+            self.assertTrue( ( win is None ) == ( not kernel.isBound() ) )
+            for xx in [x, numpy.sort( x )] :
+                uu = ( xx - p[1] ) / p[2]
+                self.assertTrue( numpy.array_equal( model.result( xx, p ),
+                                 p[0] * kernel.result( uu ) ) )
+                self.assertTrue( numpy.array_equal( model.derivative( xx, p ),
+                                 p[0] * kernel.partial( uu ) / p[2] ) )
+                part = model.partial( xx, p )
+                self.assertTrue( numpy.array_equal( part[:,0], kernel.result( uu ) ) )
+                self.assertTrue( numpy.array_equal( part[:,2],
+                                 -p[0] * kernel.partial( uu ) * uu / p[2] ) )
+            if win is not None :
+                self.assertTrue( model.getWindow( x, p ) is not None )
+                self.assertTrue( numpy.all( numpy.abs( u[win] ) <= kernel.range * 1.001 ) )
+
+        ## xdata changed in place are sorted again
+        model = KernelModel( kernel=Biweight() )
+        p = numpy.asarray( [1.0, 0.0, 1.0] )
+        x = numpy.asarray( [4, -3, 0.5, 2, -0.2, 5], dtype=float )
+        self.assertTrue( numpy.array_equal( model.result( x, p ), Biweight().result( x ) ) )
+        x[:] = [0.1, 0.3, -4, -0.4, 3, 0]
+        self.assertTrue( numpy.array_equal( model.result( x, p ), Biweight().result( x ) ) )
+        self.assertTrue( numpy.allclose( model.result( x, p ), [0.98, 0.83, 0, 0.71, 0, 1], atol=0.01 ) )
+
     def plotTHC( self ) :
         self.testTHC( plot=True )
 
@@ -2,6 +2,7 @@
 
 import unittest
 import numpy as numpy
+from numpy.testing import assert_array_almost_equal as assertAAE
 from astropy import units
 import matplotlib.pyplot as plt
 import warnings
@@ -320,6 +321,49 @@ class TestModels( unittest.TestCase ):
 
         stdModeltest( m, p, plot=plot )
 
+    def testHarmonicRecurrence( self ):
+        print( "******HARMONIC RECURRENCE***********" )
+        x = numpy.linspace( -50, 50, 1001 )
+        tpx = 2 * numpy.pi * x / 0.7
+        for reseed in [1, 7, 20, 100] :
+            m = HarmonicModel( 60, period=0.7, reseed=reseed )
+            p = numpy.arange( 120, dtype=float ) / 120
+            part = m.partial( x, p )
+            for j in [1, 2, 13, 59, 60] :
+                assertAAE( part[:,2*j-2], numpy.cos( j * tpx ), 9 )
+                assertAAE( part[:,2*j-1], numpy.sin( j * tpx ), 9 )
+
+            ## the basis is shared by result, partial and derivative
+            basis = m.basis( x )
+            self.assertTrue( m.basis( x )[0] is basis[0] )
+            assertAAE( m.result( x, p ), numpy.dot( part, p ) )
+            self.assertTrue( m.basis( x )[0] is basis[0] )
+            self.assertTrue( m.basis( x.copy() )[0] is basis[0] )
+
+            ## xdata changed in place get a new basis
+            xx = x.copy()
+            m.basis( xx )
+            xx *= 2
+            assertAAE( m.partial( xx, p )[:,0], numpy.cos( 2 * tpx ), 9 )
+            xx += 0.3
+            assertAAE( m.partial( xx, p )[:,1], numpy.sin( 2 * tpx + 2 * numpy.pi * 0.3 / 0.7 ), 9 )
+            self.assertFalse( m.basis( x )[0].flags.writeable )
+
+        m = SineModel( )
+        p = [1.3, -1.1, 0.5]
+        res = m.result( x, p )
+        trig = m._trig
+        self.assertTrue( m.partial( x, p ) is not None and m._trig is trig )
+        assertAAE( res, p[1] * numpy.cos( tpx * 0.7 * p[0] ) +
+                        p[2] * numpy.sin( tpx * 0.7 * p[0] ) )
+        m.derivative( x, [1.2, -1.1, 0.5] )
+        self.assertFalse( m._trig is trig )
+        xx = x.copy()
+        m.result( xx, p )
+        xx += 0.3
+        assertAAE( m.result( xx, p ), p[1] * numpy.cos( 2 * numpy.pi * xx * p[0] ) +
+                                      p[2] * numpy.sin( 2 * numpy.pi * xx * p[0] ) )
+
     def testPolynomialModel( self, plot=False ):
         x  = numpy.asarray( [-1.0, -0.8, -0.6, -0.4, -0.2, 0.0, 0.2, 0.4, 0.6, 0.8, 1.0] )
         print( "******POLYNOMIAL**********************" )
@@ -329,6 +373,42 @@ class TestModels( unittest.TestCase ):
         p = numpy.asarray( [1,-2,3,-2], dtype=float )
         stdModeltest( m, p, plot=plot )
 
+    def testResultChange( self ):
+        print( "******RESULT CHANGE*******************" )
+        x = numpy.linspace( 0.0, 10.0, 21 )
+        old = numpy.asarray( [1.0, 0.5, -0.3, 0.2], dtype=float )
+        new = old.copy()
+        new[[1,3]] = [0.8, -0.1]
+
+        ## the partials are kept for the same xdata object
+        m = HarmonicModel( 2, period=3.0 )
+        delta = m.resultChange( x, old, new, [1,3] )
+        assertAAE( delta, m.result( x, new ) - m.result( x, old ) )
+        partial = m._partialCache["partial"]
+        m.resultChange( x, old, new, [1,3] )
+        self.assertTrue( m._partialCache["partial"] is partial )
+
+        ## and renewed for other xdata or after clearPartialCache
+        x2 = 2 * x
+        delta = m.resultChange( x2, old, new, [1,3] )
+        assertAAE( delta, m.result( x2, new ) - m.result( x2, old ) )
+        m.period = 4.0
+        m.clearPartialCache()
+        delta = m.resultChange( x2, old, new, [1,3] )
+        assertAAE( delta, m.result( x2, new ) - m.result( x2, old ) )
+
+        m = PolynomialModel( 3 )
+        m += HarmonicModel( 2, period=3.0 )
+        old = numpy.append( old, old )
+        new = old.copy()
+        new[[1,6]] = [0.8, -0.1]
+        for k in range( 3 ) :
+            res = m.updateResult( x, m.result( x, old ), new, {1 : old[1], 6 : old[6]} )
+            assertAAE( res, m.result( x, new ) )
+            x *= 2
+            m.clearPartialCache()
+            self.assertTrue( m._partialCache is None and m._next._partialCache is None )
+
     def testFixedPolynomialModel( self, plot=False ):
         x  = numpy.asarray( [-1.0, -0.8, -0.6, -0.4, -0.2, 0.0, 0.2, 0.4, 0.6, 0.8, 1.0] )
         print( "******POLYNOMIAL FIXED****************" )
@@ -493,6 +573,39 @@ class TestModels( unittest.TestCase ):
         print( m1.npchain, p )
         stdModeltest( m1, p, plot=plot )
 
+    def testBSplinesCollocation( self ):
+        print( "******B-SPLINES COLLOCATION*************" )
+        numpy.random.seed( 2345 )
+        knots = numpy.asarray( [0.0, 1.0, 2.5, 3.0, 7.0, 10.0] )
+        x = numpy.append( numpy.random.rand( 200 ) * 10, knots )
+        m = BSplinesModel( knots=knots, order=3 )
+        bsp = m._bspline
+
+        cm = bsp.collmat( x )
+        self.assertTrue( cm.shape == ( 206, 8 ) )
+        assertAAE( numpy.sum( cm, axis=1 ), 1.0 )
+        dm = bsp.collmat( x, deriv_order=1 )
+        d2m = bsp.collmat( x, deriv_order=2 )
+        d1 = bsp.diff( 1 )
+        d2 = bsp.diff( 2 )
+        for k in range( 0, 200, 20 ) :
+            assertAAE( dm[k], d1( x[k] ) )
+            assertAAE( d2m[k], d2( x[k] ) )
+        self.assertTrue( numpy.all( bsp.collmat( x, deriv_order=4 ) == 0 ) )
+
+        p = numpy.random.rand( 8 )
+        assertAAE( m.baseResult( x, p ), numpy.inner( p, cm ) )
+        assertAAE( m.baseDerivative( x[:200], p ), numpy.inner( p, dm[:200] ) )
+
+        ## the cache is bounded and follows changes in the xdata
+        self.assertTrue( bsp.collmat( x ) is cm )
+        self.assertFalse( cm.flags.writeable )
+        x[0] = 5.0
+        self.assertFalse( bsp.collmat( x ) is cm )
+        for k in range( 10 ) :
+            bsp.collmat( x * k / 10 )
+        self.assertTrue( len( bsp.cache.entries ) == bsp.cache.size )
+
     def testSplinesModel( self, plot=False ):
         x  = numpy.asarray( [-1.0, -0.8, -0.6, -0.4, -0.2, 0.0, 0.2, 0.4, 0.6, 0.8, 1.0] )
         print( "******SPLINES*************************" )
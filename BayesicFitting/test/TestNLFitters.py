@@ -139,6 +139,40 @@ class TestNLFitters( unittest.TestCase ):
     def testTrustNcgFitter( self, plot=False ):
         stdFittertest( TrustNcgFitter, 201, plot=plot )
 
+    def testLandscape( self ):
+        print( "\n   Landscape cache test\n" )
+        x = numpy.linspace( -5, 5, 51 )
+        m = GaussModel( )
+        y = m.result( x, [1.0, 0.5, 1.2] ) + 0.1 * numpy.sin( 7 * x )
+        par = numpy.asarray( [1.2, 0.3, 1.0] )
+
+        for errdis in [None, "gauss"] :
+            fitter = BfgsFitter( x, GaussModel( ), errdis=errdis, scale=0.5 )
+            func, dfunc, hess = fitter.makeFuncs( y, index=[0,1,2] )
+            ls = fitter.landscape
+
+            ## count the model calls in the landscape
+            calls = [0]
+            def counted( xdata, param ) :
+                calls[0] += 1
+                return GaussModel.result( fitter.model, xdata, param )
+            object.__setattr__( fitter.model, "result", counted )
+
+            fg = ls.funcAndGrad( par )
+            self.assertTrue( calls[0] == 1 )
+            self.assertTrue( fg[0] == func( par ) )
+            assertAAE( fg[1], dfunc( par ) )
+            self.assertTrue( calls[0] == 1 )
+            if errdis is None :
+                assertAAE( hess( par ), fitter.getHessian( params=par ) )
+
+            func( par + 0.1 )
+            self.assertTrue( calls[0] == 2 )
+
+        fitter = BfgsFitter( x, GaussModel( ) )
+        pars = fitter.fit( y )
+        assertAAE( pars, CurveFitter( x, GaussModel( ) ).fit( y ), 4 )
+
     def plotall( self ):
         self.testAmoebaFitter( plot=True )
         self.testNelderMeadFitter( plot=True )
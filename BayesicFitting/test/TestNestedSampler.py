@@ -3,6 +3,9 @@
 
 import unittest
 import time
+import json
+import os
+import tempfile
 import numpy as numpy
 from astropy import units
 import math
@@ -128,6 +131,245 @@ class TestNestedSampler( unittest.TestCase ):
 
 #        print( "Elapsed ", endt - start )
 
+    def test1a( self, plot=False ):
+        print( "=========== Nested Sampler test 1a ======================" )
+
+        pp, y0, x, y, w = self.makeData( n=1 )
+
+        gm = GaussModel( )
+
+        lolim = numpy.asarray( [-10,-10,  0], dtype=float )
+        hilim = numpy.asarray( [ 10, 10, 10], dtype=float )
+
+        gm.setLimits( lolim, hilim )
+
+        ns = NestedSampler( x, gm, y, w, processes=2, discard=4,
+                            engines=["galilean", "gibbs"] )
+
+        self.dofit( ns, pp, plot=plot )
+
+        for eng in ns.engines :
+            self.assertTrue( eng.report[Engine.SUCCESS] > 0 )
+        self.assertTrue( ns.distribution.ncalls > ns.ensemble )
+
+    def testProfile( self ):
+        print( "=========== Nested Sampler test profile ================" )
+
+        pp, y0, x, y, w = self.makeData( n=1 )
+        gm = GaussModel( )
+        gm.addModel( PolynomialModel( 0 ) )
+        gm.setLimits( [-10,-10, 0,-10], [10, 10, 10, 10] )
+
+        ns = NestedSampler( x, gm, y, ensemble=20, seed=1234, verbose=0,
+                            engines=["galilean", "gibbs"] )
+        evi = ns.sample( )
+        self.assertTrue( ns.profiler is None )
+
+        gm = GaussModel( )
+        gm.addModel( PolynomialModel( 0 ) )
+        gm.setLimits( [-10,-10, 0,-10], [10, 10, 10, 10] )
+        ns2 = NestedSampler( x, gm, y, ensemble=20, seed=1234, verbose=0,
+                             engines=["galilean", "gibbs"], profile=Profiler( window=50 ) )
+        self.assertTrue( ns2.sample( ) == evi )
+        self.assertTrue( Model.profiler is None )
+
+        rep = json.loads( ns2.profiler.toJson( ) )
+        print( ns2.profiler.toJson( ) )
+        ns2.profiler.printReport( )
+
+        summ = rep["summary"]
+        self.assertTrue( set( rep["engines"].keys() ) ==
+                         {"GalileanEngine", "GibbsEngine", "StartEngine"} )
+        for name in ["logLikelihood", "partialLogL", "updateLogLmock"] :
+            self.assertTrue( rep["likelihood"][name]["calls"] > 0 )
+        self.assertTrue( set( rep["models"]["result"].keys() ) == {"Gauss", "Polynomial"} )
+        self.assertTrue( rep["models"]["partial"]["Gauss"]["calls"] > 0 )
+        self.assertTrue( 0 < summ["likelihood"] < summ["engines"] < summ["wall"] )
+        self.assertTrue( summ["engineOverhead"] > 0 )
+
+        windows = rep["windows"]
+        self.assertTrue( windows[0]["begin"] == 0 and windows[0]["end"] == 50 )
+        self.assertTrue( windows[-1]["end"] == ns2.iteration )
+        succ = sum( wnd["engines"]["GibbsEngine"]["success"] for wnd in windows )
+        self.assertTrue( succ == ns2.engines[1].report[Engine.SUCCESS] )
+        for wnd in windows :
+            self.assertTrue( 0 <= wnd["engines"]["GalileanEngine"]["acceptance"] <= 1 )
+
+    def testStream( self ):
+        print( "=========== Nested Sampler test stream =================" )
+
+        pp, y0, x, y, w = self.makeData( n=1 )
+
+        def makeSampler( stream=None ) :
+            gm = GaussModel( )
+            gm.setLimits( [-10,-10, 0], [10, 10, 10] )
+            return NestedSampler( x, gm, y, ensemble=20, seed=4321, verbose=0,
+                    distribution="gauss", limits=[0.01, 10], stream=stream )
+
+        ref = makeSampler( )
+        evi = ref.sample( )
+
+        tmpdir = tempfile.TemporaryDirectory( )
+        self.addCleanup( tmpdir.cleanup )
+        filename = os.path.join( tmpdir.name, "stream.bfs" )
+        ns = makeSampler( stream=SampleFile( filename, chunk=50 ) )
+        self.assertTrue( ns.sample( ) == evi )
+        self.assertTrue( ns.stream.count == len( ref.samples ) )
+        self.assertTrue( len( ns.samples ) == len( ref.samples ) )
+        for name in ["id", "parent", "start", "logL", "logW", "parameters"] :
+            self.assertTrue( numpy.array_equal( ns.samples.getColumn( name ),
+                                                ref.samples.getColumn( name ) ) )
+        assertAAE( ns.samples.getScaleEvolution(), ref.samples.getScaleEvolution() )
+        assertAAE( ns.samples.parameters, ref.samples.parameters )
+        assertAAE( ns.samples.average( x ), ref.samples.average( x ) )
+
+        with self.assertRaises( ValueError ) :
+            NestedSampler( x, GaussModel( ), y, stream=filename, maxsize=100 )
+
+    def testRestart( self ):
+        print( "=========== Nested Sampler test restart ================" )
+
+        pp, y0, x, y, w = self.makeData( n=1 )
+
+        def makeSampler( restart=None, maxsize=None ) :
+            gm = GaussModel( )
+            gm.setLimits( [-10,-10, 0], [10, 10, 10] )
+            return NestedSampler( x, gm, y, ensemble=20, seed=4321, verbose=0,
+                    distribution="gauss", limits=[0.01, 10], maxsize=maxsize,
+                    engines=["galilean", "gibbs", "chord"], restart=restart )
+
+        class Killed( Exception ) :
+            pass
+
+        class KilledStopStart( StopStart ) :
+            def checkpoint( self, ns, logWidth ) :
+                super( ).checkpoint( ns, logWidth )
+                if ns.iteration == 200 :
+                    raise Killed( )
+
+        tmpdir = tempfile.TemporaryDirectory( )
+        self.addCleanup( tmpdir.cleanup )
+        for maxsize in [None, 150] :
+            ref = makeSampler( maxsize=maxsize )
+            evi = ref.sample( )
+
+            filename = os.path.join( tmpdir.name, "restart%s" % maxsize )
+            ns = makeSampler( restart=KilledStopStart( filename, every=50 ), maxsize=maxsize )
+            with self.assertRaises( Killed ) :
+                ns.sample( )
+            self.assertTrue( os.path.exists( filename + ".npz" ) )
+            self.assertTrue( os.path.exists( filename + ".samples" ) )
+
+            ## a checkpoint of another problem is not resumed
+            pm = PolynomialModel( 1 )
+            pm.setLimits( [-10,-10], [10, 10] )
+            other = makeSampler( restart=filename, maxsize=maxsize )
+            other.problem.ydata = y + 1
+            for other, differ in [( NestedSampler( x, pm, y, ensemble=20, restart=filename ),
+                                    "number of parameters, model differ" ),
+                                  ( other, "data differ" )] :
+                with self.assertRaises( ValueError ) as cm :
+                    other.sample( )
+                self.assertTrue( str( cm.exception ).endswith( differ ) )
+
+            ns = makeSampler( restart=filename, maxsize=maxsize )
+            self.assertTrue( ns.sample( ) == evi )
+            self.assertFalse( os.path.exists( filename + ".npz" ) )
+            self.assertFalse( os.path.exists( filename + ".samples" ) )
+            self.assertTrue( ns.iteration == ref.iteration )
+            self.assertTrue( len( ns.samples ) == len( ref.samples ) )
+            for name in ["id", "parent", "start", "logL", "logW", "parameters"] :
+                self.assertTrue( numpy.array_equal( ns.samples.getColumn( name ),
+                                                    ref.samples.getColumn( name ) ) )
+            assertAAE( ns.samples.getScaleEvolution(), ref.samples.getScaleEvolution() )
+            for eng, reng in zip( ns.engines, ref.engines ) :
+                self.assertTrue( eng.report == reng.report )
+            self.assertTrue( ns.distribution.ncalls == ref.distribution.ncalls )
+
+    def testCloseOnError( self ):
+        print( "=========== Nested Sampler test close on error =========" )
+        ## the explorer is closed and the global profiler is reset
+
+        pp, y0, x, y, w = self.makeData( n=1 )
+        gm = GaussModel( )
+        gm.setLimits( [-10,-10, 0], [10, 10, 10] )
+
+        class Killed( Exception ) :
+            pass
+
+        class KilledStopStart( StopStart ) :
+            def checkpoint( self, ns, logWidth ) :
+                raise Killed( )
+
+        explorers = []
+        close = Explorer.close
+        def trackClose( explorer ) :
+            explorers.append( explorer )
+            close( explorer )
+
+        tmpdir = tempfile.TemporaryDirectory( )
+        self.addCleanup( tmpdir.cleanup )
+        ns = NestedSampler( x, gm, y, ensemble=20, seed=4321, verbose=0, processes=2,
+                profile=True,
+                restart=KilledStopStart( os.path.join( tmpdir.name, "killed" ), every=10 ) )
+        Explorer.close = trackClose
+        try :
+            with self.assertRaises( Killed ) :
+                ns.sample( )
+        finally :
+            Explorer.close = close
+
+        self.assertTrue( len( explorers ) == 1 )
+        self.assertTrue( explorers[0].pool is None )
+        self.assertTrue( Model.profiler is None )
+
+    def testFindWorst( self ):
+        print( "=========== Nested Sampler test findWorst ==============" )
+
+        pp, y0, x, y, w = self.makeData( n=1 )
+        gm = GaussModel( )
+        gm.setLimits( [-10,-10, 0], [10, 10, 10] )
+        ns = NestedSampler( x, gm, y, seed=1234, ensemble=20, discard=5 )
+        fitIndex, allpars = ns.makeFitlist( )
+        ns.initWalkers( allpars, fitIndex )
+
+        logL = numpy.asarray( [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9, 3, 2, 3, 8, 4],
+                              dtype=float )
+        for k in range( ns.ensemble ) :
+            ns.walkers[k].logL = logL[k]
+
+        worst = ns.findWorst( )
+        print( worst, ns.lowLhood )
+        self.assertTrue( worst == [1, 3, 6, 16, 0] )
+        self.assertTrue( ns.lowLhood == 3.0 )
+
+        ns.discard = 1
+        self.assertTrue( ns.findWorst( ) == [1] )
+        self.assertTrue( ns.lowLhood == 1.0 )
+
+    def testLogLcheck( self ):
+        print( "=========== Nested Sampler test logLcheck ==============" )
+
+        pp, y0, x, y, w = self.makeData( n=1 )
+        gm = GaussModel( )
+        gm += PolynomialModel( 2 )
+        gm.setLimits( [-10,-10, 0,-10,-10,-10], [10, 10, 10, 10, 10, 10] )
+        ns = NestedSampler( x, gm, y, seed=1234, ensemble=20 )
+        fitIndex, allpars = ns.makeFitlist( )
+        ns.initWalkers( allpars, fitIndex )
+        explorer = Explorer( ns )
+
+        ## the engines that update the logL incrementally commit an exact one
+        walker = ns.walkers[0]
+        for engine in [RandomEngine( ns.walkers, ns.distribution, seed=123 ),
+                       GibbsEngine( ns.walkers, ns.distribution, seed=456 )] :
+            engine.calculateUnitRange()
+            self.assertTrue( engine.execute( walker.copy(), walker.logL - 1 ) > 0 )
+            explorer.logLcheck( walker )
+
+        walker.logL *= 1 + 1e-13
+        self.assertRaises( ValueError, explorer.logLcheck, walker )
+
     def test2( self, plot=False ):
         print( "=========== Nested Sampler test 2 ======================" )
 
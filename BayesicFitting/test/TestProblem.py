@@ -267,6 +267,48 @@ class TestProblem( unittest.TestCase ):
                 param[1] += 0.2
             print( "" )
 
+    def test2a( self ) :
+        print( "====test2a ErrorsInXandYProblem partials =================" )
+        x = numpy.asarray( [0,2,8,10,3],dtype=float )
+        y = numpy.asarray( [2,0,10,8,4],dtype=float )
+        w = numpy.asarray( [1,1,2,2,1],dtype=float )
+
+        model = PolynomialModel( 2 )
+        par = numpy.asarray( [0.1, 1.0, 0.02] + [1.0, 1.0, 9.0, 9.0, 3.5] )
+        problem = ErrorsInXandYProblem( model=model, xdata=x, ydata=y, weights=w )
+
+        ## the dense partials as constructed before
+        nx = 5
+        dense = numpy.zeros( ( 2*nx, 3+nx ), dtype=float )
+        dense[:nx,:3] = model.partial( par[3:], par[:3] )
+        dfdx = model.derivative( par[3:], par[:3] )
+        for k in range( nx ) :
+            dense[k,k+3] = dfdx[k]
+            dense[k+nx,k+3] = 1.0
+
+        part = problem.partial( par )
+        self.assertTrue( part.shape == dense.shape )
+        assertAAE( numpy.asarray( part ), dense )
+        for k in range( 3+nx ) :
+            assertAAE( part[:,k], dense[:,k] )
+
+        fi = [6,0,4,2]
+        res = numpy.arange( 2*nx, dtype=float ) - 3
+        assertAAE( res @ part[:,fi], res @ dense[:,fi] )
+        assertAAE( part[:,fi].gram( weights=w ),
+                   numpy.inner( dense[:,fi].T, dense[:,fi].T * numpy.append( w, w ) ) )
+
+        ged = GaussErrorDistribution( )
+        param = numpy.append( par, [0.7] )
+        fitIndex = numpy.arange( 3+nx+1 )
+        dL = ged.partialLogL( problem, param, fitIndex )
+        nL = ged.numPartialLogL( problem, param, fitIndex )
+        assertAAE( dL, nL, 5 )
+
+        hes = ged.hessianLogL( problem, param, fitIndex )
+        self.assertTrue( hes.shape == ( 3+nx+1, 3+nx+1 ) )
+        assertAAE( hes[:-1,:-1], numpy.inner( dense.T, dense.T * numpy.append( w, w ) ) / 0.49 )
+
     def test3( self, plot=False ) :
         print( "====test3 ErrorsInXandYProblem============================" )
 
@@ -147,6 +147,51 @@ class TestQRFitter( unittest.TestCase ):
         print( "error = ", error1 )
 
 
+    def testFitMany( self ):
+        print( "\n   QRFitter Test FitMany  \n" )
+        numpy.random.seed( 4567 )
+        x = numpy.linspace( 0.0, 10.0, 31 )
+        model = PolynomialModel( 2 )
+        fitter = QRFitter( x, model )
+        ydata = numpy.zeros( ( 31, 5 ), dtype=float )
+        for k in range( 5 ) :
+            ydata[:,k] = 1.0 + 0.5 * k * x - 0.02 * x * x + numpy.random.randn( 31 ) * 0.3
+        wmat = numpy.random.rand( 31, 5 ) + 0.5
+
+        for weights in [None, wmat[:,0], wmat] :
+            params, chisq, stdevs = fitter.fitMany( ydata, weights=weights )
+            self.assertTrue( params.shape == ( 3, 5 ) )
+            self.assertTrue( stdevs.shape == ( 3, 5 ) )
+            for k in range( 5 ) :
+                w = None if weights is None else weights if weights.ndim == 1 else weights[:,k]
+                alt = QRFitter( x, model.copy() )
+                par = alt.fit( ydata[:,k], weights=w )
+                assertAAE( params[:,k], par )
+                assertAAE( chisq[k], alt.chisq )
+                var = alt.makeVariance()
+                std = numpy.sqrt( alt.getInverseHessian( weights=w ).diagonal() * var )
+                assertAAE( stdevs[:,k], std )
+
+        params, chisq, stdevs = fitter.fitMany( ydata, keep={2:-0.02} )
+        assertAAE( params[2,:], -0.02 )
+        self.assertTrue( numpy.all( stdevs[2,:] == 0 ) )
+        alt = QRFitter( x, model.copy() )
+        assertAAE( params[:,3], alt.fit( ydata[:,3], keep={2:-0.02} ) )
+
+        ## after a plain fit; neither the model nor the fitter changes
+        fitter = QRFitter( x, model )
+        par = fitter.fit( ydata[:,0] )
+        params, chisq, stdevs = fitter.fitMany( ydata, keep={2:-0.02} )
+        assertAAE( params[:,3], alt.fit( ydata[:,3], keep={2:-0.02} ) )
+        self.assertTrue( numpy.array_equal( model.parameters, par ) )
+        self.assertTrue( fitter.npfit == 3 and alt.npfit == 2 )
+        var = alt.makeVariance()
+        std = numpy.sqrt( alt.getInverseHessian( index=[0,1] ).diagonal() * var )
+        assertAAE( stdevs[:2,3], std )
+        assertAAE( fitter.fit( ydata[:,0] ), par )
+
+        self.assertRaises( ValueError, fitter.fitMany, ydata[:,0] )
+
 if __name__ == '__main__':
     unittest.main( )
 
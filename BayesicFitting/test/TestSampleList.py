@@ -6,6 +6,9 @@ import sys
 from numpy.testing import assert_array_almost_equal as assertAAE
 from astropy import units
 import math
+import os
+import tempfile
+import pickle
 
 from BayesicFitting import *
 from BayesicFitting import formatter as fmt
@@ -234,6 +237,157 @@ class TestSampleList( unittest.TestCase ):
         zz = numpy.arange( 20, dtype=float ) * 0.2
         assertAAE( sl.monteCarloError( zz ), numpy.zeros( 20, dtype=float ), 2 )
 
+    def testColumns( self ):
+        print( "=========  SampleList Columns Test  ===============" )
+        gm = GaussModel( )
+        sl = SampleList( gm, self.len )
+        for k, s in enumerate( sl ) :
+            s.parameters = self.par[:3] + self.x[k]
+            s.logL = -10.0 + k
+            s.logW = math.log( self.wgt[k] / 38.0 )
+
+        assertAAE( sl.getColumn( "parameters" )[:,1], self.par[1] + self.x )
+        self.assertTrue( sl[3].parameters.base is not None )
+        sl[3].parameters[0] = 10.0
+        self.assertTrue( sl.getParameterEvolution( 0 )[3] == 10.0 )
+        sl[3].parameters = self.par[:3] + self.x[3]
+
+        q = sl.getQuantiles( [0.0, 0.5, 1.0] )
+        print( q )
+        assertAAE( q[0], self.par[:3] - 1 )
+        assertAAE( q[1], self.par[:3] )
+        assertAAE( q[2], self.par[:3] + 1 )
+        self.assertTrue( sl.getQuantiles( 0.5, kpar=2 ) == 1.0 )
+        self.assertTrue( sl.medianIndex == 5 )
+
+        s0 = sl[0]
+        del sl[0]
+        self.assertTrue( s0.logL == -10.0 )
+        self.assertTrue( sl[0].logL == -9.0 )
+        s5 = sl.pop( 5 )
+        self.assertTrue( s5.logL == -4.0 )
+        self.assertTrue( sl[5].logL == -3.0 )
+        sl.remove( sl[-1] )
+        assertAAE( sl.getLogLikelihoodEvolution(), [-9,-8,-7,-6,-5,-3,-2,-1] )
+        assertAAE( sl.getGeneration(), [1,2,3,4,5,7,8,9] )
+
+        sl.insert( 0, s0 )
+        sl.append( s5 )
+        assertAAE( sl.getLogLikelihoodEvolution(), [-10,-9,-8,-7,-6,-5,-3,-2,-1,-4] )
+        for k, s in enumerate( sl ) :
+            self.assertTrue( s.logL == sl.getColumn( "logL" )[k] )
+
+        with self.assertRaises( ValueError ) :
+            sl[0].parameters = self.par
+
+    def testWeed( self ):
+        print( "=========  SampleList Weed Test  ==================" )
+        gm = GaussModel( )
+        sl = SampleList( gm, 0 )
+        rng = numpy.random.RandomState( 3456 )
+        logW = rng.standard_normal( 200 )
+        nfree = 0
+        for k in range( 200 ) :
+            s = Sample( k, -1, 0, gm )
+            s.logW = logW[k]
+            sl.add( s )
+            sl.weed( maxsize=20 )
+            self.assertTrue( len( sl ) == min( k + 1, 20 ) )
+            ## weeded rows are left free; the heap is pruned
+            self.assertTrue( len( sl._free ) <= sl.MINFREE + len( sl ) // 4 )
+            self.assertTrue( sl._heap is None or len( sl._heap ) <= 2 * len( sl ) + sl.MINFREE + 1 )
+            self.assertTrue( all( s.logW == logW[s.id] for s in sl ) )
+            nfree = max( nfree, len( sl._free ) )
+
+        self.assertTrue( nfree > 0 )
+
+        keep = numpy.sort( numpy.argsort( logW )[-20:] )
+        print( sl.getGeneration() )
+        assertAAE( sl.getGeneration(), keep )
+        assertAAE( sl.getLogWeightEvolution(), logW[keep] )
+
+        sl[0].logW = -10.0
+        sl.weed( maxsize=19 )
+        assertAAE( sl.getGeneration(), keep[1:] )
+
+    def testPickle( self ):
+        print( "=========  SampleList Pickle Test  ================" )
+        gm = GaussModel( )
+        sl = SampleList( gm, self.len )
+        for k, s in enumerate( sl ) :
+            s.parameters = self.par[:3] + self.x[k]
+            s.hyper = self.par[3:] + k
+            s.logL = -10.0 + k
+            s.logW = math.log( self.wgt[k] / 38.0 )
+        sl.weed( maxsize=self.len - 1 )
+        sl.logZ = 1.5
+
+        cp = pickle.loads( pickle.dumps( sl ) )
+        self.assertTrue( len( cp ) == len( sl ) )
+        self.assertTrue( cp.logZ == 1.5 and cp._count == sl._count )
+        for name in ["id", "parent", "start", "logL", "logW", "parameters"] :
+            self.assertTrue( numpy.array_equal( cp.getColumn( name ), sl.getColumn( name ) ) )
+        self.assertTrue( cp[2].logL == sl[2].logL )
+        assertAAE( cp.getScaleEvolution(), sl.getScaleEvolution() )
+        assertAAE( cp.average( self.x ), sl.average( self.x ) )
+
+        cp.append( cp[0].copy() )
+        self.assertTrue( len( cp ) == len( sl ) + 1 and len( sl ) == self.len - 1 )
+
+    def testSampleFile( self ):
+        print( "=========  SampleList SampleFile Test  =============" )
+        gm = GaussModel( )
+        sl = SampleList( gm, self.len )
+        for k, s in enumerate( sl ) :
+            s.parameters = self.par[:3] + self.x[k]
+            s.hyper = self.par[3:] + k
+            s.logL = -10.0 + k
+            s.logW = math.log( self.wgt[k] / 38.0 )
+        aver = sl.average( self.x )
+        logW = sl.getLogWeightEvolution()
+
+        other = sl[0].copy()
+        tmpdir = tempfile.TemporaryDirectory( )
+        self.addCleanup( tmpdir.cleanup )
+        sf = SampleFile( os.path.join( tmpdir.name, "samples.bfs" ) )
+        sf.write( sl )
+        self.assertTrue( len( sl ) == 0 )
+        self.assertTrue( sf.count == self.len )
+
+        lazy = sf.open( gm )
+        self.assertTrue( len( lazy ) == self.len )
+        assertAAE( lazy.getColumn( "parameters" )[:,1], self.par[1] + self.x )
+        assertAAE( lazy.getScaleEvolution()[:,0], self.par[3] + numpy.arange( self.len ) )
+        assertAAE( lazy.average( self.x ), aver )
+        self.assertTrue( lazy[3].logL == -7.0 )
+        self.assertTrue( lazy[-1].id == self.len - 1 )
+        assertAAE( lazy[4].allpars, numpy.append( self.par[:3] + self.x[4], self.par[3] + 4 ) )
+        assertAAE( [s.logL for s in lazy], numpy.arange( self.len ) - 10.0 )
+
+        ## the other list methods see the samples without filling the list
+        assertAAE( [s.logL for s in reversed( lazy )], numpy.arange( self.len )[::-1] - 10.0 )
+        self.assertTrue( lazy[0] in lazy and lazy[-1] in lazy )
+        self.assertFalse( other in lazy )
+        self.assertTrue( lazy.index( lazy[3] ) == 3 )
+        with self.assertRaises( ValueError ) :
+            lazy.index( lazy[3], 4 )
+        self.assertTrue( lazy.count( lazy[3] ) == 1 and lazy.count( other ) == 0 )
+        self.assertTrue( repr( lazy ).count( "Sample object" ) == self.len )
+        self.assertTrue( lazy._lazy is not None )
+
+        ## changes stay in memory
+        lazy[0].parameters[0] = 10.0
+        del lazy[1]
+        self.assertTrue( len( lazy ) == self.len - 1 )
+        self.assertTrue( lazy[1].logL == -8.0 )
+        self.assertTrue( lazy.index( lazy[1] ) == 1 and lazy[1] in lazy )
+        self.assertTrue( lazy[0].parameters[0] == 10.0 )
+        assertAAE( sf.open( gm ).getLogWeightEvolution(), logW )
+        assertAAE( sf.open( gm ).getColumn( "parameters" )[0], self.par[:3] + self.x[0] )
+
+        sf.truncate( 5 )
+        self.assertTrue( len( sf.open( gm ) ) == 5 )
+
     @classmethod
     def suite( cls ):
         return unittest.TestCase.suite( TestSampleList.__class__ )
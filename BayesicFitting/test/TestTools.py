@@ -3,6 +3,9 @@
 import unittest
 import numpy as numpy
 import math
+import os
+import sys
+import subprocess
 from datetime import date
 
 from BayesicFitting import *
@@ -179,6 +182,32 @@ class TestTools( unittest.TestCase ) :
         print( x, x.shape, x.__class__ )
         self.assertTrue( isinstance( x, numpy.ndarray ) and x.ndim == 2 )
 
+    def testImportTime( self ) :
+        print( "===== import time ============================" )
+        ## a headless fit must not load matplotlib or astropy
+        script = "\n".join( [
+            "import sys",
+            "def loaded( ) :",
+            "    return [m for m in sys.modules if m.split( '.' )[0] in ['matplotlib', 'astropy']]",
+            "import BayesicFitting",
+            "print( loaded( ) )",
+            "from BayesicFitting import GaussModel, PolynomialModel, Fitter, NestedSampler",
+            "x = BayesicFitting.Tools.toArray( [0.0, 1.0, 2.0, 3.0] )",
+            "Fitter( x, PolynomialModel( 1 ) ).fit( 2 * x + 1 )",
+            "print( loaded( ) )" ] )
+
+        pkgdir = os.path.dirname( os.path.dirname( os.path.abspath( sys.modules["BayesicFitting"].__file__ ) ) )
+        env = dict( os.environ, PYTHONPATH=pkgdir )
+        out = subprocess.run( [sys.executable, "-W", "ignore", "-c", script], env=env,
+                              capture_output=True, text=True, check=True ).stdout.split( "\n" )
+        print( "loaded after import : ", out[0] )
+        print( "loaded after fit    : ", out[1] )
+        self.assertTrue( out[0] == "[]" )
+        self.assertTrue( out[1] == "[]" )
+
+        print( GaussModel().getIntegralUnit() )
+        print( SineModel().getParameterUnit( 0 ) )
+
     @classmethod
     def suite( cls ):
         return ConfiguredTestCase.suite( PriorTest.__class__ )